@@ -0,0 +1,155 @@
+"""
+Compare bytes on the wire and end-to-end latency of WitsmlClient wrapper API calls with and
+without HTTP compression against a local bandwidth-throttled SOAP endpoint.
+
+    python benchmarks/bench_compression.py --rows 4000 --bandwidth 10
+"""
+
+import argparse
+import http.server
+import json
+import threading
+import time
+import zlib
+from xml.sax.saxutils import escape
+
+import pandas
+
+from jeng import generate, jeng, model, soap, transport
+
+SAMPLE_FILE_PATH = "tests/sample/NOPIMS_LAV02ST2_LWD_8.5_Depth.csv"
+LOG_BASIC_INFO = model.LogBasicInfoModel(
+    well_uid="WELL_001",
+    well_name="WELL 001",
+    wellbore_uid="WELLBORE_001",
+    wellbore_name="WELLBORE 001",
+    log_uid="LOG_001",
+    log_name="LOG 001",
+)
+
+
+def prepare_log_query(rows: int) -> str:
+    dataframe = pandas.read_csv(SAMPLE_FILE_PATH).dropna(axis=1, how="all").fillna(-999.25)
+    dataframe = pandas.concat([dataframe] * (rows // len(dataframe) + 1), ignore_index=True).head(rows)
+    log_curve_info_list = [
+        model.LogCurveInfoModel(
+            uid=column,
+            mnemonic=column,
+            unit="unitless",
+            curve_description=column,
+            type_log_data="double",
+            index_type="measured depth" if index == 0 else None,
+            is_index_curve=index == 0,
+        )
+        for index, column in enumerate(dataframe.columns)
+    ]
+    return generate.generate_log_query(
+        log_basic_info=LOG_BASIC_INFO,
+        log_curve_info_list=log_curve_info_list,
+        dataframe=dataframe,
+    )
+
+
+class ThrottledSoapHandler(http.server.BaseHTTPRequestHandler):
+    "SOAP endpoint that replies every GetFromStore with the same log and throttles bandwidth."
+
+    xml_out = ""
+    bandwidth = 0.0
+    is_response_compression = True
+    wire_byte_dict = {"in": 0, "out": 0}
+
+    def log_message(self, *args):
+        pass
+
+    def __throttle(self, size: int):
+        if self.bandwidth > 0:
+            time.sleep(size * 8 / (self.bandwidth * 1_000_000))
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.wire_byte_dict["in"] += len(body)
+        self.__throttle(len(body))
+        if self.headers.get("Content-Encoding") in [transport.COMPRESSION_GZIP, transport.COMPRESSION_DEFLATE]:
+            body = zlib.decompress(body, zlib.MAX_WBITS | 32)
+
+        action = self.headers.get("SOAPAction", "")
+        if "WMLS_GetBaseMsg" in action:
+            reply = "<Result>Function completed successfully</Result>"
+        elif "WMLS_GetFromStore" in action:
+            reply = f"<Result>1</Result><XMLout>{escape(self.xml_out)}</XMLout><SuppMsgOut></SuppMsgOut>"
+        else:
+            reply = "<Result>1</Result><SuppMsgOut></SuppMsgOut>"
+        content = (
+            '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/"><soap:Body>'
+            f"<ns1:Response xmlns:ns1='{soap.WITSML_MESSAGE_NAMESPACE}'>{reply}</ns1:Response>"
+            "</soap:Body></soap:Envelope>"
+        ).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/xml; charset=utf-8")
+        if self.is_response_compression and "gzip" in self.headers.get("Accept-Encoding", ""):
+            content = transport.compress(content, transport.COMPRESSION_GZIP, level=1)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wire_byte_dict["out"] += len(content)
+        self.__throttle(len(content))
+        self.wfile.write(content)
+
+
+def run_case(url: str, log_query: str, request_compression: str, repeat: int) -> dict:
+    client = jeng.WitsmlClient()
+    assert client.connect(url=url, username="", password="", is_raw=True, request_compression=request_compression)
+    ThrottledSoapHandler.wire_byte_dict.update({"in": 0, "out": 0})
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        client.add_to_store(wml_type_in="log", xml_in=log_query)
+    upload_latency = (time.perf_counter() - start) / repeat
+    upload_byte = ThrottledSoapHandler.wire_byte_dict["in"] / repeat
+
+    ThrottledSoapHandler.wire_byte_dict.update({"in": 0, "out": 0})
+    start = time.perf_counter()
+    for _ in range(repeat):
+        client.get_from_store(wml_type_in="log", xml_in=log_query, return_element="data-only")
+    download_latency = (time.perf_counter() - start) / repeat
+    download_byte = ThrottledSoapHandler.wire_byte_dict["out"] / repeat
+
+    return {
+        "upload_wire_bytes": int(upload_byte),
+        "upload_latency_s": round(upload_latency, 4),
+        "download_wire_bytes": int(download_byte),
+        "download_latency_s": round(download_latency, 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=4000, help="log rows in upload query and download reply")
+    parser.add_argument("--bandwidth", type=float, default=10.0, help="simulated link bandwidth in Mbit/s (0 = none)")
+    parser.add_argument("--repeat", type=int, default=5, help="calls per case")
+    args = parser.parse_args()
+
+    log_query = prepare_log_query(args.rows)
+    ThrottledSoapHandler.xml_out = log_query
+    ThrottledSoapHandler.bandwidth = args.bandwidth
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), ThrottledSoapHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    result_dict = {}
+    for name, request_compression, is_response_compression in [
+        ("none", None, False),
+        ("response_gzip", None, True),
+        ("request_gzip+response_gzip", transport.COMPRESSION_GZIP, True),
+        ("request_deflate+response_gzip", transport.COMPRESSION_DEFLATE, True),
+    ]:
+        ThrottledSoapHandler.is_response_compression = is_response_compression
+        result_dict[name] = run_case(url, log_query, request_compression, args.repeat)
+    server.shutdown()
+
+    print(json.dumps({"rows": args.rows, "bandwidth_mbit": args.bandwidth, "result": result_dict}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
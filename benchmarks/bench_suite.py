@@ -0,0 +1,146 @@
+"""
+Benchmark parse_log_into_dataframe, parse_log_into_curve_info and generate_log_query on
+synthetic logs scaled from the depth sample. Reports throughput and peak memory as JSON and
+optionally compares against a baseline result file.
+
+    python benchmarks/bench_suite.py --output result.json
+    python benchmarks/bench_suite.py --baseline result.json --tolerance 0.2
+
+Exit code is 1 when any case regresses beyond tolerance against the baseline.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import pandas
+import synthetic
+
+from jeng import generate, parse
+
+DEFAULT_ROW_LIST = [1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_CURVE_LIST = [5, 50, 200]
+
+
+def measure(function, repeat: int):
+    # best of repeat for time, separate traced run for peak memory
+    best_time = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+
+    gc.collect()
+    tracemalloc.start()
+    function()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best_time, peak_memory
+
+
+def run_case(rows: int, curves: int, repeat: int):
+    dataframe, log_curve_info_list, xml_out = synthetic.make_log(rows, curves)
+    case_list = [
+        (
+            "generate_log_query",
+            lambda: generate.generate_log_query(
+                log_basic_info=synthetic.LOG_BASIC_INFO,
+                log_curve_info_list=log_curve_info_list,
+                dataframe=dataframe,
+            ),
+        ),
+        ("parse_log_into_dataframe", lambda: parse.parse_log_into_dataframe(xml_out=xml_out)),
+        ("parse_log_into_curve_info", lambda: parse.parse_log_into_curve_info(xml_out=xml_out)),
+    ]
+    for benchmark, function in case_list:
+        seconds, peak_memory = measure(function, repeat)
+        yield {
+            "benchmark": benchmark,
+            "rows": rows,
+            "curves": curves,
+            "xml_bytes": len(xml_out),
+            "seconds": round(seconds, 6),
+            "rows_per_second": round(rows / seconds, 1) if seconds > 0 else None,
+            "mb_per_second": round(len(xml_out) / 1_000_000 / seconds, 3) if seconds > 0 else None,
+            "peak_memory_bytes": peak_memory,
+        }
+
+
+def compare(result_list, baseline_list, tolerance: float):
+    baseline_dict = {(item["benchmark"], item["rows"], item["curves"]): item for item in baseline_list}
+    regression_list = []
+    for item in result_list:
+        baseline = baseline_dict.get((item["benchmark"], item["rows"], item["curves"]))
+        if baseline is None:
+            continue
+        for key, is_higher_better in [("rows_per_second", True), ("peak_memory_bytes", False)]:
+            if not baseline[key] or item[key] is None:
+                continue
+            ratio = item[key] / baseline[key]
+            item[f"{key}_ratio"] = round(ratio, 3)
+            if (is_higher_better and ratio < 1 - tolerance) or (not is_higher_better and ratio > 1 + tolerance):
+                regression_list.append(
+                    f"{item['benchmark']} rows={item['rows']} curves={item['curves']} {key} x{ratio:.2f}"
+                )
+    return regression_list
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", default=",".join(map(str, DEFAULT_ROW_LIST)), help="comma separated row counts")
+    parser.add_argument("--curves", default=",".join(map(str, DEFAULT_CURVE_LIST)), help="comma separated curve counts")
+    parser.add_argument(
+        "--max-points",
+        type=int,
+        default=1_000_000,
+        help="skip cases with more than rows x curves data points (0 = no limit)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case (best is reported)")
+    parser.add_argument("--output", help="write JSON result to file")
+    parser.add_argument("--baseline", help="compare against a previous JSON result")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression")
+    args = parser.parse_args()
+
+    result_list = []
+    skipped_list = []
+    for rows in map(int, args.rows.split(",")):
+        for curves in map(int, args.curves.split(",")):
+            if args.max_points and rows * curves > args.max_points:
+                skipped_list.append({"rows": rows, "curves": curves})
+                continue
+            for item in run_case(rows, curves, args.repeat):
+                print(json.dumps(item), file=sys.stderr)
+                result_list.append(item)
+
+    regression_list = []
+    if args.baseline:
+        with open(args.baseline, "r") as baseline:
+            regression_list = compare(result_list, json.load(baseline)["results"], args.tolerance)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "pandas": pandas.__version__,
+            "platform": platform.platform(),
+            "max_points": args.max_points,
+        },
+        "results": result_list,
+        "skipped": skipped_list,
+        "regressions": regression_list,
+    }
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    return 1 if regression_list else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
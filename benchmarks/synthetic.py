@@ -0,0 +1,70 @@
+"""
+Synthetic depth log scaled from tests/sample/NOPIMS_LAV02ST2_LWD_8.5_Depth.csv, shared by the
+benchmark scripts.
+"""
+
+import typing
+
+import numpy
+import pandas
+
+from jeng import generate, model
+
+SAMPLE_FILE_PATH = "tests/sample/NOPIMS_LAV02ST2_LWD_8.5_Depth.csv"
+SAMPLE_NULL_VALUE = -999.25
+INDEX_MNEMONIC = "DEPT"
+LOG_BASIC_INFO = model.LogBasicInfoModel(
+    well_uid="WELL_001",
+    well_name="WELL 001",
+    wellbore_uid="WELLBORE_001",
+    wellbore_name="WELLBORE 001",
+    log_uid="LOG_001",
+    log_name="LOG 001",
+)
+
+
+def make_log_curve_info_list(mnemonic_list: typing.List[str]) -> typing.List[model.LogCurveInfoModel]:
+    return [
+        model.LogCurveInfoModel(
+            uid=mnemonic,
+            mnemonic=mnemonic,
+            unit="m" if mnemonic == INDEX_MNEMONIC else "unitless",
+            curve_description=mnemonic,
+            type_log_data="double",
+            index_type="measured depth" if mnemonic == INDEX_MNEMONIC else None,
+            is_index_curve=mnemonic == INDEX_MNEMONIC,
+        )
+        for mnemonic in mnemonic_list
+    ]
+
+
+def make_dataframe(rows: int, curves: int) -> pandas.DataFrame:
+    """
+    Tile sample rows (with increasing depth index) and cycle sample curves (with numbered
+    mnemonic) to the requested size. Curve count includes the index curve.
+    """
+    sample = pandas.read_csv(SAMPLE_FILE_PATH).dropna(axis=1, how="all").fillna(SAMPLE_NULL_VALUE)
+    value_column_list = [column for column in sample.columns if column != INDEX_MNEMONIC]
+    row_index = numpy.arange(rows) % len(sample)
+
+    column_dict = {INDEX_MNEMONIC: numpy.round(sample[INDEX_MNEMONIC].iloc[0] + numpy.arange(rows) * 0.1524, 4)}
+    for curve in range(curves - 1):
+        column = value_column_list[curve % len(value_column_list)]
+        mnemonic = column if curve < len(value_column_list) else f"{column}_{curve // len(value_column_list)}"
+        column_dict[mnemonic] = sample[column].to_numpy()[row_index]
+    return pandas.DataFrame(column_dict)
+
+
+def make_log(rows: int, curves: int):
+    """
+    Make synthetic log dataframe, curve info list and a full 'log' XML (header and data) as
+    replied by WMLS_GetFromStore with returnElements=all.
+    """
+    dataframe = make_dataframe(rows, curves)
+    log_curve_info_list = make_log_curve_info_list(dataframe.columns.tolist())
+    xml_out = generate.generate_log_query(
+        log_basic_info=LOG_BASIC_INFO,
+        log_curve_info_list=log_curve_info_list,
+        dataframe=dataframe,
+    )
+    return dataframe, log_curve_info_list, xml_out
@@ -16,6 +16,12 @@ setup(
     packages=find_packages("src"),
     package_dir={"": "src"},
     include_package_data=True,
+    entry_points={
+        "console_scripts": [
+            "jeng=jeng.bulk:main",
+            "jeng-load=jeng.load:main",
+        ],
+    },
     py_modules=[
         "jeng",
     ],
@@ -36,6 +42,9 @@ setup(
         "pandas>=2.2.3",
     ],
     extras_require={
+        "parquet": [
+            "pyarrow>=15.0.0",
+        ],
         "dev": [
             "pytest>=8.3.5",
             "pytest-dependency>=0.6.0",
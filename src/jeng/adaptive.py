@@ -0,0 +1,197 @@
+import json
+import os
+import threading
+import time
+import typing
+
+OPERATION_GET = "get"
+OPERATION_UPLOAD = "upload"
+
+
+class RequestSizer:
+    """
+    Rows per request learned from observed latency, size, truncation and errors, kept per
+    endpoint and operation. After every request the size moves towards the one that would
+    have taken target_latency (at most doubled or halved per step), is capped by the number
+    of data points (rows times curves) the server replied when it truncated a reply, and is
+    halved on error. The cap is dropped after cap_ttl seconds, so a raised server limit is
+    probed again. Bytes per row learned from request and reply sizes cap the size to
+    target_bytes, so a wide log gets fewer rows per request than a narrow one.
+
+    Learned sizes are persisted to a JSON file, so a new process starts from what worked
+    against the same endpoint last time.
+
+    Parameters
+    ----------
+    target_latency: float, default 2.0
+        Wanted seconds per request.
+
+    target_bytes: int, default 8388608
+        Maximum request (upload) or reply (get) bytes per request. If set None, size isn't
+        limited by bytes.
+
+    initial_rows: int, default 1000
+        Rows per request of an endpoint seen for the first time.
+
+    min_rows: int, default 1
+        Minimum rows per request.
+
+    max_rows: int, default 100000
+        Maximum rows per request.
+
+    path: str, default None
+        JSON file to persist learned sizes. If set None, sizes are kept in memory only.
+
+    save_interval: float, default 10.0
+        Minimum seconds between writes of the JSON file (see `save()`).
+
+    cap_ttl: float, default 3600.0
+        Seconds a cap learned from a truncated reply is kept.
+    """
+
+    def __init__(
+        self,
+        target_latency: float = 2.0,
+        target_bytes: int = 8 * 1024 * 1024,
+        initial_rows: int = 1000,
+        min_rows: int = 1,
+        max_rows: int = 100000,
+        path: str = None,
+        save_interval: float = 10.0,
+        cap_ttl: float = 3600.0,
+    ) -> None:
+        self.target_latency = target_latency
+        self.target_bytes = target_bytes
+        self.initial_rows = initial_rows
+        self.min_rows = min_rows
+        self.max_rows = max_rows
+        self.path = path
+        self.save_interval = save_interval
+        self.cap_ttl = cap_ttl
+        self.__lock = threading.Lock()
+        self.__state_dict = {}
+        self.__saved_at = time.monotonic()
+        if path is not None and os.path.exists(path):
+            with open(path, "r") as sizing:
+                self.__state_dict = json.load(sizing)
+
+    def __state(self, endpoint: str, operation: str) -> typing.Dict:
+        # caller holds the lock
+        return self.__state_dict.setdefault(endpoint or "", {}).setdefault(
+            operation, {"rows": self.initial_rows, "cap": None}
+        )
+
+    def __clamp(self, rows: float, state: typing.Dict, curve_count: int, is_capped: bool = True) -> int:
+        # learned rows are stored without the cap, it depends on curves per request
+        upper = self.max_rows
+        if is_capped and state["cap"] is not None:
+            # wall clock, the cap is persisted across processes
+            if time.time() - state.get("capped_at", 0) > self.cap_ttl:
+                state["cap"] = None
+            else:
+                upper = min(upper, state["cap"] / (curve_count or 1))
+        if self.target_bytes is not None and state.get("row_bytes"):
+            upper = min(upper, self.target_bytes / state["row_bytes"])
+        return int(max(self.min_rows, min(upper, rows)))
+
+    def rows(self, endpoint: str, operation: str, curve_count: int = None) -> int:
+        """
+        Get rows per request to use next.
+
+        Parameters
+        ----------
+        endpoint: str
+            WITSML server URL.
+
+        operation: str
+            'get' or 'upload'.
+
+        curve_count: int, default None
+            Curves per row of the next request, used to size it within a learned cap.
+
+        Returns
+        -------
+        int
+            Rows per request.
+        """
+        with self.__lock:
+            state = self.__state(endpoint, operation)
+            return self.__clamp(state["rows"], state, curve_count)
+
+    def observe(
+        self,
+        endpoint: str,
+        operation: str,
+        rows: int,
+        latency: float,
+        is_truncated: bool = False,
+        is_error: bool = False,
+        byte_count: int = None,
+        curve_count: int = None,
+    ):
+        """
+        Learn from a completed request.
+
+        Parameters
+        ----------
+        endpoint: str
+            WITSML server URL.
+
+        operation: str
+            'get' or 'upload'.
+
+        rows: int
+            Rows sent or replied.
+
+        latency: float
+            Seconds the request took.
+
+        is_truncated: bool, default False
+            The server replied partial success (Result 2): rows is its limit.
+
+        is_error: bool, default False
+            The request failed, e.g. timed out or exceeded server limits.
+
+        byte_count: int, default None
+            Bytes sent (upload) or replied (get), learned as bytes per row.
+
+        curve_count: int, default None
+            Curves per row of the request, so a truncation caps data points, not rows.
+        """
+        with self.__lock:
+            state = self.__state(endpoint, operation)
+            if is_error:
+                current = self.__clamp(state["rows"], state, curve_count)
+                state["rows"] = self.__clamp(current / 2, state, curve_count, is_capped=False)
+            else:
+                if is_truncated and rows > 0:
+                    state["cap"] = rows * (curve_count or 1)
+                    state["capped_at"] = time.time()
+                current = self.__clamp(state["rows"], state, curve_count)
+                if byte_count and rows > 0:
+                    # smoothed, a single odd reply doesn't swing the size
+                    row_bytes = byte_count / rows
+                    state["row_bytes"] = (state.get("row_bytes") or row_bytes) / 2 + row_bytes / 2
+                if rows > 0 and latency > 0:
+                    wanted = rows * self.target_latency / latency
+                    state["rows"] = min(max(wanted, current / 2), current * 2)
+                state["rows"] = self.__clamp(state["rows"], state, curve_count, is_capped=False)
+            if self.path is not None and time.monotonic() - self.__saved_at >= self.save_interval:
+                self.__save()
+
+    def __save(self):
+        # caller holds the lock
+        with open(f"{self.path}.tmp", "w") as sizing:
+            json.dump(self.__state_dict, sizing, indent=2)
+        os.replace(f"{self.path}.tmp", self.path)
+        self.__saved_at = time.monotonic()
+
+    def save(self):
+        """
+        Persist learned sizes now (they are also persisted every save_interval seconds
+        while observing).
+        """
+        if self.path is None:
+            return
+        with self.__lock:
+            self.__save()
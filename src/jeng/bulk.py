@@ -0,0 +1,529 @@
+import argparse
+import concurrent.futures
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+import typing
+import urllib.parse
+
+from jeng import adaptive, cli, fetch, ingest, inventory, jeng, model, parse
+
+# pandas is imported on first use to keep import fast
+if typing.TYPE_CHECKING:
+    import pandas
+
+FORMAT_PARQUET = "parquet"
+FORMAT_CSV = "csv"
+HEADER_FILENAME = "_header.json"
+
+
+class Checkpoint:
+    """
+    A JSON checkpoint file of bulk export / import progress, safe to update from worker
+    threads. Every update is written atomically, so an interrupted run resumes from the last
+    completed chunk.
+
+    Parameters
+    ----------
+    path: str, default None
+        Checkpoint file path. If set None, progress is not persisted.
+    """
+
+    def __init__(self, path: str = None) -> None:
+        self.path = path
+        self.__lock = threading.Lock()
+        self.__state_dict = {}
+        if path is not None and os.path.exists(path):
+            with open(path, "r") as checkpoint:
+                self.__state_dict = json.load(checkpoint)
+
+    def get(self, key: str) -> typing.Dict:
+        """
+        Get progress of a log or a file.
+
+        Parameters
+        ----------
+        key: str
+            Log key or file path.
+
+        Returns
+        -------
+        Dict
+            Progress, empty if not started.
+        """
+        with self.__lock:
+            return dict(self.__state_dict.get(key, {}))
+
+    def update(self, key: str, **state):
+        """
+        Update and persist progress of a log or a file.
+
+        Parameters
+        ----------
+        key: str
+            Log key or file path.
+
+        **state
+            Progress values to be updated.
+        """
+        with self.__lock:
+            self.__state_dict.setdefault(key, {}).update(state)
+            if self.path is None:
+                return
+            with open(f"{self.path}.tmp", "w") as checkpoint:
+                json.dump(self.__state_dict, checkpoint, indent=2)
+            os.replace(f"{self.path}.tmp", self.path)
+
+
+def parse_log_key(log_key: str) -> model.LogBasicInfoModel:
+    """
+    Parse 'WELL_UID/WELLBORE_UID/LOG_UID' into log basic info (names are not set).
+
+    Parameters
+    ----------
+    log_key: str
+        Slash separated well, wellbore and log uid.
+
+    Returns
+    -------
+    jeng.model.LogBasicInfoModel
+        Log basic info.
+    """
+    uid_list = log_key.split("/")
+    if len(uid_list) != 3 or not all(uid_list):
+        raise ValueError(f"Log must be WELL_UID/WELLBORE_UID/LOG_UID: {log_key}")
+    return model.LogBasicInfoModel(
+        well_uid=uid_list[0],
+        well_name=None,
+        wellbore_uid=uid_list[1],
+        wellbore_name=None,
+        log_uid=uid_list[2],
+        log_name=None,
+    )
+
+
+def log_path(output: str, log_basic_info: model.LogBasicInfoModel) -> str:
+    """
+    Get Hive style partition directory of a log: well=.../wellbore=.../log=...
+
+    Parameters
+    ----------
+    output: str
+        Dataset root directory.
+
+    log_basic_info: jeng.model.LogBasicInfoModel
+        Log basic info.
+
+    Returns
+    -------
+    str
+        Partition directory path.
+    """
+    return os.path.join(
+        output,
+        f"well={urllib.parse.quote(log_basic_info.well_uid, safe='')}",
+        f"wellbore={urllib.parse.quote(log_basic_info.wellbore_uid, safe='')}",
+        f"log={urllib.parse.quote(log_basic_info.log_uid, safe='')}",
+    )
+
+
+def __write_header(path: str, log_basic_info: model.LogBasicInfoModel, log_curve_info_list: typing.List):
+    with open(os.path.join(path, HEADER_FILENAME), "w") as header:
+        json.dump(
+            {
+                "log_basic_info": vars(log_basic_info),
+                "log_curve_info_list": [vars(curve_info) for curve_info in log_curve_info_list],
+            },
+            header,
+            indent=2,
+        )
+
+
+def __read_header(path: str) -> typing.Tuple[model.LogBasicInfoModel, typing.List[model.LogCurveInfoModel]]:
+    with open(os.path.join(path, HEADER_FILENAME), "r") as header:
+        header_dict = json.load(header)
+    return (
+        model.LogBasicInfoModel(**header_dict["log_basic_info"]),
+        [model.LogCurveInfoModel(**item) for item in header_dict["log_curve_info_list"]],
+    )
+
+
+def export_log(
+    client: jeng.WitsmlClient,
+    log_basic_info: model.LogBasicInfoModel,
+    output: str,
+    output_format: str = FORMAT_PARQUET,
+    checkpoint: Checkpoint = None,
+) -> typing.Dict:
+    """
+    Export a log into a partition directory, one part file per reply chunk, resuming from
+    the checkpoint.
+
+    Parameters
+    ----------
+    client: jeng.jeng.WitsmlClient
+        Connected client.
+
+    log_basic_info: jeng.model.LogBasicInfoModel
+        Well, wellbore and log information of the log.
+
+    output: str
+        Dataset root directory.
+
+    output_format: str, default 'parquet'
+        'parquet' (typed, requires pyarrow) or 'csv' (WITSML text values).
+
+    checkpoint: Checkpoint, default None
+        Export progress.
+
+    Returns
+    -------
+    Dict
+        Number of rows, bytes and elapsed seconds.
+    """
+    checkpoint = checkpoint or Checkpoint()
+    key = f"{log_basic_info.well_uid}/{log_basic_info.wellbore_uid}/{log_basic_info.log_uid}"
+    state = checkpoint.get(key)
+    if state.get("is_done"):
+        return {"rows": 0, "bytes": 0, "elapsed_s": 0.0}
+
+    start = time.perf_counter()
+    log_curve_info_list = client.get_log_header(log_basic_info)
+    index_curve = fetch.get_index_curve(log_curve_info_list)
+    index_type = model.LogIndexTypeEnum.TIME
+    if index_curve.index_type != "date time":
+        index_type = model.LogIndexTypeEnum.NON_TIME
+    path = log_path(output, log_basic_info)
+    os.makedirs(path, exist_ok=True)
+    __write_header(path, log_basic_info, log_curve_info_list)
+
+    # resume after the last exported row (start index is inclusive)
+    part = state.get("part", 0)
+    end_index = state.get("end_index")
+    row_count = 0
+    byte_count = 0
+    for dataframe in fetch.iter_log_data(
+        client,
+        log_basic_info,
+        log_curve_info_list,
+        model.LogIndexModel(start=end_index, end=None, type=index_type),
+    ):
+        if end_index is not None:
+            is_new = fetch.index_key(dataframe[index_curve.mnemonic], index_type) > fetch.index_key_value(
+                end_index, index_type
+            )
+            dataframe = dataframe[is_new].reset_index(drop=True)
+            if dataframe.empty:
+                continue
+
+        part_path = os.path.join(path, f"part-{part:05d}.{output_format}")
+        if output_format == FORMAT_PARQUET:
+            parse.convert_log_dataframe(dataframe, log_curve_info_list).to_parquet(part_path, index=False)
+        else:
+            dataframe.to_csv(part_path, index=False)
+        row_count += len(dataframe.index)
+        byte_count += os.path.getsize(part_path)
+        end_index = str(dataframe[index_curve.mnemonic].iloc[-1])
+        part += 1
+        checkpoint.update(key, part=part, end_index=end_index, rows=state.get("rows", 0) + row_count)
+
+    checkpoint.update(key, is_done=True)
+    return {"rows": row_count, "bytes": byte_count, "elapsed_s": round(time.perf_counter() - start, 3)}
+
+
+def iter_input(input_path: str, rows: int) -> typing.Iterator["pandas.DataFrame"]:
+    """
+    Read a CSV, LAS or Parquet file in chunks of WITSML text values.
+
+    Parameters
+    ----------
+    input_path: str
+        CSV, LAS or Parquet file path.
+
+    rows: int
+        Maximum rows per chunk.
+
+    Returns
+    -------
+    Iterator[pandas.DataFrame]
+        Generator of data chunks.
+    """
+    if input_path.endswith(f".{FORMAT_PARQUET}"):
+        from pyarrow import parquet
+
+        for batch in parquet.ParquetFile(input_path).iter_batches(batch_size=rows):
+            yield ingest.to_text(batch.to_pandas())
+    else:
+        yield from ingest.iter_file(input_path, rows)
+
+
+def import_file(
+    client: jeng.WitsmlClient,
+    input_path: str,
+    log_basic_info: model.LogBasicInfoModel,
+    log_curve_info_list: typing.List[model.LogCurveInfoModel] = None,
+    rows: int = 1000,
+    index_type: str = "measured depth",
+    checkpoint: Checkpoint = None,
+    sizer: adaptive.RequestSizer = None,
+) -> typing.Dict:
+    """
+    Stream a CSV, LAS or Parquet file into a log, chunked into requests within server
+    limits (see `jeng.ingest.iter_upload_query()`), resuming from the checkpoint. The log
+    is created from the first chunk if it doesn't exist.
+
+    Parameters
+    ----------
+    client: jeng.jeng.WitsmlClient
+        Connected client.
+
+    input_path: str
+        CSV, LAS or Parquet file path.
+
+    log_basic_info: jeng.model.LogBasicInfoModel
+        Well, wellbore and log information of the log.
+
+    log_curve_info_list: List[jeng.model.LogCurveInfoModel], default None
+        Curve info for creating the log. If set None, it's made from the file columns.
+
+    rows: int, default 1000
+        Maximum rows per request, also bounded by server capabilities.
+
+    index_type: str, default 'measured depth'
+        Log index type used if log_curve_info_list is not set.
+
+    checkpoint: Checkpoint, default None
+        Import progress.
+
+    sizer: jeng.adaptive.RequestSizer, default None
+        Adapts rows per request (up to rows) to its target latency.
+
+    Returns
+    -------
+    Dict
+        Number of rows, bytes and elapsed seconds.
+    """
+    checkpoint = checkpoint or Checkpoint()
+    state = checkpoint.get(input_path)
+    if state.get("is_done"):
+        return {"rows": 0, "bytes": 0, "elapsed_s": 0.0}
+
+    start = time.perf_counter()
+    if log_curve_info_list is None:
+        if input_path.endswith(f".{FORMAT_PARQUET}"):
+            from pyarrow import parquet
+
+            column_list = parquet.ParquetFile(input_path).schema_arrow.names
+            log_curve_info_list = ingest.make_log_curve_info_list([(item, "", "") for item in column_list], index_type)
+        else:
+            log_curve_info_list = ingest.read_curve_info(input_path, index_type)
+    max_rows, max_size = ingest.upload_limit(client, len(log_curve_info_list), rows, sizer)
+    is_create = state.get("rows", 0) == 0 and not ingest.is_log_exist(client, log_basic_info)
+
+    def iter_remaining(skip_count: int) -> typing.Iterator["pandas.DataFrame"]:
+        # skip rows imported by a previous run
+        for chunk in iter_input(input_path, rows):
+            if skip_count < len(chunk.index):
+                yield chunk.iloc[skip_count:]
+            skip_count = max(0, skip_count - len(chunk.index))
+
+    done_count = state.get("rows", 0)
+    row_count = 0
+    for query, query_row_count in ingest.iter_upload_query(
+        log_basic_info,
+        log_curve_info_list,
+        iter_remaining(done_count),
+        max_rows=max_rows,
+        max_size=max_size,
+        is_include_log_curve_info=is_create,
+    ):
+        ingest.upload(client, query, query_row_count, is_create, sizer)
+        is_create = False
+        row_count += query_row_count
+        checkpoint.update(input_path, rows=done_count + row_count)
+
+    checkpoint.update(input_path, is_done=True)
+    return {
+        "rows": row_count,
+        "bytes": os.path.getsize(input_path),
+        "elapsed_s": round(time.perf_counter() - start, 3),
+    }
+
+
+def find_input(input_path: str) -> typing.List[str]:
+    """
+    Find CSV, LAS and Parquet files of a file or a directory (recursively), sorted by path.
+
+    Parameters
+    ----------
+    input_path: str
+        File or directory path.
+
+    Returns
+    -------
+    List[str]
+        File paths.
+    """
+    if os.path.isfile(input_path):
+        return [input_path]
+    path_list = []
+    for directory, _, filename_list in os.walk(input_path):
+        for filename in filename_list:
+            if filename.endswith((f".{FORMAT_CSV}", f".{ingest.FORMAT_LAS}", f".{FORMAT_PARQUET}")):
+                path_list.append(os.path.join(directory, filename))
+    return sorted(path_list)
+
+
+def __run(task_dict: typing.Dict[str, typing.Callable], workers: int) -> typing.Tuple[typing.Dict, int]:
+    report_dict = {}
+    error_count = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        future_dict = {executor.submit(task): name for name, task in task_dict.items()}
+        for future in concurrent.futures.as_completed(future_dict):
+            try:
+                report_dict[future_dict[future]] = future.result()
+            except Exception as e:
+                report_dict[future_dict[future]] = {"error": f"{type(e).__name__}: {e}"}
+                error_count += 1
+    return report_dict, error_count
+
+
+def __export(args: argparse.Namespace, parser: argparse.ArgumentParser) -> typing.Tuple[typing.Dict, int]:
+    if args.format == FORMAT_PARQUET and importlib.util.find_spec("pyarrow") is None:
+        parser.error("parquet format requires pyarrow (pip install jeng[parquet]), or use --format csv")
+    client = cli.connect(args)
+    log_basic_info_list = [parse_log_key(log_key) for log_key in args.log]
+    if args.all:
+        for well in inventory.InventoryCrawler(client, max_workers=args.workers).crawl():
+            for wellbore in well.child_list:
+                for log in wellbore.child_list:
+                    log_basic_info_list.append(
+                        model.LogBasicInfoModel(well.uid, well.name, wellbore.uid, wellbore.name, log.uid, log.name)
+                    )
+    if not log_basic_info_list:
+        parser.error("--log or --all is required")
+
+    checkpoint = Checkpoint(args.checkpoint)
+    task_dict = {
+        f"{item.well_uid}/{item.wellbore_uid}/{item.log_uid}": (
+            lambda item=item: export_log(client, item, args.output, args.format, checkpoint)
+        )
+        for item in log_basic_info_list
+    }
+    return __run(task_dict, args.workers)
+
+
+def __import(args: argparse.Namespace, parser: argparse.ArgumentParser) -> typing.Tuple[typing.Dict, int]:
+    client = cli.connect(args)
+    checkpoint = Checkpoint(args.checkpoint)
+    sizer = None
+    if args.target_latency is not None:
+        sizer = adaptive.RequestSizer(target_latency=args.target_latency, initial_rows=args.rows, path=args.sizing)
+
+    # files of an exported log partition share its header, a log is imported sequentially
+    log_file_dict = {}
+    for input_path in args.input:
+        for path in find_input(input_path):
+            directory = os.path.dirname(path)
+            if os.path.exists(os.path.join(directory, HEADER_FILENAME)):
+                log_basic_info, log_curve_info_list = __read_header(directory)
+            elif args.log:
+                log_basic_info, log_curve_info_list = parse_log_key(args.log), None
+            else:
+                parser.error(f"--log is required for {path} (no {HEADER_FILENAME} found)")
+            key = f"{log_basic_info.well_uid}/{log_basic_info.wellbore_uid}/{log_basic_info.log_uid}"
+            log_file_dict.setdefault(key, (log_basic_info, log_curve_info_list, []))[2].append(path)
+    if not log_file_dict:
+        parser.error("no CSV, LAS or Parquet file found")
+
+    def import_log(log_basic_info, log_curve_info_list, path_list):
+        report = {"rows": 0, "bytes": 0, "elapsed_s": 0.0}
+        for path in path_list:
+            file_report = import_file(
+                client, path, log_basic_info, log_curve_info_list, args.rows, args.index_type, checkpoint, sizer
+            )
+            for name in report:
+                report[name] += file_report[name]
+        report["elapsed_s"] = round(report["elapsed_s"], 3)
+        return report
+
+    task_dict = {key: (lambda item=item: import_log(*item)) for key, item in log_file_dict.items()}
+    try:
+        return __run(task_dict, args.workers)
+    finally:
+        if sizer is not None:
+            sizer.save()
+
+
+def main(argv: typing.List[str] = None) -> int:
+    """
+    Entry point of `jeng` bulk export / import.
+
+    Parameters
+    ----------
+    argv: List[str], default None
+        Command line arguments. None uses sys.argv.
+
+    Returns
+    -------
+    int
+        Exit code (1 if any log failed).
+    """
+    parser = argparse.ArgumentParser(prog="jeng", description="Bulk move log data between WITSML and files.")
+    cli.add_connection_arguments(parser)
+    parser.add_argument("--workers", type=int, default=4, help="logs processed in parallel")
+    parser.add_argument("--checkpoint", help="checkpoint file to resume an interrupted run")
+    parser.add_argument("--output-report", help="write JSON report to file")
+    subparser = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparser.add_parser("export", help="export logs into a partitioned dataset")
+    export_parser.add_argument("--log", action="append", default=[], help="WELL_UID/WELLBORE_UID/LOG_UID")
+    export_parser.add_argument("--all", action="store_true", help="export every log of the server inventory")
+    export_parser.add_argument("--output", required=True, help="dataset root directory")
+    export_parser.add_argument("--format", choices=[FORMAT_PARQUET, FORMAT_CSV], default=FORMAT_PARQUET)
+
+    import_parser = subparser.add_parser("import", help="import CSV / LAS / Parquet files into logs")
+    import_parser.add_argument("input", nargs="+", help="file or directory (exported dataset)")
+    import_parser.add_argument("--log", help="WELL_UID/WELLBORE_UID/LOG_UID for files without exported header")
+    import_parser.add_argument("--rows", type=int, default=1000, help="maximum rows per request")
+    import_parser.add_argument("--index-type", default="measured depth", help="index type of a new log")
+    import_parser.add_argument(
+        "--target-latency", type=float, help="adapt rows per request (up to --rows) to seconds per request"
+    )
+    import_parser.add_argument("--sizing", help="JSON file to persist learned rows per request per endpoint")
+    args = parser.parse_args(argv)
+    if not args.url:
+        parser.error("--url (or JENG_CONN_URL) is required")
+
+    start = time.perf_counter()
+    if args.command == "export":
+        report_dict, error_count = __export(args, export_parser)
+    else:
+        report_dict, error_count = __import(args, import_parser)
+    elapsed = time.perf_counter() - start
+
+    row_count = sum(report.get("rows", 0) for report in report_dict.values())
+    byte_count = sum(report.get("bytes", 0) for report in report_dict.values())
+    report = {
+        "command": args.command,
+        "url": args.url,
+        "elapsed_s": round(elapsed, 2),
+        "rows": row_count,
+        "bytes": byte_count,
+        "rows_per_second": round(row_count / elapsed, 1) if elapsed else None,
+        "bytes_per_second": round(byte_count / elapsed, 1) if elapsed else None,
+        "error_count": error_count,
+        "logs": report_dict,
+    }
+    if args.output_report:
+        with open(args.output_report, "w") as output:
+            json.dump(report, output, indent=2)
+    print(json.dumps(report, indent=2))
+    return 1 if error_count else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
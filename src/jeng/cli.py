@@ -0,0 +1,49 @@
+import argparse
+import os
+
+from jeng import jeng
+
+
+def add_connection_arguments(parser: argparse.ArgumentParser):
+    """
+    Add WITSML connection arguments shared by the command line tools: --url, --username,
+    --password (defaulting to JENG_CONN_* environment variables), --raw and --compression.
+
+    Parameters
+    ----------
+    parser: argparse.ArgumentParser
+        Command line parser. Updated in place.
+    """
+    parser.add_argument("--url", default=os.environ.get("JENG_CONN_URL"), help="WITSML Store endpoint")
+    parser.add_argument("--username", default=os.environ.get("JENG_CONN_USERNAME", ""))
+    parser.add_argument("--password", default=os.environ.get("JENG_CONN_PASSWORD", ""))
+    parser.add_argument("--raw", action="store_true", help="use raw transport mode")
+    parser.add_argument("--compression", choices=["gzip", "deflate"], help="compress request body")
+
+
+def connect(args: argparse.Namespace) -> jeng.WitsmlClient:
+    """
+    Connect a new client with command line connection arguments (see
+    `add_connection_arguments()`).
+
+    Parameters
+    ----------
+    args: argparse.Namespace
+        Parsed command line arguments.
+
+    Returns
+    -------
+    jeng.WitsmlClient
+        Connected client.
+    """
+    client = jeng.WitsmlClient()
+    status = client.connect(
+        url=args.url,
+        username=args.username,
+        password=args.password,
+        is_raw=args.raw,
+        request_compression=args.compression,
+    )
+    if not status:
+        raise ConnectionError(f"Unable to connect to {args.url}")
+    return client
@@ -0,0 +1,242 @@
+import typing
+
+from jeng import adaptive, fetch, model, parse
+
+# pandas is imported on first use to keep import fast
+if typing.TYPE_CHECKING:
+    import pandas
+
+    from jeng import jeng
+
+__KEY = "__key"
+__GROUP = "__group"
+__PRIORITY = "__priority"
+__DISTANCE = "__distance"
+
+
+def __iter_source(
+    client: "jeng.WitsmlClient",
+    log_basic_info: model.LogBasicInfoModel,
+    log_curve_info_list: typing.List[model.LogCurveInfoModel],
+    log_index: model.LogIndexModel,
+    column_list: typing.List[str],
+    priority: int,
+    sizer: adaptive.RequestSizer,
+) -> typing.Iterator["pandas.DataFrame"]:
+    # typed chunks of a source, index curve renamed to the composite index curve
+    index_mnemonic = log_curve_info_list[0].mnemonic
+    for dataframe in fetch.iter_log_data(client, log_basic_info, log_curve_info_list, log_index, sizer):
+        key_series = fetch.index_key(dataframe[index_mnemonic], log_index.type)
+        dataframe = parse.convert_log_dataframe(dataframe, log_curve_info_list)
+        dataframe = dataframe.rename(columns={index_mnemonic: column_list[0]}).reindex(columns=column_list)
+        dataframe[__KEY] = key_series.to_numpy()
+        dataframe[__PRIORITY] = priority
+        yield dataframe
+
+
+def __merge(
+    dataframe: "pandas.DataFrame",
+    column_list: typing.List[str],
+    index_type: model.LogIndexTypeEnum,
+    step: float,
+    origin: float,
+) -> "pandas.DataFrame":
+    # sorted by index then priority, the first non-missing value of every curve wins
+    import pandas
+
+    sort_list = [__GROUP, __PRIORITY] + ([__DISTANCE] if step is not None else [])
+    dataframe = dataframe.sort_values(sort_list, kind="mergesort")
+    merged = dataframe.groupby(__GROUP, sort=False)[column_list].first()
+    if step is not None:
+        grid_key = merged.index.to_numpy() * step + origin
+        if index_type == model.LogIndexTypeEnum.TIME:
+            merged[column_list[0]] = pandas.to_datetime(grid_key, unit="s", utc=True)
+        else:
+            merged[column_list[0]] = grid_key
+    return merged.reset_index(drop=True)
+
+
+def iter_composite_log(
+    client: "jeng.WitsmlClient",
+    log_basic_info_list: typing.List[model.LogBasicInfoModel],
+    mnemonic_list: typing.List[str] = None,
+    log_index: model.LogIndexModel = None,
+    step: float = None,
+    sizer: adaptive.RequestSizer = None,
+) -> typing.Iterator["pandas.DataFrame"]:
+    """
+    Build a composite log from several logs (e.g. runs) merged on the index curve. Every
+    log is fetched chunk by chunk (see `jeng.fetch.iter_log_data()`) and merged as a sorted
+    stream: rows are emitted as soon as every log has been fetched past them, so memory
+    stays near one reply per log regardless of the well length.
+
+    Where logs overlap, every curve takes the value of the first log in log_basic_info_list
+    with a non-missing value at that index, so earlier logs have priority and later logs
+    fill their gaps.
+
+    Parameters
+    ----------
+    client: jeng.jeng.WitsmlClient
+        Connected client.
+
+    log_basic_info_list: List[jeng.model.LogBasicInfoModel]
+        Logs in priority order, all with the same index type.
+
+    mnemonic_list: List[str], default None
+        Curves of the composite log (the index curve is always included). If set None,
+        every curve of every log is included.
+
+    log_index: jeng.model.LogIndexModel, default None
+        Index range to be merged. If set None, the whole logs are merged.
+
+    step: float, default None
+        Resample onto a regular index with this step (seconds for time index), starting
+        from log_index start (or 0). Every index takes the nearest value within half a step
+        of the first log that has one. If set None, the index of every log is kept.
+
+    sizer: jeng.adaptive.RequestSizer, default None
+        Adapts rows per request of every fetch to its target latency.
+
+    Returns
+    -------
+    Iterator[pandas.DataFrame]
+        Generator of typed composite data chunks in index order, with the index curve of
+        the first log and mnemonic as column name. Curve units of the first log that has
+        the curve are set into `dataframe.attrs["unit_dict"]`.
+    """
+    import pandas
+
+    if not log_basic_info_list:
+        raise ValueError("At least one log is required.")
+
+    # curves of every log, index curve first
+    source_list = []
+    index_type_set = set()
+    for log_basic_info in log_basic_info_list:
+        header_list = client.get_log_header(log_basic_info)
+        index_curve = fetch.get_index_curve(header_list)
+        log_curve_info_list = [index_curve] + [
+            curve_info
+            for curve_info in header_list
+            if not curve_info.is_index_curve and (mnemonic_list is None or curve_info.mnemonic in mnemonic_list)
+        ]
+        index_type_set.add(
+            model.LogIndexTypeEnum.TIME if index_curve.index_type == "date time" else model.LogIndexTypeEnum.NON_TIME
+        )
+        source_list.append((log_basic_info, log_curve_info_list))
+    if len(index_type_set) > 1:
+        raise ValueError("Logs with time and non-time index can't be merged.")
+    index_type = index_type_set.pop()
+    if log_index is None:
+        log_index = model.LogIndexModel(start=None, end=None, type=index_type)
+    elif log_index.type != index_type:
+        raise ValueError("Index type of log_index doesn't match the logs.")
+
+    column_list = [source_list[0][1][0].mnemonic]
+    unit_dict = {column_list[0]: source_list[0][1][0].unit}
+    for _, log_curve_info_list in source_list:
+        for curve_info in log_curve_info_list[1:]:
+            if curve_info.mnemonic not in column_list:
+                column_list.append(curve_info.mnemonic)
+                unit_dict[curve_info.mnemonic] = curve_info.unit
+    origin = 0.0
+    if step is not None and log_index.start is not None:
+        origin = fetch.index_key_value(log_index.start, index_type)
+
+    iterator_list = [
+        __iter_source(client, log_basic_info, log_curve_info_list, log_index, column_list, priority, sizer)
+        for priority, (log_basic_info, log_curve_info_list) in enumerate(source_list)
+    ]
+    last_key_list = [None] * len(iterator_list)
+    is_active_list = [True] * len(iterator_list)
+    pending = None
+    while True:
+        # fetch from the log that holds the merge back
+        if any(is_active_list):
+            position = min(
+                (position for position, is_active in enumerate(is_active_list) if is_active),
+                key=lambda position: float("-inf") if last_key_list[position] is None else last_key_list[position],
+            )
+            chunk = next(iterator_list[position], None)
+            if chunk is None:
+                is_active_list[position] = False
+            else:
+                last_key_list[position] = float(chunk[__KEY].iloc[-1])
+                pending = chunk if pending is None else pandas.concat([pending, chunk], ignore_index=True)
+        active_key_list = [key for key, is_active in zip(last_key_list, is_active_list) if is_active]
+        if any(key is None for key in active_key_list):
+            continue
+        if pending is None:
+            if not active_key_list:
+                return
+            continue
+
+        # rows up to the horizon are complete: every log has been fetched past them
+        horizon = min(active_key_list) if active_key_list else None
+        if step is None:
+            pending[__GROUP] = pending[__KEY]
+        else:
+            pending[__GROUP] = ((pending[__KEY] - origin) / step).round()
+            pending[__DISTANCE] = (pending[__KEY] - origin - pending[__GROUP] * step).abs()
+        if horizon is None:
+            is_ready = pandas.Series(True, index=pending.index)
+        elif step is None:
+            is_ready = pending[__GROUP] <= horizon
+        else:
+            # the grid index of the horizon may still get rows within half a step
+            is_ready = pending[__GROUP] < round((horizon - origin) / step)
+        if is_ready.any():
+            dataframe = __merge(pending[is_ready], column_list, index_type, step, origin)
+            dataframe.attrs["unit_dict"] = dict(unit_dict)
+            yield dataframe
+        if horizon is None:
+            return
+        pending = None if is_ready.all() else pending[~is_ready].reset_index(drop=True)
+
+
+def get_composite_log(
+    client: "jeng.WitsmlClient",
+    log_basic_info_list: typing.List[model.LogBasicInfoModel],
+    mnemonic_list: typing.List[str] = None,
+    log_index: model.LogIndexModel = None,
+    step: float = None,
+    sizer: adaptive.RequestSizer = None,
+) -> "pandas.DataFrame":
+    """
+    Build a composite log into a single DataFrame (see `iter_composite_log()`).
+
+    Parameters
+    ----------
+    client: jeng.jeng.WitsmlClient
+        Connected client.
+
+    log_basic_info_list: List[jeng.model.LogBasicInfoModel]
+        Logs in priority order, all with the same index type.
+
+    mnemonic_list: List[str], default None
+        Curves of the composite log (the index curve is always included). If set None,
+        every curve of every log is included.
+
+    log_index: jeng.model.LogIndexModel, default None
+        Index range to be merged. If set None, the whole logs are merged.
+
+    step: float, default None
+        Resample onto a regular index with this step (seconds for time index). If set
+        None, the index of every log is kept.
+
+    sizer: jeng.adaptive.RequestSizer, default None
+        Adapts rows per request of every fetch to its target latency.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Typed composite data with mnemonic as column name, index curve first.
+    """
+    import pandas
+
+    dataframe_list = list(iter_composite_log(client, log_basic_info_list, mnemonic_list, log_index, step, sizer))
+    if not dataframe_list:
+        return pandas.DataFrame()
+    dataframe = pandas.concat(dataframe_list, ignore_index=True)
+    dataframe.attrs = dict(dataframe_list[0].attrs)
+    return dataframe
@@ -0,0 +1,157 @@
+import typing
+
+from jeng import fetch, model
+
+# numpy and pandas are imported on first use to keep import fast
+if typing.TYPE_CHECKING:
+    import numpy
+    import pandas
+
+METHOD_LTTB = "lttb"
+METHOD_MIN_MAX = "min-max"
+
+
+def min_max(x: "numpy.ndarray", y: "numpy.ndarray", point_count: int) -> "numpy.ndarray":
+    """
+    Select positions of the minimum and maximum value of each bucket (equal number of
+    points per bucket), plus the first and the last point.
+
+    Parameters
+    ----------
+    x: numpy.ndarray
+        Sorted index keys.
+
+    y: numpy.ndarray
+        Values, NaN is never selected.
+
+    point_count: int
+        Maximum number of selected points (at least 2).
+
+    Returns
+    -------
+    numpy.ndarray
+        Sorted positions of selected points.
+    """
+    import numpy
+
+    if point_count < 2:
+        raise ValueError("Min-max point_count must be at least 2.")
+    position_array = numpy.flatnonzero(~numpy.isnan(y))
+    if len(position_array) <= point_count:
+        return position_array
+
+    selected_list = [position_array[:1], position_array[-1:]]
+    bucket_count = (point_count - 2) // 2
+    for bucket in numpy.array_split(position_array[1:-1], bucket_count) if bucket_count > 0 else []:
+        if len(bucket):
+            selected_list.append(bucket[[numpy.argmin(y[bucket]), numpy.argmax(y[bucket])]])
+    return numpy.unique(numpy.concatenate(selected_list))
+
+
+def lttb(x: "numpy.ndarray", y: "numpy.ndarray", point_count: int) -> "numpy.ndarray":
+    """
+    Select positions with Largest-Triangle-Three-Buckets: the point of each bucket that
+    forms the largest triangle with the previously selected point and the average point of
+    the next bucket, plus the first and the last point.
+
+    Parameters
+    ----------
+    x: numpy.ndarray
+        Sorted index keys.
+
+    y: numpy.ndarray
+        Values, NaN is never selected.
+
+    point_count: int
+        Maximum number of selected points (at least 3).
+
+    Returns
+    -------
+    numpy.ndarray
+        Sorted positions of selected points.
+    """
+    import numpy
+
+    if point_count < 3:
+        raise ValueError("LTTB point_count must be at least 3.")
+    position_array = numpy.flatnonzero(~numpy.isnan(y))
+    if len(position_array) <= point_count:
+        return position_array
+
+    bucket_list = numpy.array_split(position_array[1:-1], point_count - 2)
+    selected_list = [position_array[0]]
+    for number, bucket in enumerate(bucket_list):
+        next_bucket = bucket_list[number + 1] if number + 1 < len(bucket_list) else position_array[-1:]
+        average_x = x[next_bucket].mean()
+        average_y = y[next_bucket].mean()
+        previous = selected_list[-1]
+        area_array = numpy.abs(
+            (x[previous] - average_x) * (y[bucket] - y[previous])
+            - (x[previous] - x[bucket]) * (average_y - y[previous])
+        )
+        selected_list.append(bucket[numpy.argmax(area_array)])
+    selected_list.append(position_array[-1])
+    return numpy.array(selected_list)
+
+
+def decimate(
+    dataframe: "pandas.DataFrame",
+    index_mnemonic: str,
+    index_type: model.LogIndexTypeEnum = model.LogIndexTypeEnum.TIME,
+    point_count: int = 2000,
+    method: str = METHOD_LTTB,
+) -> "pandas.DataFrame":
+    """
+    Downsample log data for visualization. Points are selected for every numeric curve
+    independently and a row is kept if it's selected for any curve, so point_count is
+    shared evenly by the numeric curves to bound the number of rows.
+
+    Parameters
+    ----------
+    dataframe: pandas.DataFrame
+        Log data with mnemonic as column name, sorted by index.
+
+    index_mnemonic: str
+        Index curve mnemonic.
+
+    index_type: jeng.model.LogIndexTypeEnum, default jeng.model.LogIndexTypeEnum.TIME
+        Type of log index: time or non-time index.
+
+    point_count: int, default 2000
+        Maximum number of rows, at least 3 (lttb) or 2 (min-max) per numeric curve.
+
+    method: str, default 'lttb'
+        Decimation method: 'lttb' (shape preserving) or 'min-max' (extremes preserving).
+
+    Returns
+    -------
+    pandas.DataFrame
+        Selected rows, index reset.
+    """
+    import numpy
+    import pandas
+
+    if method not in [METHOD_LTTB, METHOD_MIN_MAX]:
+        raise ValueError(f"Decimation method not supported: {method}")
+    if len(dataframe.index) <= point_count:
+        return dataframe.reset_index(drop=True)
+
+    select = lttb if method == METHOD_LTTB else min_max
+    x = fetch.index_key(dataframe[index_mnemonic], index_type).to_numpy(dtype=float)
+    y_list = []
+    for mnemonic in dataframe.columns:
+        if mnemonic == index_mnemonic:
+            continue
+        y = pandas.to_numeric(dataframe[mnemonic], errors="coerce").to_numpy(dtype=float)
+        if not numpy.isnan(y).all():
+            y_list.append(y)
+    if not y_list:
+        y_list.append(numpy.zeros(len(x)))
+
+    # the union of selected rows stays within point_count
+    curve_point_count = point_count // len(y_list)
+    minimum = 3 if method == METHOD_LTTB else 2
+    if curve_point_count < minimum:
+        raise ValueError(f"point_count must be at least {minimum} per numeric curve ({minimum * len(y_list)}).")
+    selected_list = [select(x, y, curve_point_count) for y in y_list]
+    return dataframe.iloc[numpy.unique(numpy.concatenate(selected_list))].reset_index(drop=True)
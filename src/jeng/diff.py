@@ -0,0 +1,234 @@
+import typing
+
+from jeng import exception, fetch, ingest, model
+
+# numpy and pandas are imported on first use to keep import fast
+if typing.TYPE_CHECKING:
+    import pandas
+
+    from jeng import jeng
+
+
+def __index_type(log_curve_info_list: typing.List[model.LogCurveInfoModel]) -> model.LogIndexTypeEnum:
+    if fetch.get_index_curve(log_curve_info_list).index_type == "date time":
+        return model.LogIndexTypeEnum.TIME
+    return model.LogIndexTypeEnum.NON_TIME
+
+
+def __is_equal(local: "pandas.Series", remote: "pandas.Series", rtol: float) -> "pandas.Series":
+    import numpy
+    import pandas
+
+    local_missing = local.isna() | (local.astype(str) == "")
+    remote_missing = remote.isna() | (remote.astype(str) == "")
+    is_equal = local_missing & remote_missing
+    is_present = ~local_missing & ~remote_missing
+
+    if pandas.api.types.is_datetime64_any_dtype(local):
+        remote_time = pandas.to_datetime(remote.where(is_present), utc=True, format="ISO8601", errors="coerce")
+        local_time = local.dt.tz_localize("UTC") if local.dt.tz is None else local
+        return is_equal | (is_present & (local_time == remote_time))
+
+    local_number = pandas.to_numeric(local.where(is_present), errors="coerce")
+    remote_number = pandas.to_numeric(remote.where(is_present), errors="coerce")
+    is_number = local_number.notna() & remote_number.notna()
+    is_close = numpy.isclose(local_number.to_numpy(float), remote_number.to_numpy(float), rtol=rtol, atol=0.0)
+    is_text_equal = local.astype(str) == remote.astype(str)
+    return is_equal | (is_number & is_close) | (is_present & ~is_number & is_text_equal)
+
+
+def diff_log_data(
+    dataframe: "pandas.DataFrame",
+    remote_dataframe: "pandas.DataFrame",
+    index_mnemonic: str,
+    index_type: model.LogIndexTypeEnum = model.LogIndexTypeEnum.TIME,
+    rtol: float = 0.0,
+) -> "pandas.DataFrame":
+    """
+    Compare local log data with the server's copy, aligned on the index curve. Numbers are
+    compared by value (e.g. '1.0' equals '1'), date time by instant and other values as
+    text; a missing value equals only a missing value. Rows missing on the server differ
+    in every curve with a value.
+
+    Parameters
+    ----------
+    dataframe: pandas.DataFrame
+        Local log data with mnemonic as column name, text or typed values.
+
+    remote_dataframe: pandas.DataFrame
+        Server log data, e.g. fetched with `jeng.fetch.iter_log_data()` or read from
+        `jeng.replica.LogReplica`.
+
+    index_mnemonic: str
+        Index curve mnemonic.
+
+    index_type: jeng.model.LogIndexTypeEnum, default jeng.model.LogIndexTypeEnum.TIME
+        Type of log index: time or non-time index.
+
+    rtol: float, default 0.0
+        Relative tolerance of equal numbers.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Boolean mask of changed values, same rows as dataframe and its curves except the
+        index curve.
+    """
+    import pandas
+
+    local_key = fetch.index_key(dataframe[index_mnemonic], index_type).to_numpy()
+    remote_dataframe = remote_dataframe.set_index(
+        fetch.index_key(remote_dataframe[index_mnemonic], index_type).to_numpy()
+    )
+    remote_dataframe = remote_dataframe[~remote_dataframe.index.duplicated(keep="last")].reindex(local_key)
+
+    mask_dict = {}
+    for mnemonic in dataframe.columns:
+        if mnemonic == index_mnemonic:
+            continue
+        local = dataframe[mnemonic].reset_index(drop=True)
+        if mnemonic in remote_dataframe.columns:
+            remote = remote_dataframe[mnemonic].reset_index(drop=True)
+        else:
+            remote = pandas.Series([None] * len(local.index), dtype=object)
+        mask_dict[mnemonic] = ~__is_equal(local, remote, rtol)
+    return pandas.DataFrame(mask_dict, index=dataframe.index, dtype=bool)
+
+
+def generate_diff_query_list(
+    log_basic_info: model.LogBasicInfoModel,
+    log_curve_info_list: typing.List[model.LogCurveInfoModel],
+    dataframe: "pandas.DataFrame",
+    remote_dataframe: "pandas.DataFrame",
+    rtol: float = 0.0,
+    max_rows: int = None,
+    max_size: int = None,
+) -> typing.List[typing.Tuple[str, int]]:
+    """
+    Generate minimal update queries: only changed rows, and only the curves that changed.
+    Rows with the same set of changed curves share queries.
+
+    Parameters
+    ----------
+    log_basic_info: jeng.model.LogBasicInfoModel
+        Well, wellbore and log information of the log.
+
+    log_curve_info_list: List[jeng.model.LogCurveInfoModel]
+        A list of curve info. The index curve is required.
+
+    dataframe: pandas.DataFrame
+        Local log data with mnemonic as column name.
+
+    remote_dataframe: pandas.DataFrame
+        Server log data of (at least) the same index range.
+
+    rtol: float, default 0.0
+        Relative tolerance of equal numbers.
+
+    max_rows: int, default None
+        Maximum rows per query. None if not limited.
+
+    max_size: int, default None
+        Maximum characters per query. None if not limited.
+
+    Returns
+    -------
+    List[Tuple[str, int]]
+        (query, number of rows) of update queries, empty if nothing changed.
+    """
+    index_curve = fetch.get_index_curve(log_curve_info_list)
+    mask = diff_log_data(
+        dataframe, remote_dataframe, index_curve.mnemonic, __index_type(log_curve_info_list), rtol=rtol
+    )
+    mask = mask[mask.any(axis=1)]
+    if mask.empty:
+        return []
+
+    query_list = []
+    for pattern, group in mask.groupby(list(mask.columns), sort=False):
+        mnemonic_list = [mnemonic for mnemonic, is_changed in zip(mask.columns, pattern) if is_changed]
+        chunk = ingest.to_text(dataframe.loc[group.index, [index_curve.mnemonic] + mnemonic_list])
+        query_list += list(
+            ingest.iter_upload_query(
+                log_basic_info,
+                log_curve_info_list,
+                [chunk],
+                max_rows=max_rows,
+                max_size=max_size,
+                is_include_log_curve_info=False,
+            )
+        )
+    return query_list
+
+
+def update_log_diff(
+    client: "jeng.WitsmlClient",
+    log_basic_info: model.LogBasicInfoModel,
+    log_curve_info_list: typing.List[model.LogCurveInfoModel],
+    dataframe: "pandas.DataFrame",
+    remote_dataframe: "pandas.DataFrame" = None,
+    rtol: float = 0.0,
+) -> int:
+    """
+    Update a log with only the values that differ from the server's copy (see
+    `generate_diff_query_list()`). Rows missing locally are left untouched on the server.
+
+    Parameters
+    ----------
+    client: jeng.jeng.WitsmlClient
+        Connected client.
+
+    log_basic_info: jeng.model.LogBasicInfoModel
+        Well, wellbore and log information of the log.
+
+    log_curve_info_list: List[jeng.model.LogCurveInfoModel]
+        A list of curve info. The index curve is required.
+
+    dataframe: pandas.DataFrame
+        Local log data with mnemonic as column name.
+
+    remote_dataframe: pandas.DataFrame, default None
+        Cached server log data. If set None, the index range of dataframe is fetched.
+
+    rtol: float, default 0.0
+        Relative tolerance of equal numbers.
+
+    Returns
+    -------
+    int
+        Number of updated rows.
+    """
+    import pandas
+
+    if dataframe.empty:
+        return 0
+    index_curve = fetch.get_index_curve(log_curve_info_list)
+    if remote_dataframe is None:
+        index_type = __index_type(log_curve_info_list)
+        key_series = fetch.index_key(dataframe[index_curve.mnemonic], index_type)
+        log_index = model.LogIndexModel(
+            start=ingest.to_text(dataframe[[index_curve.mnemonic]].loc[[key_series.idxmin()]]).iloc[0, 0],
+            end=ingest.to_text(dataframe[[index_curve.mnemonic]].loc[[key_series.idxmax()]]).iloc[0, 0],
+            type=index_type,
+        )
+        curve_list = [index_curve] + [
+            curve_info
+            for curve_info in log_curve_info_list
+            if not curve_info.is_index_curve and curve_info.mnemonic in dataframe.columns
+        ]
+        remote_list = list(fetch.iter_log_data(client, log_basic_info, curve_list, log_index))
+        if remote_list:
+            remote_dataframe = pandas.concat(remote_list, ignore_index=True)
+        else:
+            remote_dataframe = pandas.DataFrame(columns=[curve_info.mnemonic for curve_info in curve_list])
+
+    max_rows, max_size = ingest.upload_limit(client, len(dataframe.columns))
+    row_count = 0
+    for query, query_row_count in generate_diff_query_list(
+        log_basic_info, log_curve_info_list, dataframe, remote_dataframe, rtol, max_rows, max_size
+    ):
+        reply = client.update_in_store(wml_type_in="log", xml_in=query)
+        if reply.Result < 1:
+            raise exception.JengReplyErrorException(reply.Result, reply.SuppMsgOut)
+        row_count += query_row_count
+    return row_count
@@ -0,0 +1,696 @@
+import base64
+import bisect
+import copy
+import datetime
+import http.server
+import os
+import threading
+import time
+import typing
+import zlib
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+import jeng
+from jeng import generate, soap, transport
+
+WSDL_NAMESPACE = "http://schemas.xmlsoap.org/wsdl/"
+WITSML_API_VERSION = "1.4.1"
+SUPPORTED_DATA_OBJECT_LIST = ["well", "wellbore", "log"]
+STORE_FUNCTION_LIST = ["WMLS_AddToStore", "WMLS_UpdateInStore", "WMLS_DeleteFromStore", "WMLS_GetFromStore"]
+UID_ATTRIBUTE_DICT = {
+    "well": ["uid"],
+    "wellbore": ["uidWell", "uid"],
+    "log": ["uidWell", "uidWellbore", "uid"],
+}
+NAME_ELEMENT_DICT = {
+    "well": ["name"],
+    "wellbore": ["nameWell", "name"],
+    "log": ["nameWell", "nameWellbore", "name"],
+}
+
+# WITSML return values; -1000 and below are emulator specific
+RESULT_SUCCESS = 1
+RESULT_PARTIAL_SUCCESS = 2
+ERROR_DATA_OBJECT_UID_EXISTS = -405
+ERROR_DATA_OBJECT_NOT_EXIST = -433
+ERROR_REQUEST_TOO_LARGE = -1001
+ERROR_MAX_DATA_EXCEEDED = -1002
+ERROR_DATA_OBJECT_NOT_SUPPORTED = -1003
+ERROR_INVALID_XML = -1004
+ERROR_FUNCTION_NOT_SUPPORTED = -1005
+BASE_MESSAGE_DICT = {
+    RESULT_SUCCESS: "Function completed successfully",
+    RESULT_PARTIAL_SUCCESS: "Partial success: Function completed successfully but some data-objects were not selected",
+    ERROR_DATA_OBJECT_UID_EXISTS: "The uid of the data-object already exists in the store",
+    ERROR_DATA_OBJECT_NOT_EXIST: "The data-object does not exist in the store",
+    ERROR_REQUEST_TOO_LARGE: "The request exceeds the maximum request size of the store",
+    ERROR_MAX_DATA_EXCEEDED: "The request exceeds maxDataNodes or maxDataPoints of the store",
+    ERROR_DATA_OBJECT_NOT_SUPPORTED: "The data-object type is not supported by the store",
+    ERROR_INVALID_XML: "The input template is not a valid XML document",
+    ERROR_FUNCTION_NOT_SUPPORTED: "The function is not supported by the store",
+}
+
+
+def __local_name(tag: str) -> str:
+    return tag.split("}", 1)[1] if "}" in tag else tag
+
+
+def strip_namespace(element: ElementTree.Element) -> ElementTree.Element:
+    """
+    Remove namespace from element and attribute names, recursively.
+
+    Parameters
+    ----------
+    element: xml.etree.ElementTree.Element
+        Element to update in place.
+
+    Returns
+    -------
+    xml.etree.ElementTree.Element
+        The same element.
+    """
+    for item in element.iter():
+        item.tag = __local_name(item.tag)
+        for key in [key for key in item.attrib if "}" in key]:
+            item.attrib[__local_name(key)] = item.attrib.pop(key)
+    return element
+
+
+def load_response_part_dict(wsdl_file_path: str) -> typing.Dict[str, typing.List[str]]:
+    """
+    Read reply part names of every WMLS function from WSDL message definitions.
+
+    Parameters
+    ----------
+    wsdl_file_path: str
+        Path of WMLS WSDL file.
+
+    Returns
+    -------
+    Dict[str, List[str]]
+        Reply part names keyed by WMLS function name, in order of definition.
+    """
+    root = ElementTree.parse(wsdl_file_path).getroot()
+    response_part_dict = {}
+    for message in root.iter(f"{{{WSDL_NAMESPACE}}}message"):
+        name = message.attrib["name"].split(".", 1)[-1]
+        if name.endswith("Response"):
+            response_part_dict[name[: -len("Response")]] = [
+                part.attrib["name"] for part in message.iter(f"{{{WSDL_NAMESPACE}}}part")
+            ]
+    return response_part_dict
+
+
+class WitsmlStoreRequestHandler(http.server.BaseHTTPRequestHandler):
+    "HTTP handler that passes SOAP requests to `jeng.emulator.WitsmlStoreEmulator`."
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        emulator: WitsmlStoreEmulator = self.server.emulator
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if not emulator.is_authorized(self.headers.get("Authorization")):
+            self.__send(401, b"")
+            return
+        if self.headers.get("Content-Encoding") in [transport.COMPRESSION_GZIP, transport.COMPRESSION_DEFLATE]:
+            body = zlib.decompress(body, zlib.MAX_WBITS | 32)
+
+        try:
+            content = emulator.handle_envelope(body)
+            status = 200
+        except Exception as e:
+            content = emulator.build_fault(str(e))
+            status = 500
+
+        if emulator.is_response_compression and "gzip" in self.headers.get("Accept-Encoding", ""):
+            self.__send(status, transport.compress(content, transport.COMPRESSION_GZIP, level=1), "gzip")
+        else:
+            self.__send(status, content)
+
+    def __send(self, status: int, content: bytes, content_encoding: str = None):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/xml; charset=utf-8")
+        if content_encoding is not None:
+            self.send_header("Content-Encoding", content_encoding)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class WitsmlStoreEmulator:
+    """
+    In-process WITSML 1.4.1.1 store stand-in served over HTTP, for offline testing and
+    benchmarking. Supports well, wellbore and log add, get, update and delete, log data
+    index ranges, 'requestLatestValues' option, configurable latency and request limits,
+    and truncated (partial success) log data replies.
+
+    Parameters
+    ----------
+    host: str, default '127.0.0.1'
+        Host to listen on.
+
+    port: int, default 0
+        Port to listen on. 0 picks a free port.
+
+    username: str, default None
+        Required username for HTTP basic authentication. None allows any user.
+
+    password: str, default None
+        Required password for HTTP basic authentication.
+
+    latency: float, default 0.0
+        Delay in seconds added to every request.
+
+    max_request_size: int, default None
+        Maximum characters of XMLin / QueryIn. None if not limited.
+
+    max_data_nodes: int, default None
+        Maximum log data rows per request. Longer get replies are truncated (partial
+        success) and longer add and update requests are rejected. None if not limited.
+
+    max_data_points: int, default None
+        Maximum log data points (rows x curves) per request. None if not limited.
+
+    is_response_compression: bool, default True
+        Compress reply with gzip if the client accepts it.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        username: str = None,
+        password: str = None,
+        latency: float = 0.0,
+        max_request_size: int = None,
+        max_data_nodes: int = None,
+        max_data_points: int = None,
+        is_response_compression: bool = True,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.latency = latency
+        self.max_request_size = max_request_size
+        self.max_data_nodes = max_data_nodes
+        self.max_data_points = max_data_points
+        self.is_response_compression = is_response_compression
+        self.request_count = 0
+        self.__lock = threading.RLock()
+        self.__server = None
+        self.__object_dict = {data_object: {} for data_object in SUPPORTED_DATA_OBJECT_LIST}
+        self.__log_data_dict = {}
+        self.__response_part_dict = load_response_part_dict(os.path.join(jeng.__path__[0], "xml", "WMLS.WSDL"))
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def start(self) -> str:
+        """
+        Start serving on a background thread.
+
+        Returns
+        -------
+        str
+            WITSML Store service endpoint.
+        """
+        self.__server = http.server.ThreadingHTTPServer((self.host, self.port), WitsmlStoreRequestHandler)
+        self.__server.daemon_threads = True
+        self.__server.emulator = self
+        threading.Thread(target=self.__server.serve_forever, daemon=True).start()
+        return self.url()
+
+    def stop(self):
+        "Stop serving."
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server = None
+
+    def url(self) -> str:
+        """
+        Get WITSML Store service endpoint.
+
+        Returns
+        -------
+        str
+            Endpoint URL or None if not started.
+        """
+        if self.__server is None:
+            return None
+        return f"http://{self.__server.server_address[0]}:{self.__server.server_address[1]}"
+
+    def is_authorized(self, authorization: str) -> bool:
+        """
+        Check HTTP basic authentication header.
+
+        Parameters
+        ----------
+        authorization: str
+            Value of 'Authorization' header.
+
+        Returns
+        -------
+        bool
+            True if authorized.
+        """
+        if self.username is None:
+            return True
+        expected = base64.b64encode(f"{self.username}:{self.password}".encode("utf-8")).decode("ascii")
+        return authorization == f"Basic {expected}"
+
+    def build_fault(self, fault_string: str) -> bytes:
+        """
+        Build SOAP fault envelope.
+
+        Parameters
+        ----------
+        fault_string: str
+            Fault message.
+
+        Returns
+        -------
+        bytes
+            UTF-8 encoded SOAP envelope.
+        """
+        return (
+            f'<soap:Envelope xmlns:soap="{soap.SOAP_ENVELOPE_NAMESPACE}"><soap:Body><soap:Fault>'
+            f"<faultcode>soap:Server</faultcode><faultstring>{escape(fault_string)}</faultstring>"
+            "</soap:Fault></soap:Body></soap:Envelope>"
+        ).encode("utf-8")
+
+    def handle_envelope(self, body: bytes) -> bytes:
+        """
+        Handle a WMLS function SOAP request envelope.
+
+        Parameters
+        ----------
+        body: bytes
+            SOAP request envelope.
+
+        Returns
+        -------
+        bytes
+            UTF-8 encoded SOAP reply envelope.
+        """
+        envelope = strip_namespace(ElementTree.fromstring(body))
+        request = envelope.find("Body")[0]
+        function = request.tag
+        part_dict = {part.tag: part.text or "" for part in request}
+        reply_dict = self.handle(function, part_dict)
+
+        # unknown function replies the error parts of the store functions
+        part_list = self.__response_part_dict.get(function, ["Result", "SuppMsgOut"])
+        reply = "".join(f"<{part}>{escape(str(reply_dict.get(part, '')))}</{part}>" for part in part_list)
+        return (
+            f'<soap:Envelope xmlns:soap="{soap.SOAP_ENVELOPE_NAMESPACE}"><soap:Body>'
+            f'<ns1:{function}Response xmlns:ns1="{soap.WITSML_MESSAGE_NAMESPACE}">{reply}</ns1:{function}Response>'
+            "</soap:Body></soap:Envelope>"
+        ).encode("utf-8")
+
+    def handle(self, function: str, part_dict: typing.Dict[str, str]) -> typing.Dict:
+        """
+        Handle a WMLS function call without HTTP.
+
+        Parameters
+        ----------
+        function: str
+            WMLS function name, e.g. 'WMLS_GetFromStore'.
+
+        part_dict: Dict[str, str]
+            Input parts of the function.
+
+        Returns
+        -------
+        Dict
+            Reply parts of the function.
+        """
+        self.request_count += 1
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        if function == "WMLS_GetVersion":
+            return {"Result": "1.3.1.1,1.4.1.1"}
+        if function == "WMLS_GetBaseMsg":
+            return {"Result": BASE_MESSAGE_DICT.get(int(part_dict.get("ReturnValueIn") or 0), "Unknown return value")}
+        if function == "WMLS_GetCap":
+            return {"Result": RESULT_SUCCESS, "CapabilitiesOut": self.build_capabilities(), "SuppMsgOut": ""}
+
+        if function not in STORE_FUNCTION_LIST:
+            return self.__error(ERROR_FUNCTION_NOT_SUPPORTED)
+
+        wml_type_in = part_dict.get("WMLtypeIn", "")
+        xml_in = part_dict.get("XMLin", part_dict.get("QueryIn", ""))
+        option_dict = dict(
+            option.split("=", 1) for option in part_dict.get("OptionsIn", "").split(";") if "=" in option
+        )
+        if wml_type_in not in SUPPORTED_DATA_OBJECT_LIST:
+            return self.__error(ERROR_DATA_OBJECT_NOT_SUPPORTED)
+        if self.max_request_size is not None and len(xml_in) > self.max_request_size:
+            return self.__error(ERROR_REQUEST_TOO_LARGE)
+        try:
+            query_list = list(strip_namespace(ElementTree.fromstring(xml_in)))
+        except ElementTree.ParseError:
+            return self.__error(ERROR_INVALID_XML)
+
+        with self.__lock:
+            if function == "WMLS_AddToStore":
+                return self.__add(wml_type_in, query_list)
+            if function == "WMLS_UpdateInStore":
+                return self.__update(wml_type_in, query_list)
+            if function == "WMLS_DeleteFromStore":
+                return self.__delete(wml_type_in, query_list)
+            return self.__get(wml_type_in, query_list, option_dict)
+
+    def build_capabilities(self) -> str:
+        """
+        Build WMLS_GetCap CapabilitiesOut reply.
+
+        Returns
+        -------
+        str
+            Capabilities XML string.
+        """
+        limit = ""
+        if self.max_data_nodes is not None:
+            limit += f' maxDataNodes="{self.max_data_nodes}"'
+        if self.max_data_points is not None:
+            limit += f' maxDataPoints="{self.max_data_points}"'
+        function = ""
+        for name in ["WMLS_AddToStore", "WMLS_DeleteFromStore", "WMLS_GetFromStore", "WMLS_UpdateInStore"]:
+            data_object = "".join(
+                f"<dataObject{limit if data_object == 'log' else ''}>{data_object}</dataObject>"
+                for data_object in SUPPORTED_DATA_OBJECT_LIST
+            )
+            function += f'<function name="{name}">{data_object}</function>'
+        function += '<function name="WMLS_GetVersion"/><function name="WMLS_GetCap"/>'
+        max_request_size = (
+            "" if self.max_request_size is None else f"<maxRequestSize>{self.max_request_size}</maxRequestSize>"
+        )
+        return (
+            f'<capServers xmlns="http://www.witsml.org/api/141" version="{WITSML_API_VERSION}">'
+            f'<capServer apiVers="{WITSML_API_VERSION}"><name>Jeng WITSML Store Emulator</name><vendor>Jeng</vendor>'
+            f"<version>{jeng.__version__}</version><schemaVersion>{generate.WITSML_VERSION}</schemaVersion>"
+            f"<maxRequestLatestValues>{self.max_data_nodes or 10000}</maxRequestLatestValues>"
+            "<supportUomConversion>false</supportUomConversion><compressionMethod>gzip</compressionMethod>"
+            f"{max_request_size}{function}</capServer></capServers>"
+        )
+
+    def __error(self, result: int) -> typing.Dict:
+        return {"Result": result, "XMLout": "", "SuppMsgOut": BASE_MESSAGE_DICT[result]}
+
+    def __key(self, wml_type_in: str, element: ElementTree.Element) -> typing.Tuple:
+        return tuple(element.attrib.get(uid, "") for uid in UID_ATTRIBUTE_DICT[wml_type_in])
+
+    def __match_key_list(self, wml_type_in: str, query: ElementTree.Element) -> typing.List[typing.Tuple]:
+        # empty or missing uid selects everything
+        query_key = self.__key(wml_type_in, query)
+        key_list = [
+            key
+            for key in self.__object_dict[wml_type_in]
+            if all(query_uid in ["", uid] for query_uid, uid in zip(query_key, key))
+        ]
+
+        # select data-object changed after dTimLastChange
+        last_change = query.findtext("commonData/dTimLastChange")
+        if last_change:
+            import pandas
+
+            last_change = pandas.Timestamp(last_change)
+            key_list = [
+                key
+                for key in key_list
+                if pandas.Timestamp(self.__object_dict[wml_type_in][key].findtext("commonData/dTimLastChange"))
+                > last_change
+            ]
+        return key_list
+
+    def __touch(self, element: ElementTree.Element, is_creation: bool = False):
+        common_data = element.find("commonData")
+        if common_data is None:
+            common_data = ElementTree.SubElement(element, "commonData")
+        now = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        for name in ["dTimCreation", "dTimLastChange"] if is_creation else ["dTimLastChange"]:
+            child = common_data.find(name)
+            if child is None:
+                child = ElementTree.SubElement(common_data, name)
+            child.text = now
+
+    def __is_data_exceeded(self, query: ElementTree.Element) -> bool:
+        row_count = len(query.findall("logData/data"))
+        curve_count = len((query.findtext("logData/mnemonicList") or "").split(","))
+        return (self.max_data_nodes is not None and row_count > self.max_data_nodes) or (
+            self.max_data_points is not None and row_count * curve_count > self.max_data_points
+        )
+
+    def __add(self, wml_type_in: str, query_list: typing.List[ElementTree.Element]) -> typing.Dict:
+        uid_list = []
+        for query in query_list:
+            key = self.__key(wml_type_in, query)
+            if key in self.__object_dict[wml_type_in]:
+                return self.__error(ERROR_DATA_OBJECT_UID_EXISTS)
+            if wml_type_in == "log" and self.__is_data_exceeded(query):
+                return self.__error(ERROR_MAX_DATA_EXCEEDED)
+
+            log_data = query.find("logData")
+            if log_data is not None:
+                query.remove(log_data)
+            self.__touch(query, is_creation=True)
+            self.__object_dict[wml_type_in][key] = query
+            if wml_type_in == "log":
+                self.__log_data_dict[key] = {
+                    "index_mnemonic": None,
+                    "unit_dict": {},
+                    "index_key_list": [],
+                    "row_dict": {},
+                }
+                if log_data is not None:
+                    self.__merge_log_data(key, log_data)
+            uid_list.append(key[-1])
+        return {"Result": RESULT_SUCCESS, "SuppMsgOut": ",".join(uid_list)}
+
+    def __update(self, wml_type_in: str, query_list: typing.List[ElementTree.Element]) -> typing.Dict:
+        for query in query_list:
+            key = self.__key(wml_type_in, query)
+            if key not in self.__object_dict[wml_type_in]:
+                return self.__error(ERROR_DATA_OBJECT_NOT_EXIST)
+            if wml_type_in == "log" and self.__is_data_exceeded(query):
+                return self.__error(ERROR_MAX_DATA_EXCEEDED)
+
+            stored = self.__object_dict[wml_type_in][key]
+            for child in query:
+                if child.tag == "logData":
+                    self.__merge_log_data(key, child)
+                elif child.tag == "logCurveInfo":
+                    # new curve is appended, existing curve is replaced
+                    existing = [item for item in stored.findall("logCurveInfo") if item.get("uid") == child.get("uid")]
+                    for item in existing:
+                        stored.remove(item)
+                    stored.append(child)
+                elif child.tag != "commonData":
+                    existing = stored.find(child.tag)
+                    if existing is not None:
+                        stored.remove(existing)
+                    stored.append(child)
+            self.__touch(stored)
+        return {"Result": RESULT_SUCCESS, "SuppMsgOut": ""}
+
+    def __delete(self, wml_type_in: str, query_list: typing.List[ElementTree.Element]) -> typing.Dict:
+        for query in query_list:
+            key = self.__key(wml_type_in, query)
+            if key not in self.__object_dict[wml_type_in]:
+                return self.__error(ERROR_DATA_OBJECT_NOT_EXIST)
+
+            # log with index range only deletes data within the range
+            if wml_type_in == "log" and self.__has_index_range(query):
+                log_data = self.__log_data_dict[key]
+                start, end = self.__index_range(key, query)
+                for index_key in log_data["index_key_list"][start:end]:
+                    del log_data["row_dict"][index_key]
+                del log_data["index_key_list"][start:end]
+                self.__touch(self.__object_dict[wml_type_in][key])
+                continue
+
+            del self.__object_dict[wml_type_in][key]
+            self.__log_data_dict.pop(key, None)
+        return {"Result": RESULT_SUCCESS, "SuppMsgOut": ""}
+
+    def __is_time_index(self, key: typing.Tuple) -> bool:
+        return self.__object_dict["log"][key].findtext("indexType") == "date time"
+
+    def __index_key(self, is_time_index: bool, index: str):
+        if is_time_index:
+            import pandas
+
+            timestamp = pandas.Timestamp(index)
+            if timestamp.tzinfo is None:
+                timestamp = timestamp.tz_localize("UTC")
+            return timestamp.value
+        return float(index)
+
+    def __merge_log_data(self, key: typing.Tuple, log_data: ElementTree.Element):
+        stored_log_data = self.__log_data_dict[key]
+        mnemonic_list = (log_data.findtext("mnemonicList") or "").split(",")
+        unit_list = (log_data.findtext("unitList") or "").split(",")
+        for mnemonic, unit in zip(mnemonic_list, unit_list):
+            stored_log_data["unit_dict"].setdefault(mnemonic, unit)
+        if stored_log_data["index_mnemonic"] is None:
+            stored_log_data["index_mnemonic"] = mnemonic_list[0]
+
+        is_time_index = self.__is_time_index(key)
+        for data in log_data.findall("data"):
+            value_list = (data.text or "").split(",")
+            index_key = self.__index_key(is_time_index, value_list[0])
+            row = stored_log_data["row_dict"].get(index_key)
+            if row is None:
+                bisect.insort(stored_log_data["index_key_list"], index_key)
+                row = {}
+                stored_log_data["row_dict"][index_key] = row
+            row.update(zip(mnemonic_list, value_list))
+
+    def __has_index_range(self, query: ElementTree.Element) -> bool:
+        return any(
+            query.findtext(name) for name in ["startIndex", "endIndex", "startDateTimeIndex", "endDateTimeIndex"]
+        )
+
+    def __index_range(self, key: typing.Tuple, query: ElementTree.Element) -> typing.Tuple[int, int]:
+        # position range of index_key_list within the inclusive query index range
+        index_key_list = self.__log_data_dict[key]["index_key_list"]
+        start_index = query.findtext("startDateTimeIndex") or query.findtext("startIndex")
+        end_index = query.findtext("endDateTimeIndex") or query.findtext("endIndex")
+        is_time_index = self.__is_time_index(key)
+        start = 0
+        if start_index:
+            start = bisect.bisect_left(index_key_list, self.__index_key(is_time_index, start_index))
+        end = len(index_key_list)
+        if end_index:
+            end = bisect.bisect_right(index_key_list, self.__index_key(is_time_index, end_index))
+        return start, end
+
+    def __update_index_header(self, key: typing.Tuple, element: ElementTree.Element):
+        stored_log_data = self.__log_data_dict[key]
+        index_key_list = stored_log_data["index_key_list"]
+        index_mnemonic = stored_log_data["index_mnemonic"]
+        if not index_key_list:
+            return
+        start_value = stored_log_data["row_dict"][index_key_list[0]].get(index_mnemonic, "")
+        end_value = stored_log_data["row_dict"][index_key_list[-1]].get(index_mnemonic, "")
+        if self.__is_time_index(key):
+            name_list = ["startDateTimeIndex", "endDateTimeIndex"]
+        else:
+            name_list = ["startIndex", "endIndex"]
+        for name, value in zip(name_list, [start_value, end_value]):
+            child = element.find(name)
+            if child is None:
+                child = ElementTree.SubElement(element, name)
+            child.text = value
+            if not self.__is_time_index(key):
+                child.set("uom", stored_log_data["unit_dict"].get(index_mnemonic, ""))
+
+    def __build_log_data(
+        self,
+        key: typing.Tuple,
+        query: ElementTree.Element,
+        option_dict: typing.Dict[str, str],
+    ) -> typing.Tuple[ElementTree.Element, bool]:
+        stored_log_data = self.__log_data_dict[key]
+        index_mnemonic = stored_log_data["index_mnemonic"]
+
+        # curve selection from query logCurveInfo or mnemonicList, index curve first
+        mnemonic_list = [
+            item.findtext("mnemonic") for item in query.findall("logCurveInfo") if item.findtext("mnemonic")
+        ]
+        if not mnemonic_list and query.findtext("logData/mnemonicList"):
+            mnemonic_list = query.findtext("logData/mnemonicList").split(",")
+        if not mnemonic_list:
+            mnemonic_list = list(stored_log_data["unit_dict"])
+        mnemonic_list = [index_mnemonic] + [
+            mnemonic
+            for mnemonic in mnemonic_list
+            if mnemonic != index_mnemonic and mnemonic in stored_log_data["unit_dict"]
+        ]
+
+        start, end = self.__index_range(key, query)
+        index_key_list = stored_log_data["index_key_list"][start:end]
+        if option_dict.get("requestLatestValues"):
+            index_key_list = index_key_list[-int(option_dict["requestLatestValues"]) :]
+
+        # skip row without any value of selected curves
+        data_list = []
+        for index_key in index_key_list:
+            row = stored_log_data["row_dict"][index_key]
+            value_list = [row.get(mnemonic, "") for mnemonic in mnemonic_list]
+            if any(value_list[1:]) or len(mnemonic_list) == 1:
+                data_list.append(",".join(value_list))
+
+        # truncate to store limit
+        max_row_list = [len(data_list)]
+        if self.max_data_nodes is not None:
+            max_row_list.append(self.max_data_nodes)
+        if self.max_data_points is not None:
+            max_row_list.append(max(1, self.max_data_points // len(mnemonic_list)))
+        is_truncated = min(max_row_list) < len(data_list)
+        data_list = data_list[: min(max_row_list)]
+
+        log_data = ElementTree.Element("logData")
+        ElementTree.SubElement(log_data, "mnemonicList").text = ",".join(mnemonic_list)
+        ElementTree.SubElement(log_data, "unitList").text = ",".join(
+            stored_log_data["unit_dict"].get(mnemonic, "") for mnemonic in mnemonic_list
+        )
+        for data in data_list:
+            ElementTree.SubElement(log_data, "data").text = data
+        return log_data, is_truncated
+
+    def __get(
+        self,
+        wml_type_in: str,
+        query_list: typing.List[ElementTree.Element],
+        option_dict: typing.Dict[str, str],
+    ) -> typing.Dict:
+        return_element = option_dict.get("returnElements", "requested")
+        root = ElementTree.Element(
+            f"{wml_type_in}s", {"xmlns": generate.WITSML_NAMESPACE, "version": generate.WITSML_VERSION}
+        )
+        is_truncated = False
+        for query in query_list:
+            for key in self.__match_key_list(wml_type_in, query):
+                stored = self.__object_dict[wml_type_in][key]
+                element = ElementTree.SubElement(root, wml_type_in, dict(stored.attrib))
+
+                # header (copied, reply header is updated below)
+                if return_element in ["all", "header-only"]:
+                    element.extend(copy.deepcopy(child) for child in stored)
+                elif return_element == "id-only":
+                    for name in NAME_ELEMENT_DICT[wml_type_in]:
+                        element.extend(copy.deepcopy(child) for child in stored.findall(name))
+                elif return_element == "requested":
+                    for child in query:
+                        if child.tag != "logData":
+                            element.extend(copy.deepcopy(item) for item in stored.findall(child.tag))
+                if wml_type_in == "log" and return_element in ["all", "header-only", "requested"]:
+                    self.__update_index_header(key, element)
+
+                # log data
+                is_log_data_requested = return_element in ["all", "data-only"] or (
+                    return_element == "requested" and query.find("logData") is not None
+                )
+                if wml_type_in == "log" and is_log_data_requested and self.__log_data_dict[key]["index_key_list"]:
+                    log_data, is_log_data_truncated = self.__build_log_data(key, query, option_dict)
+                    element.append(log_data)
+                    is_truncated = is_truncated or is_log_data_truncated
+
+        return {
+            "Result": RESULT_PARTIAL_SUCCESS if is_truncated else RESULT_SUCCESS,
+            "XMLout": ElementTree.tostring(root, encoding="unicode"),
+            "SuppMsgOut": BASE_MESSAGE_DICT[RESULT_PARTIAL_SUCCESS] if is_truncated else "",
+        }
@@ -31,3 +31,39 @@ class JengReplyContainsNoDataAndMnemonicException(KeyError):
 class JengReplyRowWithMismatchedColumnsException(ValueError):
     def __init__(self):
         super().__init__("Row with mismatched columns")
+
+
+class JengSoapFaultException(Exception):
+    def __init__(self, fault_string: str):
+        super().__init__(f"SOAP fault: {fault_string}")
+
+
+class JengBatchFunctionNotSupportedException(ValueError):
+    def __init__(self, function: str):
+        super().__init__(f"Batch function not supported: {function}")
+
+
+class JengReplyErrorException(Exception):
+    def __init__(self, result: int, supp_msg_out: str = None):
+        super().__init__(f"WITSML server replied error {result}: {supp_msg_out or ''}".rstrip(": "))
+        self.result = result
+        self.supp_msg_out = supp_msg_out
+
+    def __reduce__(self):
+        # copied with pandas attrs, e.g. jeng.fanout.FanOutClient.map_dataframe() errors
+        return self.__class__, (self.result, self.supp_msg_out)
+
+
+class JengWriterBufferFullException(TimeoutError):
+    def __init__(self, buffered_rows: int):
+        super().__init__(f"Log writer buffer is full ({buffered_rows} rows), WITSML server falls behind.")
+
+
+class JengEndpointTimeoutException(TimeoutError):
+    def __init__(self, endpoint: str, timeout: float):
+        super().__init__(f"Endpoint {endpoint} didn't reply within {timeout} seconds.")
+        self.endpoint = endpoint
+        self.timeout = timeout
+
+    def __reduce__(self):
+        return self.__class__, (self.endpoint, self.timeout)
@@ -0,0 +1,335 @@
+import concurrent.futures
+import time
+import typing
+from xml.etree import ElementTree
+
+from jeng import exception, generate, jeng, model
+
+# pandas is imported on first use to keep import fast
+if typing.TYPE_CHECKING:
+    import pandas
+
+# log list query, child elements select what is replied
+LOG_LIST_QUERY = (
+    '<log uidWell="" uidWellbore="" uid=""><nameWell/><nameWellbore/><name/>{object_growing}<indexType/>'
+    '<startIndex uom=""/><endIndex uom=""/><startDateTimeIndex/><endDateTimeIndex/></log>'
+)
+
+
+class FanOutClient:
+    """
+    A client of many WITSML servers (e.g. per region or vendor). The same call is sent to
+    every endpoint concurrently and results are returned tagged by endpoint, so a call
+    takes as long as the slowest endpoint rather than the sum of all of them.
+
+    Every endpoint has its own `jeng.jeng.WitsmlClient`, timeout, rate limit (applied to
+    every request of the client) and worker threads. An endpoint failure or timeout doesn't
+    stop the others, its exception is returned in the result instead. A timed out call is
+    abandoned, it ends in the background by the HTTP timeout of the endpoint and only
+    keeps a worker of its own endpoint busy. Calls still waiting for a worker when their
+    deadline passes are cancelled.
+
+    Parameters
+    ----------
+    endpoint_list: List[jeng.model.EndpointModel]
+        Endpoints with unique names.
+
+    timeout: float, default 60.0
+        Seconds to wait for a reply of an endpoint without its own timeout.
+
+    max_workers: int, default 4
+        Maximum number of calls in flight per endpoint.
+    """
+
+    def __init__(
+        self,
+        endpoint_list: typing.List[model.EndpointModel],
+        timeout: float = 60.0,
+        max_workers: int = 4,
+    ) -> None:
+        name_list = [endpoint.name for endpoint in endpoint_list]
+        if len(set(name_list)) != len(name_list):
+            raise ValueError("Endpoint names must be unique.")
+        self.endpoint_list = endpoint_list
+        self.timeout = timeout
+        self.__client_dict = {endpoint.name: jeng.WitsmlClient() for endpoint in endpoint_list}
+        self.__executor_dict = {
+            endpoint.name: concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix=f"jeng-fanout-{endpoint.name}",
+            )
+            for endpoint in endpoint_list
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __endpoint_timeout(self, endpoint: model.EndpointModel) -> float:
+        return self.timeout if endpoint.timeout is None else endpoint.timeout
+
+    def __timeout_result(self, endpoint: model.EndpointModel, elapsed: float) -> model.FanOutResultModel:
+        return model.FanOutResultModel(
+            endpoint=endpoint.name,
+            error=exception.JengEndpointTimeoutException(endpoint.name, self.__endpoint_timeout(endpoint)),
+            elapsed=elapsed,
+        )
+
+    def __call(
+        self,
+        endpoint: model.EndpointModel,
+        function: typing.Callable[[model.EndpointModel, jeng.WitsmlClient], typing.Any],
+        deadline: float,
+    ) -> model.FanOutResultModel:
+        # the caller gave up waiting, don't start late work
+        if time.monotonic() >= deadline:
+            return self.__timeout_result(endpoint, 0.0)
+        begin = time.perf_counter()
+        try:
+            reply = function(endpoint, self.__client_dict[endpoint.name])
+        except Exception as e:
+            return model.FanOutResultModel(endpoint=endpoint.name, error=e, elapsed=time.perf_counter() - begin)
+        return model.FanOutResultModel(endpoint=endpoint.name, reply=reply, elapsed=time.perf_counter() - begin)
+
+    def __fan_out(
+        self,
+        function: typing.Callable[[model.EndpointModel, jeng.WitsmlClient], typing.Any],
+        name_list: typing.List[str] = None,
+    ) -> typing.List[model.FanOutResultModel]:
+        endpoint_list = [endpoint for endpoint in self.endpoint_list if name_list is None or endpoint.name in name_list]
+        # every endpoint has its own deadline from the start of the fan-out
+        begin = time.monotonic()
+        deadline_list = [begin + self.__endpoint_timeout(endpoint) for endpoint in endpoint_list]
+        future_list = [
+            self.__executor_dict[endpoint.name].submit(self.__call, endpoint, function, deadline)
+            for endpoint, deadline in zip(endpoint_list, deadline_list)
+        ]
+
+        result_list = []
+        for endpoint, future, deadline in zip(endpoint_list, future_list, deadline_list):
+            try:
+                result_list.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+            except concurrent.futures.TimeoutError:
+                future.cancel()
+                result_list.append(self.__timeout_result(endpoint, time.monotonic() - begin))
+        return result_list
+
+    def connect(self) -> typing.Dict[str, bool]:
+        """
+        Connect to every endpoint concurrently.
+
+        Returns
+        -------
+        Dict[str, bool]
+            Status of the connection (True is OK) by endpoint name.
+        """
+
+        def connect(endpoint: model.EndpointModel, client: jeng.WitsmlClient) -> bool:
+            return client.connect(
+                url=endpoint.url,
+                username=endpoint.username,
+                password=endpoint.password,
+                is_raw=endpoint.is_raw,
+                timeout=self.__endpoint_timeout(endpoint),
+                max_rate=endpoint.max_rate,
+            )
+
+        return {result.endpoint: result.error is None and bool(result.reply) for result in self.__fan_out(connect)}
+
+    def client(self, name: str) -> jeng.WitsmlClient:
+        """
+        Get the client of an endpoint.
+
+        Parameters
+        ----------
+        name: str
+            Endpoint name.
+
+        Returns
+        -------
+        jeng.jeng.WitsmlClient
+            Client of the endpoint.
+        """
+        return self.__client_dict[name]
+
+    def map(
+        self,
+        function: typing.Callable[[jeng.WitsmlClient], typing.Any],
+        name_list: typing.List[str] = None,
+    ) -> typing.List[model.FanOutResultModel]:
+        """
+        Call a function with the client of every endpoint concurrently, e.g.
+        `lambda client: client.get_log_data(log_basic_info)`.
+
+        Parameters
+        ----------
+        function: Callable[[jeng.jeng.WitsmlClient], Any]
+            Function of a connected client, its return value is the result reply.
+
+        name_list: List[str], default None
+            Endpoints to be called. If set None, every endpoint is called.
+
+        Returns
+        -------
+        List[jeng.model.FanOutResultModel]
+            Results in the same order as the endpoints.
+        """
+        return self.__fan_out(lambda endpoint, client: function(client), name_list)
+
+    def get_from_store(
+        self,
+        wml_type_in: str,
+        xml_in: str,
+        return_element: str,
+        request_latest_values: int = None,
+        name_list: typing.List[str] = None,
+    ) -> typing.List[model.FanOutResultModel]:
+        """
+        Execute WMLS_GetFromStore on every endpoint concurrently (see
+        `jeng.jeng.WitsmlClient.get_from_store()`).
+
+        Parameters
+        ----------
+        wml_type_in: str
+            WITSML data-object type (see the specific WITSML data schema for the objectType).
+
+        xml_in: str
+            A query template that specifies the data-object to be returned.
+
+        return_element: str
+            Indicates which elements and attributes are requested to be returned.
+
+        request_latest_values: int, default None
+            Return only the latest N values of each curve.
+
+        name_list: List[str], default None
+            Endpoints to be called. If set None, every endpoint is called.
+
+        Returns
+        -------
+        List[jeng.model.FanOutResultModel]
+            Results with WITSML replies in the same order as the endpoints.
+        """
+        return self.map(
+            lambda client: client.get_from_store(
+                wml_type_in=wml_type_in,
+                xml_in=xml_in,
+                return_element=return_element,
+                request_latest_values=request_latest_values,
+            ),
+            name_list,
+        )
+
+    def map_dataframe(
+        self,
+        function: typing.Callable[[jeng.WitsmlClient], "pandas.DataFrame"],
+        name_list: typing.List[str] = None,
+    ) -> "pandas.DataFrame":
+        """
+        Call a function returning pandas.DataFrame with the client of every endpoint
+        concurrently and merge the results, tagged by an 'endpoint' column. Exceptions of
+        failed endpoints are set into `dataframe.attrs["error_dict"]` by endpoint name.
+
+        Parameters
+        ----------
+        function: Callable[[jeng.jeng.WitsmlClient], pandas.DataFrame]
+            Function of a connected client.
+
+        name_list: List[str], default None
+            Endpoints to be called. If set None, every endpoint is called.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Merged results with 'endpoint' as first column.
+        """
+        import pandas
+
+        dataframe_list = []
+        error_dict = {}
+        for result in self.map(function, name_list):
+            if result.error is not None:
+                error_dict[result.endpoint] = result.error
+            elif result.reply is not None:
+                dataframe_list.append(result.reply.assign(endpoint=result.endpoint))
+        if dataframe_list:
+            dataframe = pandas.concat(dataframe_list, ignore_index=True)
+            dataframe = dataframe[["endpoint"] + [column for column in dataframe.columns if column != "endpoint"]]
+        else:
+            dataframe = pandas.DataFrame(columns=["endpoint"])
+        dataframe.attrs["error_dict"] = error_dict
+        return dataframe
+
+    def get_log_list(self, is_growing: bool = None, name_list: typing.List[str] = None) -> "pandas.DataFrame":
+        """
+        List logs of every endpoint with one request each, e.g. all active (growing) logs
+        across servers.
+
+        Parameters
+        ----------
+        is_growing: bool, default None
+            Select logs by objectGrowing. If set None, every log is listed.
+
+        name_list: List[str], default None
+            Endpoints to be called. If set None, every endpoint is called.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Logs with 'endpoint', 'uidWell', 'uidWellbore', 'uid', 'nameWell',
+            'nameWellbore', 'name', 'objectGrowing', 'indexType', 'startIndex' and
+            'endIndex' columns. Failed endpoints are in `dataframe.attrs["error_dict"]`.
+        """
+        import pandas
+
+        object_growing = "<objectGrowing/>"
+        if is_growing is not None:
+            object_growing = f"<objectGrowing>{str(is_growing).lower()}</objectGrowing>"
+        query = (
+            f'<logs xmlns="{generate.WITSML_NAMESPACE}" version="{generate.WITSML_VERSION}">'
+            f"{LOG_LIST_QUERY.format(object_growing=object_growing)}</logs>"
+        )
+        column_list = [
+            "uidWell",
+            "uidWellbore",
+            "uid",
+            "nameWell",
+            "nameWellbore",
+            "name",
+            "objectGrowing",
+            "indexType",
+            "startIndex",
+            "endIndex",
+        ]
+
+        def get_log_list(client: jeng.WitsmlClient) -> "pandas.DataFrame":
+            reply = client.get_from_store(wml_type_in="log", xml_in=query, return_element="requested")
+            if reply.Result < 1:
+                raise exception.JengReplyErrorException(reply.Result, reply.SuppMsgOut)
+            row_list = []
+            xml_out = reply.XMLout.tobytes() if isinstance(reply.XMLout, memoryview) else reply.XMLout
+            for element in ElementTree.fromstring(xml_out).findall("{*}log") if xml_out else []:
+                row_list.append(
+                    [element.get(name) for name in column_list[:3]]
+                    + [element.findtext(f"{{*}}{name}") for name in column_list[3:8]]
+                    + [
+                        element.findtext("{*}startDateTimeIndex") or element.findtext("{*}startIndex"),
+                        element.findtext("{*}endDateTimeIndex") or element.findtext("{*}endIndex"),
+                    ]
+                )
+            dataframe = pandas.DataFrame(row_list, columns=column_list)
+            if is_growing is not None:
+                # in case the server doesn't select by objectGrowing
+                dataframe = dataframe[dataframe["objectGrowing"] == str(is_growing).lower()]
+            return dataframe
+
+        return self.map_dataframe(get_log_list, name_list)
+
+    def close(self):
+        """
+        Stop the worker threads, abandoned calls end in the background.
+        """
+        for executor in self.__executor_dict.values():
+            executor.shutdown(wait=False)
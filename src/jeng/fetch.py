@@ -0,0 +1,364 @@
+import time
+import typing
+
+from jeng import adaptive, exception, generate, metric, model, parse
+
+# pandas is imported on first use to keep import fast
+if typing.TYPE_CHECKING:
+    import pandas
+
+    from jeng import jeng
+
+# the first window of a windowed fetch is this fraction of the index range, widened until
+# a reply learns the row density
+PROBE_WINDOW_COUNT = 1000
+
+
+def get_index_curve(log_curve_info_list: typing.List[model.LogCurveInfoModel]) -> model.LogCurveInfoModel:
+    """
+    Get the index curve of log curve info list.
+
+    Parameters
+    ----------
+    log_curve_info_list: List[jeng.model.LogCurveInfoModel]
+        A list of curve info.
+
+    Returns
+    -------
+    jeng.model.LogCurveInfoModel
+        Index curve info.
+    """
+    index_curve_list = [curve_info for curve_info in log_curve_info_list if curve_info.is_index_curve]
+    if len(index_curve_list) == 0:
+        raise exception.JengIndexCurveNotDefinedException
+    if len(index_curve_list) > 1:
+        raise exception.JengMultipleIndexCurveDefinedException
+    return index_curve_list[0]
+
+
+def index_key(index_series: "pandas.Series", index_type: model.LogIndexTypeEnum) -> "pandas.Series":
+    """
+    Convert log index values into sortable float keys: seconds since epoch (UTC) for time
+    index, the numeric value for non-time index.
+
+    Parameters
+    ----------
+    index_series: pandas.Series
+        Log index values as replied by WITSML server.
+
+    index_type: jeng.model.LogIndexTypeEnum
+        Type of log index: time or non-time index.
+
+    Returns
+    -------
+    pandas.Series
+        Float index keys.
+    """
+    import pandas
+
+    if index_type == model.LogIndexTypeEnum.TIME:
+        timestamp_series = pandas.to_datetime(index_series, utc=True, format="ISO8601")
+        return (timestamp_series - pandas.Timestamp(0, tz="UTC")) / pandas.Timedelta(seconds=1)
+    return pandas.to_numeric(index_series).astype(float)
+
+
+def index_key_value(index: str, index_type: model.LogIndexTypeEnum) -> float:
+    """
+    Convert a single log index value into sortable float key (see `jeng.fetch.index_key()`).
+
+    Parameters
+    ----------
+    index: str
+        Log index value.
+
+    index_type: jeng.model.LogIndexTypeEnum
+        Type of log index: time or non-time index.
+
+    Returns
+    -------
+    float
+        Index key.
+    """
+    import pandas
+
+    return float(index_key(pandas.Series([index]), index_type).iloc[0])
+
+
+def iter_log_data(
+    client: "jeng.WitsmlClient",
+    log_basic_info: model.LogBasicInfoModel,
+    log_curve_info_list: typing.List[model.LogCurveInfoModel],
+    log_index: model.LogIndexModel = None,
+    sizer: adaptive.RequestSizer = None,
+) -> typing.Iterator["pandas.DataFrame"]:
+    """
+    Fetch log data of an index range, following server truncation (partial success) with
+    follow-up requests that start from the last received index.
+
+    With a sizer and a closed index range, the range is fetched in index windows sized
+    from the learned rows per request and the row density of previous replies, so every
+    request stays near the target latency. The first window is a small probe (see
+    `PROBE_WINDOW_COUNT`), doubled while replies are too small to learn the density.
+    Windows never exceed the rows per request advertised by the server capabilities
+    (maxDataNodes and maxDataPoints).
+
+    Parameters
+    ----------
+    client: jeng.jeng.WitsmlClient
+        Connected client.
+
+    log_basic_info: jeng.model.LogBasicInfoModel
+        Well, wellbore and log information of the log.
+
+    log_curve_info_list: List[jeng.model.LogCurveInfoModel]
+        A list of curve info to be fetched. The index curve is required.
+
+    log_index: jeng.model.LogIndexModel, default None
+        Index range to be fetched. If set None, the whole log is fetched as time log.
+
+    sizer: jeng.adaptive.RequestSizer, default None
+        Learns rows per request from latency and truncation of every request.
+
+    Returns
+    -------
+    Iterator[pandas.DataFrame]
+        Generator of data chunks (one per reply) in index order, mnemonic as column name.
+    """
+    if log_index is None:
+        log_index = model.LogIndexModel(start=None, end=None)
+    index_mnemonic = get_index_curve(log_curve_info_list).mnemonic
+    curve_count = len(log_curve_info_list)
+    max_rows = None
+    capabilities = client.capabilities()
+    if capabilities is not None:
+        max_rows = capabilities.get_max_rows("WMLS_GetFromStore", "log", curve_count)
+    is_windowed = sizer is not None and log_index.start is not None and log_index.end is not None
+    end_key = index_key_value(log_index.end, log_index.type) if is_windowed else None
+
+    start = log_index.start
+    last_key = None
+    span = None
+    if is_windowed:
+        span = (end_key - index_key_value(start, log_index.type)) / PROBE_WINDOW_COUNT
+    follow_up_count = 0
+    while True:
+        # window of the learned span (the first request probes the row density)
+        end = log_index.end
+        window_end_key = None
+        if span is not None and index_key_value(start, log_index.type) + span < end_key:
+            window_end_key = index_key_value(start, log_index.type) + span
+            end = __format_index(window_end_key, log_index.type)
+
+        query = generate.generate_log_query(
+            log_basic_info=log_basic_info,
+            log_curve_info_list=log_curve_info_list,
+            log_index=model.LogIndexModel(start=start, end=end, type=log_index.type),
+            is_include_log_curve_info=False,
+            is_include_mnemonic_list=True,
+        )
+        begin = time.perf_counter()
+        with metric.retrying(follow_up_count):
+            reply = client.get_from_store(wml_type_in="log", xml_in=query, return_element="data-only")
+        latency = time.perf_counter() - begin
+        if reply.Result < 1:
+            if sizer is not None:
+                sizer.observe(client.url(), adaptive.OPERATION_GET, 0, latency, is_error=True, curve_count=curve_count)
+            raise exception.JengReplyErrorException(reply.Result, reply.SuppMsgOut)
+
+        dataframe = None
+        if reply.XMLout:
+            try:
+                dataframe = parse.parse_log_into_dataframe(xml_out=reply.XMLout)
+            except exception.JengReplyContainsNoDataAndMnemonicException:
+                dataframe = None
+        row_count = 0 if dataframe is None else len(dataframe.index)
+        if sizer is not None:
+            sizer.observe(
+                client.url(),
+                adaptive.OPERATION_GET,
+                row_count,
+                latency,
+                is_truncated=reply.Result == 2,
+                byte_count=len(reply.XMLout) if reply.XMLout else 0,
+                curve_count=curve_count,
+            )
+
+        # start index is inclusive, drop the row already received by the previous request
+        key_series = None
+        if row_count > 0:
+            key_series = index_key(dataframe[index_mnemonic], log_index.type)
+            if last_key is not None:
+                dataframe = dataframe[(key_series > last_key).to_numpy()].reset_index(drop=True)
+                key_series = key_series[key_series > last_key].reset_index(drop=True)
+        if dataframe is not None and not dataframe.empty:
+            yield dataframe
+            last_key = float(key_series.iloc[-1])
+        elif reply.Result == 2 or not is_windowed:
+            return
+
+        if is_windowed:
+            # rows per index key of this reply sizes the next window
+            if key_series is not None and len(key_series.index) > 1 and key_series.iloc[-1] > key_series.iloc[0]:
+                density = (len(key_series.index) - 1) / (key_series.iloc[-1] - key_series.iloc[0])
+                rows = sizer.rows(client.url(), adaptive.OPERATION_GET, curve_count)
+                span = (rows if max_rows is None else min(rows, max_rows)) / density
+            elif span is not None:
+                span *= 2
+        if reply.Result == 2:
+            start = str(dataframe[index_mnemonic].iloc[-1])
+            follow_up_count += 1
+        elif window_end_key is not None:
+            start = __format_index(window_end_key, log_index.type)
+            follow_up_count = 0
+        else:
+            return
+
+
+def __format_index(key: float, index_type: model.LogIndexTypeEnum) -> str:
+    import pandas
+
+    if index_type == model.LogIndexTypeEnum.TIME:
+        return pandas.Timestamp(key, unit="s", tz="UTC").isoformat()
+    return repr(float(key))
+
+
+def __get_window_list(
+    client: "jeng.WitsmlClient",
+    query_list: typing.List[str],
+    request_latest_values: int,
+    max_workers: int,
+) -> typing.List[typing.Tuple[str, "pandas.DataFrame"]]:
+    # (query, replied data or None) of every window query, requested concurrently
+    operation_list = [
+        model.BatchOperationModel(
+            function="get_from_store",
+            wml_type_in="log",
+            xml_in=query,
+            return_element="data-only",
+            request_latest_values=request_latest_values,
+        )
+        for query in query_list
+    ]
+    window_list = []
+    for result in client.batch(operation_list, max_workers=max_workers):
+        if result.error is not None:
+            raise result.error
+        if result.reply.Result < 1:
+            raise exception.JengReplyErrorException(result.reply.Result, result.reply.SuppMsgOut)
+        dataframe = None
+        if result.reply.XMLout:
+            try:
+                dataframe = parse.parse_log_into_dataframe(xml_out=result.reply.XMLout)
+            except exception.JengReplyContainsNoDataAndMnemonicException:
+                dataframe = None
+        window_list.append((result.operation.xml_in, dataframe))
+    return window_list
+
+
+def get_log_decimated(
+    client: "jeng.WitsmlClient",
+    log_basic_info: model.LogBasicInfoModel,
+    log_curve_info_list: typing.List[model.LogCurveInfoModel],
+    log_index: model.LogIndexModel,
+    point_count: int = 2000,
+    window_count: int = 50,
+    method: str = "lttb",
+    max_workers: int = 4,
+) -> "pandas.DataFrame":
+    """
+    Fetch a downsampled view of log data for visualization. The index range is split into
+    windows fetched concurrently with at most two requests each (no follow-up requests for
+    truncated replies), then decimated locally (see `jeng.decimate.decimate()`). The number
+    and size of requests is bounded regardless of the log length.
+
+    If the server supports 'requestLatestValues', each window first requests one more
+    latest value than its share of the points. A window replying no more than its share
+    is complete. A denser window is fetched again without 'requestLatestValues', since
+    its latest values only cover the end of the window. A window without the capability,
+    or fetched again, is as large as the server replies.
+
+    Parameters
+    ----------
+    client: jeng.jeng.WitsmlClient
+        Connected client.
+
+    log_basic_info: jeng.model.LogBasicInfoModel
+        Well, wellbore and log information of the log.
+
+    log_curve_info_list: List[jeng.model.LogCurveInfoModel]
+        A list of curve info to be fetched. The index curve is required.
+
+    log_index: jeng.model.LogIndexModel
+        Index range to be plotted. Both start and end are required.
+
+    point_count: int, default 2000
+        Maximum number of rows, shared evenly by the numeric curves.
+
+    window_count: int, default 50
+        Number of windowed requests over the index range.
+
+    method: str, default 'lttb'
+        Decimation method: 'lttb' or 'min-max'.
+
+    max_workers: int, default 4
+        Maximum number of windowed requests in flight.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Decimated data with mnemonic as column name.
+    """
+    import math
+
+    import pandas
+
+    from jeng import decimate
+
+    if log_index.start is None or log_index.end is None:
+        raise ValueError("Both start and end of log_index are required.")
+    index_mnemonic = get_index_curve(log_curve_info_list).mnemonic
+
+    # oversample the windows, decimation picks the points that matter
+    request_latest_values = None
+    window_rows = math.ceil(2 * point_count / window_count)
+    capabilities = client.capabilities()
+    if capabilities is not None and (capabilities.max_request_latest_values or 0) > window_rows:
+        request_latest_values = window_rows + 1
+
+    start_key = index_key_value(log_index.start, log_index.type)
+    end_key = index_key_value(log_index.end, log_index.type)
+    boundary_list = [log_index.start]
+    for number in range(1, window_count):
+        boundary_list.append(__format_index(start_key + (end_key - start_key) * number / window_count, log_index.type))
+    boundary_list.append(log_index.end)
+
+    query_list = [
+        generate.generate_log_query(
+            log_basic_info=log_basic_info,
+            log_curve_info_list=log_curve_info_list,
+            log_index=model.LogIndexModel(start=start, end=end, type=log_index.type),
+            is_include_log_curve_info=False,
+            is_include_mnemonic_list=True,
+        )
+        for start, end in zip(boundary_list[:-1], boundary_list[1:])
+    ]
+    window_list = __get_window_list(client, query_list, request_latest_values, max_workers)
+    if request_latest_values is not None:
+        # latest values of a dense window are only its end, the whole window is fetched
+        dense_query_list = [
+            query for query, dataframe in window_list if dataframe is not None and len(dataframe.index) > window_rows
+        ]
+        if dense_query_list:
+            dense_dict = dict(__get_window_list(client, dense_query_list, None, max_workers))
+            window_list = [(query, dense_dict.get(query, dataframe)) for query, dataframe in window_list]
+    dataframe_list = [dataframe for _, dataframe in window_list if dataframe is not None]
+
+    column_list = [curve_info.mnemonic for curve_info in log_curve_info_list]
+    if not dataframe_list:
+        return pandas.DataFrame(columns=column_list)
+
+    # window boundaries are inclusive on both sides
+    dataframe = pandas.concat(dataframe_list, ignore_index=True)
+    dataframe = dataframe.assign(__key=index_key(dataframe[index_mnemonic], log_index.type))
+    dataframe = dataframe.drop_duplicates("__key").sort_values("__key").drop(columns="__key")
+    return decimate.decimate(dataframe, index_mnemonic, log_index.type, point_count, method)
@@ -1,9 +1,10 @@
 import typing
 
-import pandas
-import xmltodict
+from jeng import exception, metric, model
 
-from jeng import exception, model
+# pandas and xmltodict are imported on first use to keep import fast
+if typing.TYPE_CHECKING:
+    import pandas
 
 WITSML_NAMESPACE = "http://www.witsml.org/schemas/1series"  # NOSONAR: It's a XML namespace
 WITSML_VERSION = "1.4.1.1"  # NOSONAR: It's a version, not a hardcoded IP address
@@ -35,10 +36,11 @@ def __prepare_log_curve_info(log_curve_info_list: typing.List[model.LogCurveInfo
 
 def __prepare_dataframe_index(
     log_curve_info_list: typing.List[model.LogCurveInfoModel],
-    dataframe: pandas.DataFrame,
+    dataframe: "pandas.DataFrame",
     log_curve_index: int,
-) -> pandas.DataFrame:
-    dataframe = dataframe[:].astype(str)
+) -> "pandas.DataFrame":
+    # missing values are written as 'nan' whatever the pandas version
+    dataframe = dataframe[:].astype(str).fillna("nan")
     if dataframe.index.name != log_curve_info_list[log_curve_index].uid:
         if log_curve_info_list[log_curve_index].uid not in dataframe.columns.values.tolist():
             raise exception.JengIndexCurveNotExistInDataFrameException
@@ -48,7 +50,7 @@ def __prepare_dataframe_index(
 
 def __prepare_log_data_list(
     log_curve_info_list: typing.List[model.LogCurveInfoModel],
-    dataframe: pandas.DataFrame,
+    dataframe: "pandas.DataFrame",
     log_curve_index: int,
 ):
     # generate mnemonic list
@@ -71,12 +73,44 @@ def __prepare_log_data_list(
     return mnemonic_list, unit_list, data_list
 
 
+def __compact_dataframe(dataframe: "pandas.DataFrame", null_value_list: typing.List[str]) -> "pandas.DataFrame":
+    # missing values become empty, curves and rows without any value are left out
+    is_null = dataframe.isin(["", "nan", "None"] + list(null_value_list or []))
+    dataframe = dataframe.mask(is_null, "")
+    is_null_column = is_null.all(axis=0)
+    dataframe = dataframe.loc[:, ~is_null_column]
+    return dataframe[~is_null.loc[:, ~is_null_column].all(axis=1)]
+
+
+def __prepare_compact_log_data_list(
+    log_curve_info_list: typing.List[model.LogCurveInfoModel],
+    dataframe: "pandas.DataFrame",
+    log_curve_index: int,
+):
+    # same as __prepare_log_data_list(), rows are joined column by column
+    import pandas
+
+    mnemonic_list = [log_curve_info_list[log_curve_index].mnemonic] + dataframe.columns.values.tolist()
+    unit_dict = {curve_info.mnemonic: curve_info.unit for curve_info in log_curve_info_list}
+    if any(column not in unit_dict for column in dataframe.columns):
+        raise exception.JengColumnCountNotMatchException
+    unit_list = [log_curve_info_list[log_curve_index].unit] + [unit_dict[column] for column in dataframe.columns]
+
+    data_series = pandas.Series(dataframe.index.map(str), index=dataframe.index, dtype=object)
+    for column in dataframe.columns:
+        data_series = data_series + "," + dataframe[column].astype(object)
+    return mnemonic_list, unit_list, data_series.tolist()
+
+
 def generate_log_query(
     log_basic_info: model.LogBasicInfoModel,
     log_curve_info_list: typing.List[model.LogCurveInfoModel] = None,
-    dataframe: pandas.DataFrame = None,
+    dataframe: "pandas.DataFrame" = None,
     log_index: model.LogIndexModel = None,
     is_include_log_curve_info: bool = True,
+    is_include_mnemonic_list: bool = False,
+    is_compact: bool = False,
+    null_value_list: typing.List[str] = None,
 ) -> str:
     """
     Generate 'log' query using pandas.DataFrame(). Not recommended for generating log
@@ -100,18 +134,36 @@ def generate_log_query(
 
     log_index: jeng.model.LogIndexModel, default None
         Specify interval required for getting data from WITSML Store. Compatible for both
-        time and non-time interval type.
+        time and non-time interval type. Set start or end to None for an open-ended interval.
 
     is_include_log_curve_info: bool, default True
         WITSML query have maximum character limitation and varies between WITSML server.
         It's recommended to include log curve info for creating log and exclude them for
         updating and getting data.
 
+    is_include_mnemonic_list: bool, default False
+        Select curves of log curve info list with logData mnemonicList instead of
+        logCurveInfo, if no dataframe is set. It's recommended for getting data-only
+        without repeating log curve info.
+
+    is_compact: bool, default False
+        Compact encoding for sparse data: missing values (and null_value_list) are written
+        as empty fields, curves without any value are left out of mnemonicList and
+        unitList, and rows without any curve value are left out. If no row is left,
+        logData is left out.
+
+    null_value_list: List[str], default None
+        Values to be treated as missing by compact encoding, e.g. ['-999.25'].
+
     Returns
     -------
     str
         Log query ready to be executed.
     """
+    import xmltodict
+
+    operation_metric = metric.begin("generate_log_query")
+
     # prepare basic log curve
     all_dict = {
         "logs": {
@@ -138,18 +190,23 @@ def generate_log_query(
 
         # prepare log index
         if log_index is not None:
+            # open-ended interval (start or end set None) is omitted from the query
             if log_index.type == model.LogIndexTypeEnum.TIME:
-                all_dict["logs"]["log"]["startDateTimeIndex"] = log_index.start
-                all_dict["logs"]["log"]["endDateTimeIndex"] = log_index.end
+                if log_index.start is not None:
+                    all_dict["logs"]["log"]["startDateTimeIndex"] = log_index.start
+                if log_index.end is not None:
+                    all_dict["logs"]["log"]["endDateTimeIndex"] = log_index.end
             elif log_index.type == model.LogIndexTypeEnum.NON_TIME:
-                all_dict["logs"]["log"]["startIndex"] = {
-                    "#text": log_index.start,
-                    "@uom": log_curve_info_list[log_curve_index].unit,
-                }
-                all_dict["logs"]["log"]["endIndex"] = {
-                    "#text": log_index.end,
-                    "@uom": log_curve_info_list[log_curve_index].unit,
-                }
+                if log_index.start is not None:
+                    all_dict["logs"]["log"]["startIndex"] = {
+                        "#text": log_index.start,
+                        "@uom": log_curve_info_list[log_curve_index].unit,
+                    }
+                if log_index.end is not None:
+                    all_dict["logs"]["log"]["endIndex"] = {
+                        "#text": log_index.end,
+                        "@uom": log_curve_info_list[log_curve_index].unit,
+                    }
 
         # prepare dataframe
         if dataframe is not None and not dataframe.empty:
@@ -160,19 +217,295 @@ def generate_log_query(
             )
 
             # generate log data list
-            mnemonic_list, unit_list, data_list = __prepare_log_data_list(
-                log_curve_info_list=log_curve_info_list,
-                log_curve_index=log_curve_index,
-                dataframe=dataframe,
-            )
+            if is_compact:
+                dataframe = __compact_dataframe(dataframe, null_value_list)
+                mnemonic_list, unit_list, data_list = __prepare_compact_log_data_list(
+                    log_curve_info_list=log_curve_info_list,
+                    log_curve_index=log_curve_index,
+                    dataframe=dataframe,
+                )
+            else:
+                mnemonic_list, unit_list, data_list = __prepare_log_data_list(
+                    log_curve_info_list=log_curve_info_list,
+                    log_curve_index=log_curve_index,
+                    dataframe=dataframe,
+                )
 
-            all_dict["logs"]["log"]["logData"] = (
-                {
-                    "mnemonicList": ",".join(mnemonic_list),
-                    "unitList": ",".join(unit_list),
-                    "data": data_list,
-                },
-            )
+            if data_list:
+                all_dict["logs"]["log"]["logData"] = (
+                    {
+                        "mnemonicList": ",".join(mnemonic_list),
+                        "unitList": ",".join(unit_list),
+                        "data": data_list,
+                    },
+                )
+        elif is_include_mnemonic_list:
+            mnemonic_list = [log_curve_info_list[log_curve_index].mnemonic] + [
+                curve_info.mnemonic
+                for position, curve_info in enumerate(log_curve_info_list)
+                if position != log_curve_index
+            ]
+            all_dict["logs"]["log"]["logData"] = {"mnemonicList": ",".join(mnemonic_list)}
 
     # generate log data
-    return xmltodict.unparse(all_dict, full_document=False)
+    query = xmltodict.unparse(all_dict, full_document=False)
+    if operation_metric is not None:
+        log_data = all_dict["logs"]["log"].get("logData")
+        metric.end(
+            operation_metric,
+            byte_out=len(query),
+            row_count=len(log_data[0]["data"]) if isinstance(log_data, tuple) else 0,
+            curve_count=len(log_curve_info_list) if log_curve_info_list else 0,
+        )
+    return query
+
+
+# child elements of growing object stations in schema order, with default unit of measure
+TRAJECTORY_STATION_ELEMENT_LIST = [
+    ("dTimStn", None),
+    ("typeTrajStation", None),
+    ("typeSurveyTool", None),
+    ("calcAlgorithm", None),
+    ("md", "m"),
+    ("tvd", "m"),
+    ("incl", "dega"),
+    ("azi", "dega"),
+    ("mtf", "dega"),
+    ("gtf", "dega"),
+    ("dispNs", "m"),
+    ("dispEw", "m"),
+    ("vertSect", "m"),
+    ("dls", "dega/30m"),
+    ("rateTurn", "dega/30m"),
+    ("rateBuild", "dega/30m"),
+    ("mdDelta", "m"),
+    ("tvdDelta", "m"),
+    ("gravTotalUncert", "m/s2"),
+    ("dipAngleUncert", "dega"),
+    ("magTotalUncert", "nT"),
+    ("statusTrajStation", None),
+]
+GEOLOGY_INTERVAL_ELEMENT_LIST = [
+    ("typeLithology", None),
+    ("mdTop", "m"),
+    ("mdBottom", "m"),
+    ("dTim", None),
+    ("tvdTop", "m"),
+    ("tvdBase", "m"),
+    ("ropAv", "m/h"),
+    ("ropMn", "m/h"),
+    ("ropMx", "m/h"),
+    ("wobAv", "kN"),
+    ("tqAv", "kN.m"),
+    ("currentAv", "A"),
+    ("rpmAv", "rpm"),
+    ("wtMudAv", "g/cm3"),
+    ("ecdTdAv", "g/cm3"),
+    ("dxcAv", None),
+    ("description", None),
+    ("comments", None),
+]
+
+
+def __prepare_station_text(series: "pandas.Series") -> "pandas.Series":
+    # missing values become empty string, text is escaped
+    from xml.sax import saxutils
+
+    import pandas
+
+    is_missing = series.isna()
+    if pandas.api.types.is_datetime64_any_dtype(series):
+        text = series.map(lambda value: value.isoformat(), na_action="ignore")
+    elif pandas.api.types.is_numeric_dtype(series):
+        text = series.astype(str)
+    else:
+        text = series.map(lambda value: saxutils.escape(str(value)), na_action="ignore")
+    return text.where(~is_missing, "").astype(object)
+
+
+def __prepare_station_list(
+    tag: str,
+    element_list: typing.List[typing.Tuple[str, str]],
+    dataframe: "pandas.DataFrame",
+    unit_dict: typing.Dict[str, str],
+) -> str:
+    # build every station as text column by column instead of row by row
+    from xml.sax import saxutils
+
+    import pandas
+
+    if "uid" in dataframe.columns:
+        uid = dataframe["uid"].astype(str)
+    else:
+        uid = pandas.Series(dataframe.index, index=dataframe.index).astype(str)
+    station = f"<{tag} uid=" + uid.map(saxutils.quoteattr).astype(object) + ">"
+    for element, _ in element_list:
+        if element not in dataframe.columns:
+            continue
+        text = __prepare_station_text(dataframe[element])
+        unit = unit_dict.get(element)
+        start = f"<{element} uom={saxutils.quoteattr(unit)}>" if unit else f"<{element}>"
+        station = station + (start + text + f"</{element}>").where(text != "", "")
+    return "".join((station + f"</{tag}>").tolist())
+
+
+def __generate_growing_object_query(
+    operation: str,
+    object_type: str,
+    header_dict: typing.Dict,
+    tag: str,
+    element_list: typing.List[typing.Tuple[str, str]],
+    dataframe: "pandas.DataFrame",
+    md_index: model.LogIndexModel,
+    md_element_list: typing.List[str],
+    md_unit_element: str,
+    unit_dict: typing.Dict[str, str],
+) -> str:
+    import xmltodict
+
+    operation_metric = metric.begin(operation)
+
+    # unit: parameter, then dataframe attrs (set by parser), then schema default
+    resolved_unit_dict = {element: unit for element, unit in element_list if unit is not None}
+    if dataframe is not None:
+        resolved_unit_dict.update(dataframe.attrs.get("unit_dict", {}))
+    resolved_unit_dict.update(unit_dict or {})
+
+    # md range of stations for getting data
+    if md_index is not None:
+        for element, value in zip(md_element_list, [md_index.start, md_index.end]):
+            if value is not None:
+                header_dict[element] = {"#text": value, "@uom": resolved_unit_dict[md_unit_element]}
+
+    query = xmltodict.unparse(
+        {
+            f"{object_type}s": {
+                "@xmlns": WITSML_NAMESPACE,
+                "@version": WITSML_VERSION,
+                object_type: header_dict,
+            },
+        },
+        full_document=False,
+    )
+    row_count = 0
+    if dataframe is not None and not dataframe.empty:
+        head, tail = query.rsplit(f"</{object_type}>", 1)
+        query = (
+            head + __prepare_station_list(tag, element_list, dataframe, resolved_unit_dict) + f"</{object_type}>" + tail
+        )
+        row_count = dataframe.shape[0]
+    if operation_metric is not None:
+        metric.end(operation_metric, byte_out=len(query), row_count=row_count)
+    return query
+
+
+def generate_trajectory_query(
+    trajectory_basic_info: model.TrajectoryBasicInfoModel,
+    dataframe: "pandas.DataFrame" = None,
+    md_index: model.LogIndexModel = None,
+    unit_dict: typing.Dict[str, str] = None,
+) -> str:
+    """
+    Generate 'trajectory' query with one trajectoryStation per pandas.DataFrame row.
+    Stations are built column by column, so thousands of stations don't go through
+    per-row dict handling.
+
+    Parameters
+    ----------
+    trajectory_basic_info: jeng.model.TrajectoryBasicInfoModel
+        Well, wellbore and trajectory information for query generation.
+
+    dataframe: pandas.DataFrame, default None
+        Stations with element name as column name, e.g. 'md', 'tvd', 'incl', 'azi' and
+        'typeTrajStation' (see `TRAJECTORY_STATION_ELEMENT_LIST`). Column 'uid' is the
+        station uid, the dataframe index is used if it's not set. Missing values are
+        omitted and other columns are ignored. If set None, only trajectory info is
+        generated.
+
+    md_index: jeng.model.LogIndexModel, default None
+        Measured depth interval (mdMn and mdMx) of stations for getting data. Set start or
+        end to None for an open-ended interval.
+
+    unit_dict: Dict[str, str], default None
+        Unit of measure by element name. Falls back to `dataframe.attrs["unit_dict"]` (set
+        by `jeng.parse.parse_trajectory_into_dataframe()`), then to the default unit.
+
+    Returns
+    -------
+    str
+        Trajectory query ready to be executed.
+    """
+    return __generate_growing_object_query(
+        operation="generate_trajectory_query",
+        object_type="trajectory",
+        header_dict={
+            "@uidWell": trajectory_basic_info.well_uid,
+            "@uidWellbore": trajectory_basic_info.wellbore_uid,
+            "@uid": trajectory_basic_info.trajectory_uid,
+            "nameWell": trajectory_basic_info.well_name,
+            "nameWellbore": trajectory_basic_info.wellbore_name,
+            "name": trajectory_basic_info.trajectory_name,
+        },
+        tag="trajectoryStation",
+        element_list=TRAJECTORY_STATION_ELEMENT_LIST,
+        dataframe=dataframe,
+        md_index=md_index,
+        md_element_list=["mdMn", "mdMx"],
+        md_unit_element="md",
+        unit_dict=unit_dict,
+    )
+
+
+def generate_mud_log_query(
+    mud_log_basic_info: model.MudLogBasicInfoModel,
+    dataframe: "pandas.DataFrame" = None,
+    md_index: model.LogIndexModel = None,
+    unit_dict: typing.Dict[str, str] = None,
+) -> str:
+    """
+    Generate 'mudLog' query with one geologyInterval per pandas.DataFrame row, built the
+    same way as `generate_trajectory_query()`.
+
+    Parameters
+    ----------
+    mud_log_basic_info: jeng.model.MudLogBasicInfoModel
+        Well, wellbore and mud log information for query generation.
+
+    dataframe: pandas.DataFrame, default None
+        Geology intervals with element name as column name, e.g. 'typeLithology', 'mdTop',
+        'mdBottom' and 'description' (see `GEOLOGY_INTERVAL_ELEMENT_LIST`). Column 'uid' is
+        the interval uid, the dataframe index is used if it's not set. Missing values are
+        omitted and other columns are ignored. If set None, only mud log info is generated.
+
+    md_index: jeng.model.LogIndexModel, default None
+        Measured depth interval (startMd and endMd) of intervals for getting data. Set
+        start or end to None for an open-ended interval.
+
+    unit_dict: Dict[str, str], default None
+        Unit of measure by element name. Falls back to `dataframe.attrs["unit_dict"]` (set
+        by `jeng.parse.parse_mud_log_into_dataframe()`), then to the default unit.
+
+    Returns
+    -------
+    str
+        Mud log query ready to be executed.
+    """
+    return __generate_growing_object_query(
+        operation="generate_mud_log_query",
+        object_type="mudLog",
+        header_dict={
+            "@uidWell": mud_log_basic_info.well_uid,
+            "@uidWellbore": mud_log_basic_info.wellbore_uid,
+            "@uid": mud_log_basic_info.mud_log_uid,
+            "nameWell": mud_log_basic_info.well_name,
+            "nameWellbore": mud_log_basic_info.wellbore_name,
+            "name": mud_log_basic_info.mud_log_name,
+        },
+        tag="geologyInterval",
+        element_list=GEOLOGY_INTERVAL_ELEMENT_LIST,
+        dataframe=dataframe,
+        md_index=md_index,
+        md_element_list=["startMd", "endMd"],
+        md_unit_element="mdTop",
+        unit_dict=unit_dict,
+    )
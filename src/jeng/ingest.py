@@ -0,0 +1,505 @@
+import time
+import typing
+from xml.etree import ElementTree
+
+from jeng import adaptive, exception, generate, model
+
+# numpy and pandas are imported on first use to keep import fast
+if typing.TYPE_CHECKING:
+    import numpy
+    import pandas
+
+    from jeng import jeng
+
+FORMAT_CSV = "csv"
+FORMAT_LAS = "las"
+NULL_VALUE_LIST = ["-999.25"]
+
+# length of '<data></data>' and value separators is added to value lengths of a row
+__DATA_ELEMENT_SIZE = len("<data></data>")
+
+
+def __read_las_header(path: str) -> typing.Tuple[typing.List[typing.Tuple[str, str, str]], str, int]:
+    # (mnemonic, unit, description) of ~Curve section, NULL of ~Well section and line number of ~A
+    curve_list = []
+    null_value = None
+    section = None
+    with open(path, "r") as las:
+        for line_number, line in enumerate(las):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("~"):
+                section = line[1:2].upper()
+                if section == "A":
+                    return curve_list, null_value, line_number + 1
+                continue
+
+            # MNEM.UNIT  DATA : DESCRIPTION
+            name, _, rest = line.partition(".")
+            unit, _, rest = rest.partition(" ")
+            data, _, description = rest.rpartition(":")
+            if section == "V" and name.strip().upper() == "WRAP" and data.strip().upper() == "YES":
+                raise ValueError(f"Wrapped LAS file is not supported: {path}")
+            if section == "W" and name.strip().upper() == "NULL":
+                null_value = data.strip()
+            if section == "C":
+                curve_list.append((name.strip(), unit.strip(), description.strip()))
+    raise ValueError(f"LAS file has no ~A section: {path}")
+
+
+def __file_format(path: str) -> str:
+    return FORMAT_LAS if path.lower().endswith(f".{FORMAT_LAS}") else FORMAT_CSV
+
+
+def read_curve_info(path: str, index_type: str = "measured depth") -> typing.List[model.LogCurveInfoModel]:
+    """
+    Map columns of a CSV or LAS 2.0 file to log curve info. The first column is the index
+    curve. Units and descriptions are taken from LAS ~Curve section; CSV has none.
+
+    Parameters
+    ----------
+    path: str
+        CSV or LAS file path.
+
+    index_type: str, default 'measured depth'
+        Log index type, e.g. 'date time' or 'measured depth'.
+
+    Returns
+    -------
+    List[jeng.model.LogCurveInfoModel]
+        Log curve info list.
+    """
+    import pandas
+
+    if __file_format(path) == FORMAT_LAS:
+        curve_list = __read_las_header(path)[0]
+    else:
+        column_list = [column for column in pandas.read_csv(path, nrows=0).columns if not column.startswith("Unnamed:")]
+        curve_list = [(column, "", "") for column in column_list]
+    return make_log_curve_info_list(curve_list, index_type)
+
+
+def make_log_curve_info_list(
+    curve_list: typing.List[typing.Tuple[str, str, str]], index_type: str = "measured depth"
+) -> typing.List[model.LogCurveInfoModel]:
+    """
+    Make log curve info list, the first curve is the index curve.
+
+    Parameters
+    ----------
+    curve_list: List[Tuple[str, str, str]]
+        (mnemonic, unit, description) of every curve. Empty unit is set 'unitless' and
+        empty description is set mnemonic.
+
+    index_type: str, default 'measured depth'
+        Log index type, e.g. 'date time' or 'measured depth'.
+
+    Returns
+    -------
+    List[jeng.model.LogCurveInfoModel]
+        Log curve info list.
+    """
+    log_curve_info_list = []
+    for position, (mnemonic, unit, description) in enumerate(curve_list):
+        is_index_curve = position == 0
+        log_curve_info_list.append(
+            model.LogCurveInfoModel(
+                uid=mnemonic,
+                mnemonic=mnemonic,
+                unit=unit or ("s" if is_index_curve and index_type == "date time" else "unitless"),
+                curve_description=description or mnemonic,
+                type_log_data="date time" if is_index_curve and index_type == "date time" else "double",
+                index_type=index_type if is_index_curve else None,
+                is_index_curve=is_index_curve,
+            )
+        )
+    return log_curve_info_list
+
+
+def iter_file(
+    path: str,
+    rows: int = 1000,
+    null_value_list: typing.List[str] = None,
+) -> typing.Iterator["pandas.DataFrame"]:
+    """
+    Read a CSV or LAS 2.0 (unwrapped) file in chunks of WITSML text values. Null values
+    are replaced with empty string (missing value), and CSV columns without header (e.g.
+    a trailing comma) are dropped.
+
+    Parameters
+    ----------
+    path: str
+        CSV or LAS file path.
+
+    rows: int, default 1000
+        Maximum rows per chunk.
+
+    null_value_list: List[str], default None
+        Values to be treated as missing. If set None, '-999.25' (and LAS NULL value) is
+        used.
+
+    Returns
+    -------
+    Iterator[pandas.DataFrame]
+        Generator of data chunks with mnemonic as column name.
+    """
+    import pandas
+
+    null_value_list = list(NULL_VALUE_LIST if null_value_list is None else null_value_list)
+    if __file_format(path) == FORMAT_LAS:
+        curve_list, null_value, data_line = __read_las_header(path)
+        if null_value is not None:
+            null_value_list.append(null_value)
+        reader = pandas.read_csv(
+            path,
+            sep=r"\s+",
+            header=None,
+            names=[mnemonic for mnemonic, _, _ in curve_list],
+            skiprows=data_line,
+            comment="#",
+            chunksize=rows,
+            dtype=str,
+            keep_default_na=False,
+        )
+    else:
+        reader = pandas.read_csv(path, chunksize=rows, dtype=str, keep_default_na=False)
+
+    with reader:
+        for chunk in reader:
+            chunk = chunk[[column for column in chunk.columns if not str(column).startswith("Unnamed:")]]
+            yield chunk.replace(null_value_list, "")
+
+
+def to_text(dataframe: "pandas.DataFrame") -> "pandas.DataFrame":
+    """
+    Convert (typed) log data into WITSML text values: ISO 8601 date time, missing value as
+    empty string.
+
+    Parameters
+    ----------
+    dataframe: pandas.DataFrame
+        Log data.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Log data as strings.
+    """
+    import pandas
+
+    column_dict = {}
+    for column in dataframe.columns:
+        series = dataframe[column]
+        if pandas.api.types.is_datetime64_any_dtype(series):
+            series = series.map(lambda value: value.isoformat() if not pandas.isna(value) else "")
+        column_dict[column] = series.astype(object).where(series.notna(), "").astype(str)
+    return pandas.DataFrame(column_dict, index=dataframe.index)
+
+
+def row_size(dataframe: "pandas.DataFrame") -> "numpy.ndarray":
+    """
+    Estimate characters of every row as a logData 'data' element.
+
+    Parameters
+    ----------
+    dataframe: pandas.DataFrame
+        Log data of WITSML text values.
+
+    Returns
+    -------
+    numpy.ndarray
+        Characters per row.
+    """
+    size_array = sum(dataframe[column].str.len().to_numpy() for column in dataframe.columns)
+    return size_array + len(dataframe.columns) - 1 + __DATA_ELEMENT_SIZE
+
+
+def iter_upload_query(
+    log_basic_info: model.LogBasicInfoModel,
+    log_curve_info_list: typing.List[model.LogCurveInfoModel],
+    dataframe_iterable: typing.Iterable["pandas.DataFrame"],
+    max_rows: typing.Union[int, typing.Callable[[], int]] = None,
+    max_size: int = None,
+    is_include_log_curve_info: bool = True,
+    is_compact: bool = False,
+) -> typing.Iterator[typing.Tuple[str, int]]:
+    """
+    Generate log upload queries from data chunks, each within maximum rows and maximum
+    characters. Rows are packed greedily by their text size, so chunks are never held
+    longer than it takes to generate their queries.
+
+    Parameters
+    ----------
+    log_basic_info: jeng.model.LogBasicInfoModel
+        Well, wellbore and log information of the log.
+
+    log_curve_info_list: List[jeng.model.LogCurveInfoModel]
+        A list of curve info with mnemonic matching the data columns.
+
+    dataframe_iterable: Iterable[pandas.DataFrame]
+        Data chunks of WITSML text values (see `iter_file()`).
+
+    max_rows: Union[int, Callable[[], int]], default None
+        Maximum rows per query, or a callable evaluated before every query (e.g. learned
+        by `jeng.adaptive.RequestSizer`). None if not limited.
+
+    max_size: int, default None
+        Maximum characters per query. None if not limited.
+
+    is_include_log_curve_info: bool, default True
+        Include log curve info in the first query, for creating the log with
+        WMLS_AddToStore. The remaining queries are for WMLS_UpdateInStore.
+
+    is_compact: bool, default False
+        Leave out curves and rows without any value per query (see
+        `jeng.generate.generate_log_query()`).
+
+    Returns
+    -------
+    Iterator[Tuple[str, int]]
+        Generator of (query, number of rows read from the chunks).
+    """
+    import numpy
+
+    def generate_query(dataframe: "pandas.DataFrame", is_first: bool) -> str:
+        return generate.generate_log_query(
+            log_basic_info=log_basic_info,
+            log_curve_info_list=log_curve_info_list,
+            dataframe=dataframe,
+            is_include_log_curve_info=is_include_log_curve_info and is_first,
+            is_compact=is_compact,
+        )
+
+    def split(dataframe: "pandas.DataFrame", is_first: bool) -> typing.Iterator[typing.Tuple[str, int]]:
+        # size estimate misses escaped characters, halve until it fits
+        query = generate_query(dataframe, is_first)
+        if max_size is None or len(query) <= max_size or len(dataframe.index) == 1:
+            yield query, len(dataframe.index)
+            return
+        middle = len(dataframe.index) // 2
+        yield from split(dataframe.iloc[:middle], is_first)
+        yield from split(dataframe.iloc[middle:], False)
+
+    is_first = True
+    overhead_dict = {}
+    for chunk in dataframe_iterable:
+        if chunk.empty:
+            continue
+        size_array = row_size(chunk)
+
+        start = 0
+        while start < len(chunk.index):
+            limit = max_rows() if callable(max_rows) else max_rows
+            end = len(chunk.index) if limit is None else min(len(chunk.index), start + limit)
+            if max_size is not None:
+                # query size without rows, measured once with and once without log curve info
+                if is_first not in overhead_dict:
+                    overhead_dict[is_first] = len(generate_query(chunk.iloc[start : start + 1], is_first))
+                    overhead_dict[is_first] -= int(size_array[start])
+                cumulative_array = numpy.cumsum(size_array[start:end])
+                end = start + max(
+                    1, int(numpy.searchsorted(cumulative_array, max_size - overhead_dict[is_first], "right"))
+                )
+            yield from split(chunk.iloc[start:end], is_first)
+            is_first = False
+            start = end
+
+
+def is_log_exist(client: "jeng.WitsmlClient", log_basic_info: model.LogBasicInfoModel) -> bool:
+    """
+    Check whether a log exists with an id-only query.
+
+    Parameters
+    ----------
+    client: jeng.jeng.WitsmlClient
+        Connected client.
+
+    log_basic_info: jeng.model.LogBasicInfoModel
+        Well, wellbore and log information of the log.
+
+    Returns
+    -------
+    bool
+        True if the log exists.
+    """
+    reply = client.get_from_store(
+        wml_type_in="log",
+        xml_in=generate.generate_log_query(log_basic_info=log_basic_info),
+        return_element="id-only",
+    )
+    if reply.Result < 1:
+        raise exception.JengReplyErrorException(reply.Result, reply.SuppMsgOut)
+    xml_out = reply.XMLout
+    if isinstance(xml_out, memoryview):
+        xml_out = xml_out.tobytes()
+    return bool(xml_out) and ElementTree.fromstring(xml_out).find("{*}log") is not None
+
+
+def upload_limit(
+    client: "jeng.WitsmlClient",
+    curve_count: int,
+    max_rows: int = None,
+    sizer: adaptive.RequestSizer = None,
+) -> typing.Tuple[typing.Union[int, typing.Callable[[], int], None], typing.Optional[int]]:
+    """
+    Get maximum rows and characters per log upload request allowed by the server
+    capabilities, and learned by the sizer.
+
+    Parameters
+    ----------
+    client: jeng.jeng.WitsmlClient
+        Connected client.
+
+    curve_count: int
+        Number of curves (including index curve) per row.
+
+    max_rows: int, default None
+        Maximum rows wanted by the caller. None if not limited.
+
+    sizer: jeng.adaptive.RequestSizer, default None
+        Rows per request learned from latency. If set, maximum rows is a callable to be
+        evaluated per request (see `iter_upload_query()`).
+
+    Returns
+    -------
+    Tuple[Union[int, Callable[[], int]], int]
+        (maximum rows, maximum characters), None if not limited.
+    """
+    capabilities = client.capabilities()
+    max_row_list = [max_rows]
+    max_size = None
+    if capabilities is not None:
+        max_row_list += [
+            capabilities.get_max_rows(function, "log", curve_count)
+            for function in ["WMLS_AddToStore", "WMLS_UpdateInStore"]
+        ]
+        max_size = capabilities.max_request_size
+    max_row_list = [item for item in max_row_list if item is not None]
+    limit = min(max_row_list) if max_row_list else None
+    if sizer is None:
+        return limit, max_size
+
+    endpoint = client.url()
+    return (
+        lambda: min(limit or sizer.max_rows, sizer.rows(endpoint, adaptive.OPERATION_UPLOAD)),
+        max_size,
+    )
+
+
+def upload(
+    client: "jeng.WitsmlClient",
+    query: str,
+    row_count: int,
+    is_create: bool = False,
+    sizer: adaptive.RequestSizer = None,
+):
+    """
+    Send a log upload query, WMLS_AddToStore for creating the log and WMLS_UpdateInStore
+    otherwise, and let the sizer learn from it.
+
+    Parameters
+    ----------
+    client: jeng.jeng.WitsmlClient
+        Connected client.
+
+    query: str
+        Log upload query.
+
+    row_count: int
+        Number of rows of the query.
+
+    is_create: bool, default False
+        Create the log with the query.
+
+    sizer: jeng.adaptive.RequestSizer, default None
+        Learns rows per request from the request latency and size.
+    """
+    start = time.perf_counter()
+    if is_create:
+        reply = client.add_to_store(wml_type_in="log", xml_in=query)
+    else:
+        reply = client.update_in_store(wml_type_in="log", xml_in=query)
+    if sizer is not None:
+        sizer.observe(
+            client.url(),
+            adaptive.OPERATION_UPLOAD,
+            row_count,
+            time.perf_counter() - start,
+            is_error=reply.Result < 1,
+            byte_count=len(query),
+        )
+    if reply.Result < 1:
+        raise exception.JengReplyErrorException(reply.Result, reply.SuppMsgOut)
+
+
+def ingest_file(
+    client: "jeng.WitsmlClient",
+    path: str,
+    log_basic_info: model.LogBasicInfoModel,
+    log_curve_info_list: typing.List[model.LogCurveInfoModel] = None,
+    index_type: str = "measured depth",
+    rows: int = 1000,
+    null_value_list: typing.List[str] = None,
+    sizer: adaptive.RequestSizer = None,
+    is_compact: bool = False,
+) -> int:
+    """
+    Stream a CSV or LAS 2.0 file into a log with constant memory. The log is created with
+    the first request if it doesn't exist, and every request is kept within server
+    capabilities (maxDataNodes, maxDataPoints and maxRequestSize).
+
+    Parameters
+    ----------
+    client: jeng.jeng.WitsmlClient
+        Connected client.
+
+    path: str
+        CSV or LAS file path.
+
+    log_basic_info: jeng.model.LogBasicInfoModel
+        Well, wellbore and log information of the log.
+
+    log_curve_info_list: List[jeng.model.LogCurveInfoModel], default None
+        Curve info with mnemonic matching the file columns. If set None, it's read from
+        the file (see `read_curve_info()`).
+
+    index_type: str, default 'measured depth'
+        Log index type used if log_curve_info_list is not set.
+
+    rows: int, default 1000
+        Maximum rows per chunk read and per request.
+
+    null_value_list: List[str], default None
+        Values to be treated as missing (see `iter_file()`).
+
+    sizer: jeng.adaptive.RequestSizer, default None
+        Adapts rows per request (up to rows) to its target latency.
+
+    is_compact: bool, default False
+        Leave out curves and rows without any value per request, for sparse data.
+
+    Returns
+    -------
+    int
+        Number of rows read from the file.
+    """
+    if log_curve_info_list is None:
+        log_curve_info_list = read_curve_info(path, index_type)
+    max_rows, max_size = upload_limit(client, len(log_curve_info_list), rows, sizer)
+    is_create = not is_log_exist(client, log_basic_info)
+
+    row_count = 0
+    for query, query_row_count in iter_upload_query(
+        log_basic_info,
+        log_curve_info_list,
+        iter_file(path, rows, null_value_list),
+        max_rows=max_rows,
+        max_size=max_size,
+        is_include_log_curve_info=is_create,
+        is_compact=is_compact,
+    ):
+        upload(client, query, query_row_count, is_create, sizer)
+        is_create = False
+        row_count += query_row_count
+    return row_count
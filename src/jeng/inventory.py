@@ -0,0 +1,262 @@
+import json
+import os
+import typing
+from xml.etree import ElementTree
+from xml.sax.saxutils import quoteattr
+
+from jeng import exception, generate, model
+
+if typing.TYPE_CHECKING:
+    from jeng import jeng
+
+# query templates, child elements select what is replied
+WELL_QUERY = '<well uid=""><name/></well>'
+WELLBORE_QUERY = '<wellbore uidWell={well_uid} uid=""><nameWell/><name/>{common_data}</wellbore>'
+LOG_QUERY = (
+    '<log uidWell={well_uid} uidWellbore={wellbore_uid} uid=""><nameWell/><nameWellbore/><name/><indexType/>'
+    '<startIndex uom=""/><endIndex uom=""/><startDateTimeIndex/><endDateTimeIndex/>{common_data}</log>'
+)
+
+
+class InventoryCrawler:
+    """
+    A crawler of well, wellbore and log inventory of a WITSML server. Wells and wellbores
+    are listed with id-only queries, logs with their index range. Each level of the
+    hierarchy is walked with bounded concurrency (see `jeng.jeng.WitsmlClient.batch()`).
+
+    The inventory is cached and refreshed incrementally: wells are listed again (new wells
+    are crawled, removed wells are dropped) and only wellbores and logs changed after the
+    last seen dTimLastChange are fetched. Wellbores and logs deleted under a cached well
+    are only detected by a full crawl.
+
+    Parameters
+    ----------
+    client: jeng.jeng.WitsmlClient
+        Connected client.
+
+    max_workers: int, default 8
+        Maximum number of requests in flight.
+
+    path: str, default None
+        JSON file to persist the inventory cache. If set None, it's cached in memory only.
+    """
+
+    def __init__(self, client: "jeng.WitsmlClient", max_workers: int = 8, path: str = None) -> None:
+        self.client = client
+        self.max_workers = max_workers
+        self.path = path
+        self.__well_list = None
+        self.__last_change = None
+        if path is not None and os.path.exists(path):
+            with open(path, "r") as cache:
+                cache_dict = json.load(cache)
+            self.__well_list = [self.__from_dict(item) for item in cache_dict["well_list"]]
+            self.__last_change = cache_dict["last_change"]
+
+    def __from_dict(self, node_dict: typing.Dict) -> model.InventoryNodeModel:
+        node_dict = dict(node_dict)
+        node_dict["child_list"] = [self.__from_dict(item) for item in node_dict["child_list"]]
+        return model.InventoryNodeModel(**node_dict)
+
+    def __to_dict(self, node: model.InventoryNodeModel) -> typing.Dict:
+        node_dict = dict(vars(node))
+        node_dict["child_list"] = [self.__to_dict(item) for item in node.child_list]
+        return node_dict
+
+    def __save(self):
+        if self.path is None:
+            return
+        with open(self.path, "w") as cache:
+            json.dump(
+                {"well_list": [self.__to_dict(item) for item in self.__well_list], "last_change": self.__last_change},
+                cache,
+            )
+
+    def __query(self, object_type: str, body: str) -> str:
+        return (
+            f'<{object_type}s xmlns="{generate.WITSML_NAMESPACE}" version="{generate.WITSML_VERSION}">'
+            f"{body}</{object_type}s>"
+        )
+
+    def __common_data(self, last_change: str = None) -> str:
+        if last_change is None:
+            return "<commonData><dTimLastChange/></commonData>"
+        return f"<commonData><dTimLastChange>{last_change}</dTimLastChange></commonData>"
+
+    def __parse(self, object_type: str, xml_out) -> typing.List[typing.Tuple[typing.Dict, model.InventoryNodeModel]]:
+        # (uid attributes, node) of every replied data-object
+        if not xml_out:
+            return []
+        if isinstance(xml_out, memoryview):
+            xml_out = xml_out.tobytes()
+        item_list = []
+        for element in ElementTree.fromstring(xml_out).findall(f"{{*}}{object_type}"):
+            node = model.InventoryNodeModel(
+                object_type=object_type,
+                uid=element.get("uid"),
+                name=element.findtext("{*}name"),
+                last_change=element.findtext("{*}commonData/{*}dTimLastChange"),
+            )
+            if object_type == "log":
+                node.index_type = element.findtext("{*}indexType")
+                node.start_index = element.findtext("{*}startDateTimeIndex") or element.findtext("{*}startIndex")
+                node.end_index = element.findtext("{*}endDateTimeIndex") or element.findtext("{*}endIndex")
+            item_list.append((dict(element.attrib), node))
+        return item_list
+
+    def __get_list(self, operation_list: typing.List[model.BatchOperationModel]) -> typing.List:
+        reply_list = []
+        for result in self.client.batch(operation_list, max_workers=self.max_workers):
+            if result.error is not None:
+                raise result.error
+            if result.reply.Result < 1:
+                raise exception.JengReplyErrorException(result.reply.Result, result.reply.SuppMsgOut)
+            reply_list.append(self.__parse(result.operation.wml_type_in, result.reply.XMLout))
+        return reply_list
+
+    def __update_last_change(self, node_list: typing.List[model.InventoryNodeModel]):
+        import pandas
+
+        for node in node_list:
+            if node.last_change and (
+                self.__last_change is None or pandas.Timestamp(node.last_change) > pandas.Timestamp(self.__last_change)
+            ):
+                self.__last_change = node.last_change
+
+    def __crawl_log(self, wellbore_list: typing.List[typing.Tuple[str, model.InventoryNodeModel]]):
+        operation_list = [
+            model.BatchOperationModel(
+                function="get_from_store",
+                wml_type_in="log",
+                xml_in=self.__query(
+                    "log",
+                    LOG_QUERY.format(
+                        well_uid=quoteattr(well_uid),
+                        wellbore_uid=quoteattr(wellbore.uid),
+                        common_data=self.__common_data(),
+                    ),
+                ),
+                return_element="requested",
+            )
+            for well_uid, wellbore in wellbore_list
+        ]
+        for (_, wellbore), item_list in zip(wellbore_list, self.__get_list(operation_list)):
+            wellbore.child_list = [node for _, node in item_list]
+            self.__update_last_change(wellbore.child_list)
+
+    def __crawl_wellbore(self, well_list: typing.List[model.InventoryNodeModel]):
+        operation_list = [
+            model.BatchOperationModel(
+                function="get_from_store",
+                wml_type_in="wellbore",
+                xml_in=self.__query("wellbore", WELLBORE_QUERY.format(well_uid=quoteattr(well.uid), common_data="")),
+                return_element="id-only",
+            )
+            for well in well_list
+        ]
+        wellbore_list = []
+        for well, item_list in zip(well_list, self.__get_list(operation_list)):
+            well.child_list = [node for _, node in item_list]
+            wellbore_list += [(well.uid, wellbore) for wellbore in well.child_list]
+        self.__crawl_log(wellbore_list)
+
+    def __list_well(self) -> typing.List[model.InventoryNodeModel]:
+        operation = model.BatchOperationModel(
+            function="get_from_store",
+            wml_type_in="well",
+            xml_in=self.__query("well", WELL_QUERY),
+            return_element="id-only",
+        )
+        return [node for _, node in self.__get_list([operation])[0]]
+
+    def __refresh(self, well_list: typing.List[model.InventoryNodeModel]):
+        cached_well_dict = {well.uid: well for well in self.__well_list}
+        new_well_list = [well for well in well_list if well.uid not in cached_well_dict]
+        for well in well_list:
+            if well.uid in cached_well_dict:
+                well.child_list = cached_well_dict[well.uid].child_list
+        self.__crawl_wellbore(new_well_list)
+
+        # wellbores and logs changed after the last seen change, across all wells
+        last_change = self.__last_change
+        well_dict = {well.uid: well for well in well_list if well not in new_well_list}
+        operation_list = [
+            model.BatchOperationModel(
+                function="get_from_store",
+                wml_type_in="wellbore",
+                xml_in=self.__query(
+                    "wellbore", WELLBORE_QUERY.format(well_uid='""', common_data=self.__common_data(last_change))
+                ),
+                return_element="requested",
+            ),
+            model.BatchOperationModel(
+                function="get_from_store",
+                wml_type_in="log",
+                xml_in=self.__query(
+                    "log",
+                    LOG_QUERY.format(well_uid='""', wellbore_uid='""', common_data=self.__common_data(last_change)),
+                ),
+                return_element="requested",
+            ),
+        ]
+        wellbore_item_list, log_item_list = self.__get_list(operation_list)
+
+        new_wellbore_list = []
+        for attribute_dict, wellbore in wellbore_item_list:
+            well = well_dict.get(attribute_dict.get("uidWell"))
+            if well is None:
+                continue
+            cached_wellbore = next((item for item in well.child_list if item.uid == wellbore.uid), None)
+            if cached_wellbore is None:
+                well.child_list.append(wellbore)
+                new_wellbore_list.append((well.uid, wellbore))
+            else:
+                cached_wellbore.name = wellbore.name
+        self.__update_last_change([wellbore for _, wellbore in wellbore_item_list])
+        self.__crawl_log(new_wellbore_list)
+
+        for attribute_dict, log in log_item_list:
+            well = well_dict.get(attribute_dict.get("uidWell"))
+            if well is None:
+                continue
+            wellbore = next((item for item in well.child_list if item.uid == attribute_dict.get("uidWellbore")), None)
+            if wellbore is None:
+                continue
+            wellbore.child_list = [item for item in wellbore.child_list if item.uid != log.uid] + [log]
+        self.__update_last_change([log for _, log in log_item_list])
+
+    def crawl(self, is_incremental: bool = True) -> typing.List[model.InventoryNodeModel]:
+        """
+        Crawl the inventory, incrementally if it's cached.
+
+        Parameters
+        ----------
+        is_incremental: bool, default True
+            Refresh the cached inventory with changes only. If set False or nothing is
+            cached yet, the whole inventory is crawled.
+
+        Returns
+        -------
+        List[jeng.model.InventoryNodeModel]
+            Wells with their wellbores and logs as child_list.
+        """
+        well_list = self.__list_well()
+        if is_incremental and self.__well_list is not None and self.__last_change is not None:
+            self.__refresh(well_list)
+        else:
+            self.__last_change = None
+            self.__crawl_wellbore(well_list)
+        self.__well_list = well_list
+        self.__save()
+        return well_list
+
+    def well_list(self) -> typing.List[model.InventoryNodeModel]:
+        """
+        Get the cached inventory without contacting the server.
+
+        Returns
+        -------
+        List[jeng.model.InventoryNodeModel]
+            Wells with their wellbores and logs as child_list, None if not crawled yet.
+        """
+        return self.__well_list
@@ -1,17 +1,19 @@
+import concurrent.futures
 import os
-
-import requests
-import urllib3
-from requests import Session
-from requests.auth import HTTPBasicAuth
-from zeep import Client, proxy, xsd
-from zeep.transports import Transport
+import threading
+import time
+import typing
 
 import jeng
-from jeng import exception
+from jeng import exception, fetch, generate, metric, model, parse, soap, transport
+
+# pandas, requests and zeep are imported on first use to keep import fast
+if typing.TYPE_CHECKING:
+    import pandas
+    import zeep.proxy
 
-# disabling urllib warnings
-urllib3.disable_warnings()
+# wrapper API functions that can be executed by WitsmlClient.batch()
+BATCH_FUNCTION_LIST = ["get_from_store", "add_to_store", "update_in_store", "delete_from_store"]
 
 
 # witsml client
@@ -21,20 +23,165 @@ class WitsmlClient:
     def __init__(self):
         self.__client = None
         self.__service = None
-        self.__session = Session()
+        self.__session = None
+        self.__capabilities = None
+        self.__capabilities_error = None
+        self.__url = None
+        self.__is_raw = False
+        self.__xml_out_type = soap.XML_OUT_TYPE_STR
+        self.__request_compression = None
+        self.__pool_size = None
+        self.__timeout = None
+        self.__max_rate = None
+        self.__rate_lock = threading.Lock()
+        self.__next_request_time = 0.0
+        self.__log_header_dict = {}
+
+    def __create_service(self):
+        # raw transport mode doesn't need zeep service
+        if self.__is_raw:
+            self.__client = None
+            self.__service = None
+            return
+        from zeep import Client
+
+        wsdl_file_path = os.path.join(jeng.__path__[0], "xml", "WMLS.WSDL")
+        witsml_binding_uri = "{http://www.witsml.org/wsdl/120}StoreSoapBinding"
+        self.__client = Client(
+            transport=transport.WitsmlTransport(
+                session=self.__session,
+                request_compression=self.__request_compression,
+                operation_timeout=self.__timeout,
+            ),
+            wsdl=wsdl_file_path,
+        )
+        self.__service = self.__client.create_service(witsml_binding_uri, self.__url)
+
+    def __call_raw(self, function: str, **part_dict):
+        if self.__url is None:
+            raise exception.JengClientNoneException
+        headers = soap.build_headers(function)
+        body = transport.compress_headers(
+            soap.build_envelope(function, **part_dict),
+            headers,
+            self.__request_compression,
+        )
+        operation_metric = metric.current()
+        if operation_metric is not None:
+            metric.begin_network(operation_metric, len(body))
+        is_spool = self.__xml_out_type == soap.XML_OUT_TYPE_FILE
+        reply = self.__session.post(self.__url, data=body, headers=headers, stream=is_spool, timeout=self.__timeout)
+
+        # SOAP fault is replied with HTTP 500 and raised by the parser
+        if reply.status_code != 500:
+            reply.raise_for_status()
+        content = transport.spool(reply) if is_spool else reply.content
+        if operation_metric is not None:
+            metric.end_network(operation_metric, transport.wire_size(reply, default=len(content)))
+        return soap.parse_reply(content, self.__xml_out_type)
+
+    def __call_service(self, function: str, **part_dict):
+        if self.__is_raw:
+            return self.__call_raw(function, **part_dict)
+        from zeep import xsd
+
+        try:
+            return getattr(self.__service, function)(
+                **{key: xsd.SkipValue if value is None else value for key, value in part_dict.items()},
+            )
+        except AttributeError:
+            raise exception.JengClientNoneException
+
+    def __wait_rate(self):
+        # reserve the next request slot, then wait for it (not measured as request latency)
+        if not self.__max_rate:
+            return
+        with self.__rate_lock:
+            now = time.monotonic()
+            start = max(now, self.__next_request_time)
+            self.__next_request_time = start + 1.0 / self.__max_rate
+        if start > now:
+            time.sleep(start - now)
+
+    def __call(self, function: str, **part_dict):
+        self.__wait_rate()
+        operation_metric = metric.begin(function, is_network=True)
+        if operation_metric is None:
+            return self.__call_service(function, **part_dict)
+        try:
+            reply = self.__call_service(function, **part_dict)
+        except Exception as e:
+            metric.end(operation_metric, error=e)
+            raise
+        metric.end(operation_metric)
+        return reply
+
+    def __resize_pool(self, pool_size: int):
+        # one pooled connection per worker, so concurrent calls don't open and drop sockets
+        if self.__session is None or (self.__pool_size is not None and self.__pool_size >= pool_size):
+            return
+        from requests.adapters import HTTPAdapter
+
+        for prefix in ["http://", "https://"]:
+            self.__session.mount(prefix, HTTPAdapter(pool_maxsize=pool_size))
+        self.__pool_size = pool_size
+
+    def __batch_call(self, operation: model.BatchOperationModel) -> model.BatchResultModel:
+        try:
+            if operation.function == "get_from_store":
+                reply = self.get_from_store(
+                    wml_type_in=operation.wml_type_in,
+                    xml_in=operation.xml_in,
+                    return_element=operation.return_element,
+                    request_latest_values=operation.request_latest_values,
+                )
+            else:
+                reply = getattr(self, operation.function)(wml_type_in=operation.wml_type_in, xml_in=operation.xml_in)
+        except Exception as e:
+            return model.BatchResultModel(operation=operation, error=e)
+        return model.BatchResultModel(operation=operation, reply=reply)
 
     def __test(self):
         # exception will be caught by function caller
-        reply = self.__service.WMLS_GetBaseMsg(
-            ReturnValueIn=1,
-        )
+        reply = self.__call("WMLS_GetBaseMsg", ReturnValueIn=1)
+        if self.__is_raw:
+            reply = reply.Result
         return reply.strip() == "Function completed successfully"
 
+    def __get_capabilities(self):
+        # capabilities are optional, connection still usable without them (the reason is kept)
+        import requests
+
+        error_type_tuple = (exception.JengSoapFaultException, requests.exceptions.RequestException)
+        if not self.__is_raw:
+            import zeep.exceptions
+
+            error_type_tuple += (zeep.exceptions.Error,)
+        try:
+            reply = self.__call(
+                "WMLS_GetCap",
+                OptionsIn=f"dataVersion={generate.WITSML_VERSION}",
+            )
+        except error_type_tuple as e:
+            self.__capabilities_error = e
+            return None
+        if reply.Result < 1:
+            self.__capabilities_error = exception.JengReplyErrorException(reply.Result, reply.SuppMsgOut)
+            return None
+        if not reply.CapabilitiesOut:
+            return None
+        return parse.parse_capabilities(reply.CapabilitiesOut)
+
     def connect(
         self,
         url: str,
         username: str,
         password: str,
+        is_raw: bool = False,
+        xml_out_type: str = soap.XML_OUT_TYPE_STR,
+        request_compression: str = None,
+        timeout: float = None,
+        max_rate: float = None,
     ) -> bool:
         """
         Connect to WITSML Server.
@@ -50,43 +197,124 @@ class WitsmlClient:
         password: str
             Password for user authentication.
 
+        is_raw: bool, default False
+            Raw transport mode. Wrapper API calls fill precompiled SOAP envelope templates
+            and extract reply parts directly from the response bytes, bypassing zeep
+            serialization. Wrapper API replies become `jeng.model.RawReplyModel` and
+            `service()` returns None.
+
+        xml_out_type: str, default 'str'
+            Type of XMLout in raw transport mode: 'str', 'bytes', 'memoryview' or 'file'.
+            'file' streams the response body into a temporary file and replies XMLout as
+            `jeng.soap.SpooledPart` over a memory map of it, which is parsed chunk by chunk
+            by `jeng.parse.parse_log_into_dataframe()` to keep memory low for large replies.
+
+        request_compression: str, default None
+            Compress request body with 'gzip' or 'deflate'. Make sure the WITSML server
+            accepts compressed request. Compressed response is always negotiated (requests
+            sends 'Accept-Encoding: gzip, deflate'), and decompressed while streaming in
+            'file' XMLout type.
+
+        timeout: float, default None
+            Seconds to wait for the WITSML server to connect and reply a request. If set
+            None, wait forever.
+
+        max_rate: float, default None
+            Maximum requests per second sent to the WITSML server, shared by every thread
+            using the client. If set None, not limited.
+
         Returns
         -------
         bool
             Status of the connection (True is OK)
         """
-        wsdl_file_path = os.path.join(jeng.__path__[0], "xml", "WMLS.WSDL")
-        witsml_binding_uri = "{http://www.witsml.org/wsdl/120}StoreSoapBinding"
+        import requests
+        import urllib3
+        from requests.auth import HTTPBasicAuth
+
+        if self.__session is None:
+            self.__session = requests.Session()
         self.__session.auth = HTTPBasicAuth(username, password)
+        self.__capabilities = None
+        self.__capabilities_error = None
+        self.__url = url
+        self.__is_raw = is_raw
+        self.__xml_out_type = xml_out_type
+        self.__request_compression = request_compression
+        self.__timeout = timeout
+        self.__max_rate = max_rate
         try:
-            self.__client = Client(transport=Transport(session=self.__session), wsdl=wsdl_file_path)
-            self.__service = self.__client.create_service(witsml_binding_uri, url)
-            return self.__test()
-        except requests.exceptions.SSLError:
-            self.__session.verify = False
-            self.__client = Client(transport=Transport(session=self.__session), wsdl=wsdl_file_path)
-            self.__service = self.__client.create_service(witsml_binding_uri, url)
-            return self.__test()
+            try:
+                self.__create_service()
+                status = self.__test()
+            except requests.exceptions.SSLError:
+                # retry without certificate verification, silence its warnings
+                urllib3.disable_warnings()
+                self.__session.verify = False
+                self.__create_service()
+                with metric.retrying(1):
+                    status = self.__test()
         except Exception as e:
             print(str(e))
             return False
 
-    def service(self) -> proxy.ServiceProxy:
+        # discover and cache server capabilities (WMLS_GetCap)
+        if status:
+            self.__capabilities = self.__get_capabilities()
+        return status
+
+    def service(self) -> "zeep.proxy.ServiceProxy":
         """
         Get connected client's service for non-common API function call and custom operation.
 
         Returns
         -------
         zeep.proxy.ServiceProxy
-            Service proxy for calling API functions
+            Service proxy for calling API functions. None in raw transport mode.
         """
         return self.__service
 
+    def capabilities(self) -> model.ServerCapabilitiesModel:
+        """
+        Get WITSML server capabilities discovered (WMLS_GetCap) and cached on connect.
+
+        Returns
+        -------
+        jeng.model.ServerCapabilitiesModel
+            Server capabilities or None if not connected or the server doesn't support
+            WMLS_GetCap (see `capabilities_error()`).
+        """
+        return self.__capabilities
+
+    def capabilities_error(self) -> Exception:
+        """
+        Get the reason capabilities discovery (WMLS_GetCap) failed on connect.
+
+        Returns
+        -------
+        Exception
+            SOAP fault, transport error or `jeng.exception.JengReplyErrorException` of the
+            WMLS_GetCap request, or None if it succeeded or wasn't requested.
+        """
+        return self.__capabilities_error
+
+    def url(self) -> str:
+        """
+        Get WITSML server URL of the connection.
+
+        Returns
+        -------
+        str
+            WITSML server URL or None if not connected.
+        """
+        return self.__url
+
     def get_from_store(
         self,
         wml_type_in: str,
         xml_in: str,
         return_element: str,
+        request_latest_values: int = None,
     ):
         """
         WMLS_GetFromStore wrapper.
@@ -103,20 +331,25 @@ class WitsmlClient:
             Indicates which elements and attributes are requested to be returned in addition
             to data-object selection items.
 
+        request_latest_values: int, default None
+            Return only the latest N values of each growing object curve (within the query
+            index range). Check server's `max_request_latest_values` capability.
+
         Returns
         -------
         Any
             API call reply
         """
-        try:
-            return self.__service.WMLS_GetFromStore(
-                WMLtypeIn=wml_type_in,
-                QueryIn=xml_in,
-                OptionsIn=f"returnElements={return_element}",
-                CapabilitiesIn=xsd.SkipValue,
-            )
-        except AttributeError:
-            raise exception.JengClientNoneException
+        options_in = f"returnElements={return_element}"
+        if request_latest_values is not None:
+            options_in += f";requestLatestValues={request_latest_values}"
+        return self.__call(
+            "WMLS_GetFromStore",
+            WMLtypeIn=wml_type_in,
+            QueryIn=xml_in,
+            OptionsIn=options_in,
+            CapabilitiesIn=None,
+        )
 
     def add_to_store(
         self,
@@ -139,15 +372,13 @@ class WitsmlClient:
         Any
             API call reply
         """
-        try:
-            return self.__service.WMLS_AddToStore(
-                WMLtypeIn=wml_type_in,
-                XMLin=xml_in,
-                OptionsIn=xsd.SkipValue,
-                CapabilitiesIn=xsd.SkipValue,
-            )
-        except AttributeError:
-            raise exception.JengClientNoneException
+        return self.__call(
+            "WMLS_AddToStore",
+            WMLtypeIn=wml_type_in,
+            XMLin=xml_in,
+            OptionsIn=None,
+            CapabilitiesIn=None,
+        )
 
     def update_in_store(
         self,
@@ -170,15 +401,13 @@ class WitsmlClient:
         Any
             API call reply.
         """
-        try:
-            return self.__service.WMLS_UpdateInStore(
-                WMLtypeIn=wml_type_in,
-                XMLin=xml_in,
-                OptionsIn=xsd.SkipValue,
-                CapabilitiesIn=xsd.SkipValue,
-            )
-        except AttributeError:
-            raise exception.JengClientNoneException
+        return self.__call(
+            "WMLS_UpdateInStore",
+            WMLtypeIn=wml_type_in,
+            XMLin=xml_in,
+            OptionsIn=None,
+            CapabilitiesIn=None,
+        )
 
     def delete_from_store(
         self,
@@ -201,12 +430,256 @@ class WitsmlClient:
         Any
             API call reply.
         """
-        try:
-            return self.__service.WMLS_DeleteFromStore(
-                WMLtypeIn=wml_type_in,
-                QueryIn=xml_in,
-                OptionsIn=xsd.SkipValue,
-                CapabilitiesIn=xsd.SkipValue,
+        return self.__call(
+            "WMLS_DeleteFromStore",
+            WMLtypeIn=wml_type_in,
+            QueryIn=xml_in,
+            OptionsIn=None,
+            CapabilitiesIn=None,
+        )
+
+    def batch(
+        self,
+        operation_list: typing.List[model.BatchOperationModel],
+        max_workers: int = 4,
+        is_future: bool = False,
+    ) -> typing.List[model.BatchResultModel]:
+        """
+        Execute many store operations concurrently on a thread pool sharing the client's
+        pooled connections. An operation failure doesn't stop the others, its exception is
+        returned in the result instead.
+
+        Parameters
+        ----------
+        operation_list: List[jeng.model.BatchOperationModel]
+            Operations to be executed.
+
+        max_workers: int, default 4
+            Maximum number of operations in flight at the same time (concurrency cap).
+
+        is_future: bool, default False
+            Return futures immediately instead of waiting for every operation to complete.
+
+        Returns
+        -------
+        List[jeng.model.BatchResultModel] | List[concurrent.futures.Future]
+            Results (or futures resolving to results) in the same order as operation_list.
+        """
+        for operation in operation_list:
+            if operation.function not in BATCH_FUNCTION_LIST:
+                raise exception.JengBatchFunctionNotSupportedException(operation.function)
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.__resize_pool(max_workers)
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jeng-batch")
+        future_list = [executor.submit(self.__batch_call, operation) for operation in operation_list]
+
+        # worker threads finish the queued operations and exit on their own
+        executor.shutdown(wait=not is_future)
+        if is_future:
+            return future_list
+        return [future.result() for future in future_list]
+
+    def get_log_header(
+        self,
+        log_basic_info: model.LogBasicInfoModel,
+        is_refresh: bool = False,
+    ) -> typing.List[model.LogCurveInfoModel]:
+        """
+        Get log curve info from log header (returnElements=header-only). The header is
+        fetched once per log and cached by the client.
+
+        Parameters
+        ----------
+        log_basic_info: jeng.model.LogBasicInfoModel
+            Well, wellbore and log information of the log.
+
+        is_refresh: bool, default False
+            Fetch the header again, e.g. after curves were added to the log.
+
+        Returns
+        -------
+        List[jeng.model.LogCurveInfoModel]
+            A list of curve info.
+        """
+        key = (log_basic_info.well_uid, log_basic_info.wellbore_uid, log_basic_info.log_uid)
+        if not is_refresh and key in self.__log_header_dict:
+            return self.__log_header_dict[key]
+
+        reply = self.get_from_store(
+            wml_type_in="log",
+            xml_in=generate.generate_log_query(log_basic_info=log_basic_info),
+            return_element="header-only",
+        )
+        if reply.Result < 1:
+            raise exception.JengReplyErrorException(reply.Result, reply.SuppMsgOut)
+        log_curve_info_list = parse.parse_log_into_curve_info(xml_out=reply.XMLout)
+        self.__log_header_dict[key] = log_curve_info_list
+        return log_curve_info_list
+
+    def get_log_data(
+        self,
+        log_basic_info: model.LogBasicInfoModel,
+        mnemonic_list: typing.List[str] = None,
+        log_index: model.LogIndexModel = None,
+        is_low_memory: bool = False,
+        null_value_list: typing.List[str] = None,
+    ) -> "pandas.DataFrame":
+        """
+        Get typed log data with data-only requests, combined with the cached log header (see
+        `get_log_header()`) for curve selection, units and data types. Truncated replies are
+        followed with requests from the last received index.
+
+        Parameters
+        ----------
+        log_basic_info: jeng.model.LogBasicInfoModel
+            Well, wellbore and log information of the log.
+
+        mnemonic_list: List[str], default None
+            Curves to be fetched (the index curve is always included). If set None, all
+            curves of the log are fetched.
+
+        log_index: jeng.model.LogIndexModel, default None
+            Index range to be fetched. If set None, the whole log is fetched.
+
+        is_low_memory: bool, default False
+            Downcast floats and use sparse and categorical columns (see
+            `jeng.parse.compact_log_dataframe()`).
+
+        null_value_list: List[str], default None
+            Values to be treated as missing in low-memory mode, e.g. log nullValue ['-999.25'].
+
+        Returns
+        -------
+        pandas.DataFrame
+            Typed DataFrame (see `jeng.parse.convert_log_dataframe()`) with mnemonic as
+            column name, index curve first.
+        """
+        import pandas
+
+        header_list = self.get_log_header(log_basic_info)
+        index_curve = fetch.get_index_curve(header_list)
+        log_curve_info_list = [index_curve] + [
+            curve_info
+            for curve_info in header_list
+            if not curve_info.is_index_curve and (mnemonic_list is None or curve_info.mnemonic in mnemonic_list)
+        ]
+        if log_index is None:
+            index_type = model.LogIndexTypeEnum.TIME
+            if index_curve.index_type != "date time":
+                index_type = model.LogIndexTypeEnum.NON_TIME
+            log_index = model.LogIndexModel(start=None, end=None, type=index_type)
+
+        dataframe_list = list(fetch.iter_log_data(self, log_basic_info, log_curve_info_list, log_index))
+        if dataframe_list:
+            dataframe = pandas.concat(dataframe_list, ignore_index=True)
+        else:
+            dataframe = pandas.DataFrame(columns=[curve_info.mnemonic for curve_info in log_curve_info_list])
+        dataframe = parse.convert_log_dataframe(dataframe, log_curve_info_list)
+        if is_low_memory:
+            dataframe = parse.compact_log_dataframe(
+                dataframe,
+                index_mnemonic=index_curve.mnemonic,
+                null_value_list=null_value_list,
             )
-        except AttributeError:
-            raise exception.JengClientNoneException
+        return dataframe
+
+    def tail_log(
+        self,
+        log_basic_info: model.LogBasicInfoModel,
+        log_curve_info_list: typing.List[model.LogCurveInfoModel],
+        start_index: str = None,
+        index_type: model.LogIndexTypeEnum = model.LogIndexTypeEnum.TIME,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+    ) -> typing.Iterator[model.LogTailIncrementModel]:
+        """
+        Poll a growing log and yield only rows newer than the last seen (high-water) index,
+        typed by curve info typeLogData (see `jeng.parse.convert_log_dataframe()`). The
+        polling interval is reset to min_interval whenever new rows arrive and doubled (up
+        to max_interval) on every idle poll.
+
+        Parameters
+        ----------
+        log_basic_info: jeng.model.LogBasicInfoModel
+            Well, wellbore and log information of the log to tail.
+
+        log_curve_info_list: List[jeng.model.LogCurveInfoModel]
+            A list of curve info to be tailed, e.g. from `get_log_header()`. The index curve
+            is required.
+
+        start_index: str, default None
+            High-water index to tail from (exclusive). If set None, the first poll returns
+            whatever the WITSML server returns for the whole log.
+
+        index_type: jeng.model.LogIndexTypeEnum, default jeng.model.LogIndexTypeEnum.TIME
+            Type of log index: time or non-time index.
+
+        min_interval: float, default 1.0
+            Polling interval in seconds while data is arriving.
+
+        max_interval: float, default 60.0
+            Upper bound of polling interval in seconds for an idle log.
+
+        Returns
+        -------
+        Iterator[jeng.model.LogTailIncrementModel]
+            Generator of new rows. Close the generator to stop tailing. A failed poll raises
+            `jeng.exception.JengReplyErrorException`.
+        """
+        import pandas
+
+        index_mnemonic = fetch.get_index_curve(log_curve_info_list).mnemonic
+
+        high_water_index = start_index
+        interval = min_interval
+        follow_up_count = 0
+        while True:
+            query = generate.generate_log_query(
+                log_basic_info=log_basic_info,
+                log_curve_info_list=log_curve_info_list,
+                log_index=model.LogIndexModel(start=high_water_index, end=None, type=index_type),
+                is_include_log_curve_info=False,
+                is_include_mnemonic_list=True,
+            )
+            with metric.retrying(follow_up_count):
+                reply = self.get_from_store(wml_type_in="log", xml_in=query, return_element="data-only")
+            if reply.Result < 1:
+                raise exception.JengReplyErrorException(reply.Result, reply.SuppMsgOut)
+
+            dataframe = None
+            if reply.XMLout:
+                try:
+                    dataframe = parse.parse_log_into_dataframe(xml_out=reply.XMLout)
+                except exception.JengReplyContainsNoDataAndMnemonicException:
+                    dataframe = None
+
+            # start index is inclusive, drop rows already yielded
+            if dataframe is not None and high_water_index is not None:
+                if index_type == model.LogIndexTypeEnum.TIME:
+                    index_series = pandas.to_datetime(dataframe[index_mnemonic], utc=True, format="ISO8601")
+                    high_water = pandas.to_datetime(high_water_index, utc=True, format="ISO8601")
+                else:
+                    index_series = pandas.to_numeric(dataframe[index_mnemonic])
+                    high_water = float(high_water_index)
+                dataframe = dataframe[index_series > high_water].reset_index(drop=True)
+
+            if dataframe is not None and not dataframe.empty:
+                high_water_index = str(dataframe[index_mnemonic].iloc[-1])
+                interval = min_interval
+                yield model.LogTailIncrementModel(
+                    dataframe=parse.convert_log_dataframe(dataframe, log_curve_info_list),
+                    start=str(dataframe[index_mnemonic].iloc[0]),
+                    end=high_water_index,
+                )
+
+                # partial success (server truncated the reply), fetch the rest immediately
+                if reply.Result == 2:
+                    follow_up_count += 1
+                    continue
+                follow_up_count = 0
+                time.sleep(interval)
+            else:
+                time.sleep(interval)
+                interval = min(max_interval, interval * 2)
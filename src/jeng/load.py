@@ -0,0 +1,356 @@
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+import typing
+
+from jeng import cli, emulator, generate, jeng, model
+
+# numpy and pandas are imported on first use to keep import fast
+if typing.TYPE_CHECKING:
+    import numpy
+    import pandas
+
+OPERATION_ADD = "add"
+OPERATION_UPDATE = "update"
+OPERATION_GET = "get"
+DEFAULT_MIX = "add=1,update=8,get=4"
+WELL_UID = "JENG_LOAD_WELL"
+WELLBORE_UID = "JENG_LOAD_WELLBORE"
+PERCENTILE_LIST = [50, 90, 95, 99]
+
+
+def parse_mix(mix: str) -> typing.Dict[str, float]:
+    """
+    Parse operation mix, e.g. 'add=1,update=8,get=4'.
+
+    Parameters
+    ----------
+    mix: str
+        Comma separated operation weights.
+
+    Returns
+    -------
+    Dict[str, float]
+        Weight keyed by operation.
+    """
+    mix_dict = {}
+    for item in mix.split(","):
+        operation, weight = item.split("=", 1)
+        if operation not in [OPERATION_ADD, OPERATION_UPDATE, OPERATION_GET]:
+            raise ValueError(f"Unknown operation '{operation}' in mix")
+        mix_dict[operation] = float(weight)
+    return mix_dict
+
+
+def make_log_curve_info_list(curves: int) -> typing.List[model.LogCurveInfoModel]:
+    """
+    Make depth log curve info list with curves - 1 value curves.
+
+    Parameters
+    ----------
+    curves: int
+        Number of curves including the index curve.
+
+    Returns
+    -------
+    List[jeng.model.LogCurveInfoModel]
+        Log curve info list.
+    """
+    log_curve_info_list = [
+        model.LogCurveInfoModel(
+            uid="DEPT",
+            mnemonic="DEPT",
+            unit="m",
+            curve_description="Depth Index",
+            type_log_data="double",
+            index_type="measured depth",
+            is_index_curve=True,
+        )
+    ]
+    for curve in range(1, curves):
+        log_curve_info_list.append(
+            model.LogCurveInfoModel(
+                uid=f"CURVE_{curve:03d}",
+                mnemonic=f"CURVE_{curve:03d}",
+                unit="unitless",
+                curve_description=f"Generated curve {curve}",
+                type_log_data="double",
+            )
+        )
+    return log_curve_info_list
+
+
+def make_dataframe(
+    log_curve_info_list: typing.List[model.LogCurveInfoModel],
+    start_depth: float,
+    rows: int,
+    generator: "numpy.random.Generator",
+) -> "pandas.DataFrame":
+    """
+    Make random walk curve data on a 0.1 m depth step.
+
+    Parameters
+    ----------
+    log_curve_info_list: List[jeng.model.LogCurveInfoModel]
+        Log curve info list, first curve is the index curve.
+
+    start_depth: float
+        Depth of the first row.
+
+    rows: int
+        Number of rows.
+
+    generator: numpy.random.Generator
+        Random generator.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Curve data with mnemonic as column name.
+    """
+    import numpy
+    import pandas
+
+    column_dict = {log_curve_info_list[0].mnemonic: numpy.round(start_depth + numpy.arange(rows) * 0.1, 1)}
+    for curve_info in log_curve_info_list[1:]:
+        column_dict[curve_info.mnemonic] = numpy.round(100 + generator.standard_normal(rows).cumsum(), 4)
+    return pandas.DataFrame(column_dict)
+
+
+class LoadWorker(threading.Thread):
+    "A load generating thread that owns one client and one realtime log."
+
+    def __init__(self, worker: int, args: argparse.Namespace, mix_dict: typing.Dict[str, float], deadline: float):
+        import numpy
+
+        super().__init__(daemon=True)
+        self.worker = worker
+        self.args = args
+        self.mix_dict = mix_dict
+        self.deadline = deadline
+        self.random = random.Random(args.seed + worker)
+        self.generator = numpy.random.default_rng(args.seed + worker)
+        self.log_curve_info_list = make_log_curve_info_list(args.curves)
+        self.sample_list = []
+        self.log_count = 0
+        self.depth = 0.0
+        self.log_basic_info = None
+
+    def __next_log_basic_info(self) -> model.LogBasicInfoModel:
+        self.log_count += 1
+        self.depth = 0.0
+        return model.LogBasicInfoModel(
+            well_uid=WELL_UID,
+            well_name=WELL_UID,
+            wellbore_uid=WELLBORE_UID,
+            wellbore_name=WELLBORE_UID,
+            log_uid=f"JENG_LOAD_{os.getpid()}_{self.worker}_{self.log_count}",
+            log_name=f"JENG LOAD {self.worker} {self.log_count}",
+        )
+
+    def __query(self, operation: str) -> typing.Tuple[str, int]:
+        if operation == OPERATION_ADD:
+            self.log_basic_info = self.__next_log_basic_info()
+        if operation == OPERATION_GET:
+            start = max(0.0, self.depth - self.args.rows * 0.1)
+            query = generate.generate_log_query(
+                log_basic_info=self.log_basic_info,
+                log_curve_info_list=self.log_curve_info_list,
+                log_index=model.LogIndexModel(
+                    start=str(round(start, 1)),
+                    end=str(round(self.depth, 1)),
+                    type=model.LogIndexTypeEnum.NON_TIME,
+                ),
+                is_include_log_curve_info=False,
+            )
+            return query, 0
+
+        dataframe = make_dataframe(self.log_curve_info_list, self.depth, self.args.rows, self.generator)
+        self.depth += self.args.rows * 0.1
+        query = generate.generate_log_query(
+            log_basic_info=self.log_basic_info,
+            log_curve_info_list=self.log_curve_info_list,
+            dataframe=dataframe,
+            is_include_log_curve_info=operation == OPERATION_ADD,
+        )
+        return query, self.args.rows
+
+    def run(self):
+        try:
+            client = cli.connect(self.args)
+        except Exception as e:
+            self.sample_list.append((OPERATION_ADD, 0.0, 0, type(e).__name__))
+            return
+        operation_list = list(self.mix_dict)
+        weight_list = [self.mix_dict[operation] for operation in operation_list]
+        while time.perf_counter() < self.deadline:
+            # a log must exist before update and get
+            operation = self.random.choices(operation_list, weight_list)[0]
+            if self.log_basic_info is None:
+                operation = OPERATION_ADD
+            query, rows = self.__query(operation)
+
+            start = time.perf_counter()
+            error = None
+            try:
+                if operation == OPERATION_ADD:
+                    reply = client.add_to_store(wml_type_in="log", xml_in=query)
+                elif operation == OPERATION_UPDATE:
+                    reply = client.update_in_store(wml_type_in="log", xml_in=query)
+                else:
+                    reply = client.get_from_store(wml_type_in="log", xml_in=query, return_element="data-only")
+                if reply.Result < 0:
+                    error = f"Result {reply.Result}"
+            except Exception as e:
+                error = type(e).__name__
+            self.sample_list.append((operation, time.perf_counter() - start, rows, error))
+
+
+def prepare_well_wellbore(client: jeng.WitsmlClient):
+    """
+    Create load test well and wellbore, if not exist.
+
+    Parameters
+    ----------
+    client: jeng.WitsmlClient
+        Connected client.
+    """
+    client.add_to_store(
+        wml_type_in="well",
+        xml_in=(
+            f'<wells xmlns="{generate.WITSML_NAMESPACE}" version="{generate.WITSML_VERSION}">'
+            f'<well uid="{WELL_UID}"><name>{WELL_UID}</name><timeZone>Z</timeZone></well></wells>'
+        ),
+    )
+    client.add_to_store(
+        wml_type_in="wellbore",
+        xml_in=(
+            f'<wellbores xmlns="{generate.WITSML_NAMESPACE}" version="{generate.WITSML_VERSION}">'
+            f'<wellbore uidWell="{WELL_UID}" uid="{WELLBORE_UID}"><nameWell>{WELL_UID}</nameWell>'
+            f"<name>{WELLBORE_UID}</name></wellbore></wellbores>"
+        ),
+    )
+
+
+def summarize(sample_list: typing.List[typing.Tuple], elapsed: float) -> typing.Dict:
+    """
+    Summarize latency percentiles, throughput and error rate per operation.
+
+    Parameters
+    ----------
+    sample_list: List[Tuple]
+        (operation, latency, rows, error) of every request.
+
+    elapsed: float
+        Duration of the load test in seconds.
+
+    Returns
+    -------
+    Dict
+        Summary keyed by operation, with 'total' for all operations.
+    """
+    import numpy
+
+    summary_dict = {}
+    for operation in [OPERATION_ADD, OPERATION_UPDATE, OPERATION_GET, "total"]:
+        selected_list = [sample for sample in sample_list if operation in ["total", sample[0]]]
+        if not selected_list:
+            continue
+        latency_array = numpy.array([sample[1] for sample in selected_list])
+        error_count = sum(1 for sample in selected_list if sample[3] is not None)
+        summary_dict[operation] = {
+            "count": len(selected_list),
+            "error_count": error_count,
+            "error_rate": round(error_count / len(selected_list), 4),
+            "throughput_per_second": round(len(selected_list) / elapsed, 2),
+            "rows_per_second": round(sum(sample[2] for sample in selected_list) / elapsed, 1),
+            "latency_mean_ms": round(latency_array.mean() * 1000, 2),
+            "latency_max_ms": round(latency_array.max() * 1000, 2),
+            **{
+                f"latency_p{percentile}_ms": round(numpy.percentile(latency_array, percentile) * 1000, 2)
+                for percentile in PERCENTILE_LIST
+            },
+        }
+        error_dict = {}
+        for sample in selected_list:
+            if sample[3] is not None:
+                error_dict[sample[3]] = error_dict.get(sample[3], 0) + 1
+        if error_dict:
+            summary_dict[operation]["errors"] = error_dict
+    return summary_dict
+
+
+def main(argv: typing.List[str] = None) -> int:
+    """
+    Entry point of `jeng-load` synthetic load generator.
+
+    Parameters
+    ----------
+    argv: List[str], default None
+        Command line arguments. None uses sys.argv.
+
+    Returns
+    -------
+    int
+        Exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog="jeng-load",
+        description="Drive a mix of realtime log add, update and get traffic against a WITSML endpoint.",
+    )
+    cli.add_connection_arguments(parser)
+    parser.add_argument("--emulator", action="store_true", help="run against a local WITSML store emulator")
+    parser.add_argument("--emulator-latency", type=float, default=0.0, help="emulator latency in seconds")
+    parser.add_argument("--workers", type=int, default=4, help="concurrent writers and readers")
+    parser.add_argument("--duration", type=float, default=30.0, help="load test duration in seconds")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"operation weights (default: {DEFAULT_MIX})")
+    parser.add_argument("--rows", type=int, default=10, help="rows per add / update / get request")
+    parser.add_argument("--curves", type=int, default=20, help="curves per log including index curve")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="write JSON summary to file")
+    args = parser.parse_args(argv)
+    mix_dict = parse_mix(args.mix)
+
+    store = None
+    if args.emulator:
+        store = emulator.WitsmlStoreEmulator(latency=args.emulator_latency)
+        args.url = store.start()
+    if not args.url:
+        parser.error("--url (or JENG_CONN_URL) is required unless --emulator is set")
+
+    try:
+        prepare_well_wellbore(cli.connect(args))
+        start = time.perf_counter()
+        worker_list = [LoadWorker(worker, args, mix_dict, start + args.duration) for worker in range(args.workers)]
+        for worker in worker_list:
+            worker.start()
+        for worker in worker_list:
+            worker.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        if store is not None:
+            store.stop()
+
+    sample_list = [sample for worker in worker_list for sample in worker.sample_list]
+    report = {
+        "url": args.url,
+        "workers": args.workers,
+        "duration_s": round(elapsed, 2),
+        "mix": mix_dict,
+        "rows": args.rows,
+        "curves": args.curves,
+        "summary": summarize(sample_list, elapsed),
+    }
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
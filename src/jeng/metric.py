@@ -0,0 +1,177 @@
+import contextlib
+import threading
+import time
+import typing
+import warnings
+
+from jeng import model
+
+__hook_list: typing.List[typing.Callable[[model.OperationMetricModel], None]] = []
+__local = threading.local()
+
+
+def add_hook(hook: typing.Callable[[model.OperationMetricModel], None]):
+    """
+    Register an instrumentation hook. Hook is called with `jeng.model.OperationMetricModel`
+    after every instrumented operation (WitsmlClient API call, query generation and reply
+    parsing) on the thread that ran the operation. Instrumentation is disabled (no cost)
+    while no hook is registered.
+
+    Parameters
+    ----------
+    hook: Callable[[jeng.model.OperationMetricModel], None]
+        Callback, e.g. to observe a Prometheus histogram or record an OpenTelemetry span.
+    """
+    if hook not in __hook_list:
+        __hook_list.append(hook)
+
+
+def remove_hook(hook: typing.Callable[[model.OperationMetricModel], None]):
+    """
+    Unregister an instrumentation hook.
+
+    Parameters
+    ----------
+    hook: Callable[[jeng.model.OperationMetricModel], None]
+        Callback registered with `jeng.metric.add_hook()`.
+    """
+    if hook in __hook_list:
+        __hook_list.remove(hook)
+
+
+def is_enabled() -> bool:
+    """
+    Check whether any instrumentation hook is registered.
+
+    Returns
+    -------
+    bool
+        True if instrumentation is enabled.
+    """
+    return len(__hook_list) > 0
+
+
+def begin(operation: str, is_network: bool = False) -> model.OperationMetricModel:
+    """
+    Start measuring an operation.
+
+    Parameters
+    ----------
+    operation: str
+        Operation name.
+
+    is_network: bool, default False
+        Set True for operations with HTTP request, so the transport can record network
+        time and size through `jeng.metric.current()`.
+
+    Returns
+    -------
+    jeng.model.OperationMetricModel
+        Metric record or None if instrumentation is disabled.
+    """
+    if not __hook_list:
+        return None
+    metric = model.OperationMetricModel(
+        operation=operation,
+        start_time=time.perf_counter(),
+        retry_count=getattr(__local, "retry_count", 0),
+    )
+    if is_network:
+        __local.metric = metric
+    return metric
+
+
+@contextlib.contextmanager
+def retrying(retry_count: int) -> typing.Iterator[None]:
+    """
+    Record operations begun on the current thread within the context as retries, e.g. a
+    reconnect or a follow-up request of a truncated reply.
+
+    Parameters
+    ----------
+    retry_count: int
+        Number of retries so far, set into `retry_count` of the metric records.
+    """
+    previous = getattr(__local, "retry_count", 0)
+    __local.retry_count = retry_count
+    try:
+        yield
+    finally:
+        __local.retry_count = previous
+
+
+def current() -> model.OperationMetricModel:
+    """
+    Get metric record of the network operation running on the current thread.
+
+    Returns
+    -------
+    jeng.model.OperationMetricModel
+        Metric record or None if instrumentation is disabled.
+    """
+    return getattr(__local, "metric", None)
+
+
+def begin_network(metric: model.OperationMetricModel, byte_out: int):
+    """
+    Mark the end of request serialization and the start of HTTP request.
+
+    Parameters
+    ----------
+    metric: jeng.model.OperationMetricModel
+        Metric record from `jeng.metric.begin()`.
+
+    byte_out: int
+        Request body size in bytes as sent on the wire.
+    """
+    metric.serialize_time = time.perf_counter() - metric.start_time
+    metric.byte_out = byte_out
+
+
+def end_network(metric: model.OperationMetricModel, byte_in: int):
+    """
+    Mark the end of HTTP request and the start of reply deserialization.
+
+    Parameters
+    ----------
+    metric: jeng.model.OperationMetricModel
+        Metric record from `jeng.metric.begin()`.
+
+    byte_in: int
+        Reply body size in bytes as received on the wire.
+    """
+    metric.network_time = time.perf_counter() - metric.start_time - metric.serialize_time
+    metric.byte_in = byte_in
+
+
+def end(metric: model.OperationMetricModel, error: Exception = None, **field_dict):
+    """
+    Finish measuring an operation and pass the metric record to every hook.
+
+    Parameters
+    ----------
+    metric: jeng.model.OperationMetricModel
+        Metric record from `jeng.metric.begin()`.
+
+    error: Exception, default None
+        Exception raised by the operation, if any.
+
+    **field_dict
+        Additional metric fields, e.g. row_count and curve_count.
+    """
+    metric.total_time = time.perf_counter() - metric.start_time
+    if metric.network_time is not None:
+        metric.deserialize_time = metric.total_time - metric.serialize_time - metric.network_time
+    if error is not None:
+        metric.error = type(error).__name__
+    for key, value in field_dict.items():
+        setattr(metric, key, value)
+    if current() is metric:
+        __local.metric = None
+
+    # instrumentation must never break the operation
+    for hook in list(__hook_list):
+        try:
+            hook(metric)
+        except Exception as e:
+            warnings.warn(f"Instrumentation hook failed: {e}")
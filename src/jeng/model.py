@@ -1,3 +1,6 @@
+import typing
+
+
 class LogIndexTypeEnum:
     """
     Specifying type of log index: time or non-time. To be used by
@@ -99,6 +102,90 @@ class LogBasicInfoModel:
         self.log_name = log_name
 
 
+class TrajectoryBasicInfoModel:
+    """
+    Data structure for specifying trajectory info.
+
+    Parameters
+    ----------
+    well_uid: str
+        Well unique ID.
+
+    well_name: str
+        Well name.
+
+    wellbore_uid: str
+        Wellbore unique ID.
+
+    wellbore_name: str
+        Wellbore name.
+
+    trajectory_uid: str
+        Trajectory unique ID.
+
+    trajectory_name: str
+        Trajectory name.
+    """
+
+    def __init__(
+        self,
+        well_uid: str,
+        well_name: str,
+        wellbore_uid: str,
+        wellbore_name: str,
+        trajectory_uid: str,
+        trajectory_name: str,
+    ) -> None:
+        self.well_uid = well_uid
+        self.well_name = well_name
+        self.wellbore_uid = wellbore_uid
+        self.wellbore_name = wellbore_name
+        self.trajectory_uid = trajectory_uid
+        self.trajectory_name = trajectory_name
+
+
+class MudLogBasicInfoModel:
+    """
+    Data structure for specifying mud log info.
+
+    Parameters
+    ----------
+    well_uid: str
+        Well unique ID.
+
+    well_name: str
+        Well name.
+
+    wellbore_uid: str
+        Wellbore unique ID.
+
+    wellbore_name: str
+        Wellbore name.
+
+    mud_log_uid: str
+        Mud log unique ID.
+
+    mud_log_name: str
+        Mud log name.
+    """
+
+    def __init__(
+        self,
+        well_uid: str,
+        well_name: str,
+        wellbore_uid: str,
+        wellbore_name: str,
+        mud_log_uid: str,
+        mud_log_name: str,
+    ) -> None:
+        self.well_uid = well_uid
+        self.well_name = well_name
+        self.wellbore_uid = wellbore_uid
+        self.wellbore_name = wellbore_name
+        self.mud_log_uid = mud_log_uid
+        self.mud_log_name = mud_log_name
+
+
 class LogIndexModel:
     """
     Data structure for specifying an interval of data to retrieve.
@@ -106,10 +193,10 @@ class LogIndexModel:
     Parameters
     ----------
     start: str
-        Start of the interval.
+        Start of the interval. None for an interval without start.
 
     end: str
-        End of the interval.
+        End of the interval. None for an interval without end.
 
     type: jeng.model.LogIndexTypeEnum, default jeng.model.LogIndexTypeEnum.TIME
         Type of log index: time or non-time index.
@@ -124,3 +211,507 @@ class LogIndexModel:
         self.start = start
         self.end = end
         self.type = type
+
+
+class LogTailIncrementModel:
+    """
+    Data structure for new log data received by `jeng.jeng.WitsmlClient.tail_log()`.
+
+    Parameters
+    ----------
+    dataframe: pandas.DataFrame
+        New typed rows with mnemonic as column name.
+
+    start: str
+        Index of the first new row.
+
+    end: str
+        Index of the last new row (the new high-water index).
+    """
+
+    def __init__(
+        self,
+        dataframe,
+        start: str,
+        end: str,
+    ) -> None:
+        self.dataframe = dataframe
+        self.start = start
+        self.end = end
+
+
+class DataObjectCapabilityModel:
+    """
+    Data structure for a WITSML data-object supported by a WITSML server function.
+
+    Parameters
+    ----------
+    name: str
+        WITSML data-object type, e.g. 'log'.
+
+    max_data_nodes: int, default None
+        Maximum number of data nodes (rows) per request. None if not limited.
+
+    max_data_points: int, default None
+        Maximum number of data points (rows x curves) per request. None if not limited.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_data_nodes: int = None,
+        max_data_points: int = None,
+    ) -> None:
+        self.name = name
+        self.max_data_nodes = max_data_nodes
+        self.max_data_points = max_data_points
+
+
+class ServerCapabilitiesModel:
+    """
+    Data structure for WITSML server capabilities (WMLS_GetCap reply).
+
+    Parameters
+    ----------
+    name: str, default None
+        WITSML server name.
+
+    vendor: str, default None
+        WITSML server vendor.
+
+    version: str, default None
+        WITSML server version.
+
+    schema_version_list: List[str], default None
+        Supported WITSML data schema versions.
+
+    function_dict: Dict[str, List[jeng.model.DataObjectCapabilityModel]], default None
+        Supported data-objects keyed by function name, e.g. 'WMLS_GetFromStore'.
+
+    max_request_latest_values: int, default None
+        Maximum value of 'requestLatestValues' option.
+
+    max_request_size: int, default None
+        Maximum request size in characters. Not part of WITSML 1.4.1.1 capabilities and
+        only set when the server reports a 'maxRequestSize' element.
+
+    growing_timeout_period_dict: Dict[str, int], default None
+        Growing timeout period in seconds keyed by data-object type.
+
+    is_support_uom_conversion: bool, default False
+        Whether the server supports unit of measure conversion.
+
+    compression_method: str, default None
+        Supported compression method, e.g. 'gzip'.
+
+    is_cascaded_delete: bool, default False
+        Whether the server supports 'cascadedDelete' option.
+    """
+
+    def __init__(
+        self,
+        name: str = None,
+        vendor: str = None,
+        version: str = None,
+        schema_version_list: typing.List[str] = None,
+        function_dict: typing.Dict[str, typing.List[DataObjectCapabilityModel]] = None,
+        max_request_latest_values: int = None,
+        max_request_size: int = None,
+        growing_timeout_period_dict: typing.Dict[str, int] = None,
+        is_support_uom_conversion: bool = False,
+        compression_method: str = None,
+        is_cascaded_delete: bool = False,
+    ) -> None:
+        self.name = name
+        self.vendor = vendor
+        self.version = version
+        self.schema_version_list = schema_version_list or []
+        self.function_dict = function_dict or {}
+        self.max_request_latest_values = max_request_latest_values
+        self.max_request_size = max_request_size
+        self.growing_timeout_period_dict = growing_timeout_period_dict or {}
+        self.is_support_uom_conversion = is_support_uom_conversion
+        self.compression_method = compression_method
+        self.is_cascaded_delete = is_cascaded_delete
+
+    def get_data_object(self, function: str, wml_type_in: str) -> DataObjectCapabilityModel:
+        """
+        Get data-object capability of a function.
+
+        Parameters
+        ----------
+        function: str
+            WITSML API function name, e.g. 'WMLS_GetFromStore'.
+
+        wml_type_in: str
+            WITSML data-object type, e.g. 'log'.
+
+        Returns
+        -------
+        jeng.model.DataObjectCapabilityModel
+            Data-object capability or None if not supported.
+        """
+        for data_object in self.function_dict.get(function, []):
+            if data_object.name == wml_type_in:
+                return data_object
+        return None
+
+    def is_supported(self, function: str, wml_type_in: str = None) -> bool:
+        """
+        Check whether a function (and data-object type) is supported by the server.
+
+        Parameters
+        ----------
+        function: str
+            WITSML API function name, e.g. 'WMLS_GetFromStore'.
+
+        wml_type_in: str, default None
+            WITSML data-object type, e.g. 'log'. If set None, only function is checked.
+
+        Returns
+        -------
+        bool
+            True if supported.
+        """
+        if function not in self.function_dict:
+            return False
+        return wml_type_in is None or self.get_data_object(function, wml_type_in) is not None
+
+    def get_max_rows(self, function: str, wml_type_in: str, curve_count: int) -> int:
+        """
+        Get maximum number of data rows per request, limited by both maxDataNodes and
+        maxDataPoints of the data-object.
+
+        Parameters
+        ----------
+        function: str
+            WITSML API function name, e.g. 'WMLS_GetFromStore'.
+
+        wml_type_in: str
+            WITSML data-object type, e.g. 'log'.
+
+        curve_count: int
+            Number of curves (including index curve) per row.
+
+        Returns
+        -------
+        int
+            Maximum rows per request or None if not limited.
+        """
+        data_object = self.get_data_object(function, wml_type_in)
+        if data_object is None:
+            return None
+        max_row_list = []
+        if data_object.max_data_nodes is not None:
+            max_row_list.append(data_object.max_data_nodes)
+        if data_object.max_data_points is not None:
+            max_row_list.append(max(1, data_object.max_data_points // max(1, curve_count)))
+        return min(max_row_list) if max_row_list else None
+
+
+class RawReplyModel:
+    """
+    Data structure for WMLS function reply parsed by raw transport mode. Attribute and
+    item access mirror zeep reply object, e.g. `reply.Result` and `reply["XMLout"]`.
+
+    Parameters
+    ----------
+    Result: int
+        Return value of the function. A string for WMLS_GetBaseMsg and WMLS_GetVersion.
+
+    XMLout: str | bytes | memoryview, default None
+        WMLS_GetFromStore reply data.
+
+    SuppMsgOut: str, default None
+        Supplemental message.
+
+    CapabilitiesOut: str, default None
+        WMLS_GetCap reply capabilities.
+    """
+
+    def __init__(
+        self,
+        Result,
+        XMLout=None,
+        SuppMsgOut: str = None,
+        CapabilitiesOut: str = None,
+    ) -> None:
+        self.Result = Result
+        self.XMLout = XMLout
+        self.SuppMsgOut = SuppMsgOut
+        self.CapabilitiesOut = CapabilitiesOut
+
+    def __getitem__(self, key: str):
+        return getattr(self, key)
+
+
+class BatchOperationModel:
+    """
+    Data structure for a single store operation executed by `jeng.jeng.WitsmlClient.batch()`.
+
+    Parameters
+    ----------
+    function: str
+        Wrapper API function name: 'get_from_store', 'add_to_store', 'update_in_store' or
+        'delete_from_store'.
+
+    wml_type_in: str
+        WITSML data-object type (see the specific WITSML data schema for the objectType).
+
+    xml_in: str
+        A query template for the operation.
+
+    return_element: str, default 'all'
+        Indicates which elements are returned. Only used by 'get_from_store'.
+
+    request_latest_values: int, default None
+        Return only the latest N values of each curve. Only used by 'get_from_store'.
+    """
+
+    def __init__(
+        self,
+        function: str,
+        wml_type_in: str,
+        xml_in: str,
+        return_element: str = "all",
+        request_latest_values: int = None,
+    ) -> None:
+        self.function = function
+        self.wml_type_in = wml_type_in
+        self.xml_in = xml_in
+        self.return_element = return_element
+        self.request_latest_values = request_latest_values
+
+
+class BatchResultModel:
+    """
+    Data structure for the outcome of a single `jeng.model.BatchOperationModel`.
+
+    Parameters
+    ----------
+    operation: jeng.model.BatchOperationModel
+        Executed operation.
+
+    reply: Any, default None
+        API call reply. None if the operation raised an exception.
+
+    error: Exception, default None
+        Exception raised by the operation. None if the API call replied.
+    """
+
+    def __init__(
+        self,
+        operation: BatchOperationModel,
+        reply=None,
+        error: Exception = None,
+    ) -> None:
+        self.operation = operation
+        self.reply = reply
+        self.error = error
+
+
+class EndpointModel:
+    """
+    Data structure for a WITSML server connected by `jeng.fanout.FanOutClient`.
+
+    Parameters
+    ----------
+    name: str
+        Unique endpoint name, used to tag results, e.g. region or vendor.
+
+    url: str
+        WITSML Store service endpoint.
+
+    username: str
+        Username for user authentication.
+
+    password: str
+        Password for user authentication.
+
+    is_raw: bool, default False
+        Raw transport mode (see `jeng.jeng.WitsmlClient.connect()`).
+
+    timeout: float, default None
+        Seconds to wait for a reply of this endpoint. If set None, the fan-out client
+        timeout is used.
+
+    max_rate: float, default None
+        Maximum requests per second sent to this endpoint. If set None, not limited.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        username: str,
+        password: str,
+        is_raw: bool = False,
+        timeout: float = None,
+        max_rate: float = None,
+    ) -> None:
+        self.name = name
+        self.url = url
+        self.username = username
+        self.password = password
+        self.is_raw = is_raw
+        self.timeout = timeout
+        self.max_rate = max_rate
+
+
+class FanOutResultModel:
+    """
+    Data structure for the outcome of a fan-out call on a single endpoint.
+
+    Parameters
+    ----------
+    endpoint: str
+        Endpoint name.
+
+    reply: Any, default None
+        Call reply. None if the call raised an exception or timed out.
+
+    error: Exception, default None
+        Exception raised by the call. None if the call replied.
+
+    elapsed: float, default None
+        Seconds the call took, including waiting for the rate limit.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        reply=None,
+        error: Exception = None,
+        elapsed: float = None,
+    ) -> None:
+        self.endpoint = endpoint
+        self.reply = reply
+        self.error = error
+        self.elapsed = elapsed
+
+
+class InventoryNodeModel:
+    """
+    Data structure for a data-object of WITSML server inventory tree (well, wellbore or log)
+    built by `jeng.inventory.InventoryCrawler`.
+
+    Parameters
+    ----------
+    object_type: str
+        Data-object type: 'well', 'wellbore' or 'log'.
+
+    uid: str
+        Data-object uid.
+
+    name: str, default None
+        Data-object name.
+
+    child_list: List[jeng.model.InventoryNodeModel], default None
+        Wellbores of a well or logs of a wellbore.
+
+    index_type: str, default None
+        Log index type, e.g. 'date time' or 'measured depth'.
+
+    start_index: str, default None
+        Log start index (startIndex or startDateTimeIndex).
+
+    end_index: str, default None
+        Log end index (endIndex or endDateTimeIndex).
+
+    last_change: str, default None
+        Last change time (commonData dTimLastChange), if replied.
+    """
+
+    def __init__(
+        self,
+        object_type: str,
+        uid: str,
+        name: str = None,
+        child_list: typing.List["InventoryNodeModel"] = None,
+        index_type: str = None,
+        start_index: str = None,
+        end_index: str = None,
+        last_change: str = None,
+    ) -> None:
+        self.object_type = object_type
+        self.uid = uid
+        self.name = name
+        self.child_list = child_list or []
+        self.index_type = index_type
+        self.start_index = start_index
+        self.end_index = end_index
+        self.last_change = last_change
+
+
+class OperationMetricModel:
+    """
+    Data structure for a single instrumented operation, passed to hooks registered with
+    `jeng.metric.add_hook()`. Durations are in seconds and None when not applicable.
+
+    Parameters
+    ----------
+    operation: str
+        Operation name, e.g. 'WMLS_GetFromStore' or 'parse_log_into_dataframe'.
+
+    start_time: float
+        Start of the operation (time.perf_counter()).
+
+    total_time: float, default None
+        Duration of the whole operation.
+
+    serialize_time: float, default None
+        Duration of building the request before it is sent.
+
+    network_time: float, default None
+        Duration of the HTTP request (send and receive).
+
+    deserialize_time: float, default None
+        Duration of parsing the reply after it is received.
+
+    byte_out: int, default None
+        Request body size in bytes as sent on the wire.
+
+    byte_in: int, default None
+        Reply body size in bytes as received on the wire.
+
+    row_count: int, default None
+        Number of data rows generated or parsed.
+
+    curve_count: int, default None
+        Number of curves generated or parsed.
+
+    retry_count: int, default 0
+        Number of retries before this operation: SSL fallback reconnect or follow-up
+        requests of truncated replies (see `jeng.metric.retrying()`).
+
+    error: str, default None
+        Exception class name if the operation failed.
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        start_time: float,
+        total_time: float = None,
+        serialize_time: float = None,
+        network_time: float = None,
+        deserialize_time: float = None,
+        byte_out: int = None,
+        byte_in: int = None,
+        row_count: int = None,
+        curve_count: int = None,
+        retry_count: int = 0,
+        error: str = None,
+    ) -> None:
+        self.operation = operation
+        self.start_time = start_time
+        self.total_time = total_time
+        self.serialize_time = serialize_time
+        self.network_time = network_time
+        self.deserialize_time = deserialize_time
+        self.byte_out = byte_out
+        self.byte_in = byte_in
+        self.row_count = row_count
+        self.curve_count = curve_count
+        self.retry_count = retry_count
+        self.error = error
@@ -1,26 +1,145 @@
 import typing
 
-import pandas
-import xmltodict
+from jeng import exception, metric, model, soap
 
-from jeng import exception, model
+# pandas and xmltodict are imported on first use to keep import fast
+if typing.TYPE_CHECKING:
+    import pandas
 
+# rows of streamed log data buffered as text before they are parsed into a dataframe chunk
+STREAM_CHUNK_ROWS = 10000
 
-def parse_log_into_dataframe(xml_out: str) -> pandas.DataFrame:
+
+def __as_parsable(xml_out):
+    # memoryview and spooled XMLout from raw transport mode are not accepted by the XML parser
+    if isinstance(xml_out, memoryview):
+        return xml_out.tobytes()
+    if isinstance(xml_out, soap.SpooledPart):
+        return xml_out.read()
+    return xml_out
+
+
+def __parse_log_stream(chunk_iterable: typing.Iterable[bytes]) -> "pandas.DataFrame":
+    # stream 'log' XMLout through expat, every STREAM_CHUNK_ROWS data rows are parsed as CSV
+    # text by pandas, so the text buffer stays bounded
+    import csv
+    import io
+    from xml.parsers import expat
+
+    import pandas
+
+    path_list = []
+    text_list = []
+    column_name_list = None
+    data_buffer = io.StringIO()
+    buffer_row_count = 0
+    dataframe_list = []
+
+    def flush():
+        nonlocal data_buffer, buffer_row_count
+        if buffer_row_count == 0:
+            return
+        data_buffer.seek(0)
+        dataframe_list.append(
+            pandas.read_csv(
+                data_buffer,
+                header=None,
+                names=column_name_list,
+                dtype=str,
+                na_filter=False,
+                quoting=csv.QUOTE_NONE,
+                skip_blank_lines=False,
+            )
+        )
+        data_buffer = io.StringIO()
+        buffer_row_count = 0
+
+    def start_element(name, attributes):
+        path_list.append(name.rsplit(":", 1)[-1])
+        text_list.clear()
+
+    def end_element(name):
+        nonlocal column_name_list, buffer_row_count
+        local_name = path_list.pop()
+        if path_list and path_list[-1] == "logData":
+            if local_name == "mnemonicList":
+                column_name_list = "".join(text_list).split(",")
+            elif local_name == "data":
+                data = "".join(text_list)
+                if column_name_list is not None and data.count(",") != len(column_name_list) - 1:
+                    raise exception.JengReplyRowWithMismatchedColumnsException
+                if column_name_list is None:
+                    raise exception.JengReplyContainsNoDataAndMnemonicException
+                data_buffer.write(data)
+                data_buffer.write("\n")
+                buffer_row_count += 1
+                if buffer_row_count >= STREAM_CHUNK_ROWS:
+                    flush()
+
+    def character_data(data):
+        if len(path_list) > 1 and path_list[-2] == "logData":
+            text_list.append(data)
+
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = character_data
+    for chunk in chunk_iterable:
+        parser.Parse(chunk, False)
+    parser.Parse(b"", True)
+    flush()
+
+    if column_name_list is None or not dataframe_list:
+        raise exception.JengReplyContainsNoDataAndMnemonicException
+    if len(dataframe_list) == 1:
+        return dataframe_list[0]
+    return pandas.concat(dataframe_list, ignore_index=True)
+
+
+def parse_log_into_dataframe(
+    xml_out: str,
+    is_low_memory: bool = False,
+    null_value_list: typing.List[str] = None,
+) -> "pandas.DataFrame":
     """
     Parse 'log' XMLout reply data into pandas.DataFrame.
 
     Parameters
     ----------
-    xml_out : str
-        WITSML XMLout reply string.
+    xml_out : str | bytes | memoryview | jeng.soap.SpooledPart
+        WITSML XMLout reply string. Spooled XMLout is parsed chunk by chunk with a
+        streaming parser.
+
+    is_low_memory : bool, default False
+        Compact the parsed strings into numeric, sparse and categorical columns (see
+        `compact_log_dataframe()`), memory saved is in `dataframe.attrs["memory_dict"]`.
+
+    null_value_list : List[str], default None
+        Values to be treated as missing in low-memory mode, e.g. log nullValue ['-999.25'].
 
     Returns
     -------
     pandas.DataFrame
         DataFrame with mnemonic as column name.
     """
-    parsed_xml_dict = xmltodict.parse(xml_out)
+    import pandas
+    import xmltodict
+
+    operation_metric = metric.begin("parse_log_into_dataframe")
+    if isinstance(xml_out, soap.SpooledPart):
+        dataframe = __parse_log_stream(xml_out.iter_chunk())
+        if is_low_memory:
+            dataframe = compact_log_dataframe(dataframe, null_value_list=null_value_list)
+        if operation_metric is not None:
+            metric.end(
+                operation_metric,
+                byte_in=len(xml_out),
+                row_count=dataframe.shape[0],
+                curve_count=dataframe.shape[1],
+            )
+        return dataframe
+    parsed_xml_dict = xmltodict.parse(__as_parsable(xml_out))
 
     # create column name and append with data
     try:
@@ -38,7 +157,16 @@ def parse_log_into_dataframe(xml_out: str) -> pandas.DataFrame:
             raise exception.JengReplyRowWithMismatchedColumnsException
     except KeyError:
         raise exception.JengReplyContainsNoDataAndMnemonicException
+    if is_low_memory:
+        dataframe = compact_log_dataframe(dataframe, null_value_list=null_value_list)
 
+    if operation_metric is not None:
+        metric.end(
+            operation_metric,
+            byte_in=len(xml_out),
+            row_count=dataframe.shape[0],
+            curve_count=dataframe.shape[1],
+        )
     return dataframe
 
 
@@ -48,7 +176,7 @@ def parse_log_into_curve_info(xml_out: str) -> typing.List[model.LogCurveInfoMod
 
     Parameters
     ----------
-    xml_out : str
+    xml_out : str | bytes | memoryview | jeng.soap.SpooledPart
         WITSML XMLout reply string.
 
     Returns
@@ -56,7 +184,10 @@ def parse_log_into_curve_info(xml_out: str) -> typing.List[model.LogCurveInfoMod
     model.LogCurveInfoModel
         List of log curve info model.
     """
-    parsed_xml_dict = xmltodict.parse(xml_out)
+    import xmltodict
+
+    operation_metric = metric.begin("parse_log_into_curve_info")
+    parsed_xml_dict = xmltodict.parse(__as_parsable(xml_out))
     parsed_log_dict = parsed_xml_dict["logs"]["log"]
 
     # parse log curve info
@@ -86,4 +217,343 @@ def parse_log_into_curve_info(xml_out: str) -> typing.List[model.LogCurveInfoMod
                 curve_info.index_type = parsed_log_dict["indexType"]
             curve_info_list.append(curve_info)
 
+    if operation_metric is not None:
+        metric.end(operation_metric, byte_in=len(xml_out), curve_count=len(curve_info_list))
     return curve_info_list
+
+
+def convert_log_dataframe(
+    dataframe: "pandas.DataFrame",
+    log_curve_info_list: typing.List[model.LogCurveInfoModel],
+) -> "pandas.DataFrame":
+    """
+    Convert parsed log data (strings) into typed columns by curve info typeLogData: 'double'
+    and 'float' into float, 'long', 'int', 'integer' and 'short' into nullable integer,
+    'date time' into UTC datetime. Other types are kept as string. Empty value becomes
+    missing value and curve units are set into `dataframe.attrs["unit_dict"]`.
+
+    Parameters
+    ----------
+    dataframe: pandas.DataFrame
+        DataFrame parsed by `parse_log_into_dataframe()`.
+
+    log_curve_info_list: List[jeng.model.LogCurveInfoModel]
+        A list of curve info, e.g. parsed from cached log header.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Typed DataFrame with mnemonic as column name.
+    """
+    import pandas
+
+    dataframe = dataframe.copy()
+    curve_info_dict = {curve_info.mnemonic: curve_info for curve_info in log_curve_info_list}
+    for mnemonic in dataframe.columns:
+        curve_info = curve_info_dict.get(mnemonic)
+        type_log_data = (curve_info.type_log_data or "").lower() if curve_info is not None else ""
+        if type_log_data in ["double", "float"]:
+            dataframe[mnemonic] = pandas.to_numeric(dataframe[mnemonic], errors="coerce").astype("float64")
+        elif type_log_data in ["long", "int", "integer", "short"]:
+            dataframe[mnemonic] = pandas.to_numeric(dataframe[mnemonic], errors="coerce").astype("Int64")
+        elif type_log_data == "date time":
+            dataframe[mnemonic] = pandas.to_datetime(dataframe[mnemonic], utc=True, format="ISO8601", errors="coerce")
+    dataframe.attrs["unit_dict"] = {
+        mnemonic: curve_info_dict[mnemonic].unit for mnemonic in dataframe.columns if mnemonic in curve_info_dict
+    }
+    return dataframe
+
+
+def compact_log_dataframe(
+    dataframe: "pandas.DataFrame",
+    index_mnemonic: str = None,
+    null_value_list: typing.List[str] = None,
+    sparse_ratio: float = 0.9,
+    rtol: float = 1e-6,
+    category_ratio: float = 0.5,
+) -> "pandas.DataFrame":
+    """
+    Reduce memory of log data: numeric curves become float32 where every value round-trips
+    within rtol (float64 otherwise), mostly missing numeric curves become sparse, and
+    string curves with few distinct values become categorical. The index curve is kept
+    exact (float64) and dense. Memory usage before and after is set into
+    `dataframe.attrs["memory_dict"]` ('before', 'after' and 'saved' in bytes).
+
+    Parameters
+    ----------
+    dataframe: pandas.DataFrame
+        Log data, parsed (strings) or typed (see `convert_log_dataframe()`).
+
+    index_mnemonic: str, default None
+        Index curve mnemonic. If set None, the first column is the index curve.
+
+    null_value_list: List[str], default None
+        Values to be treated as missing in addition to empty string, e.g. ['-999.25'].
+        Numeric null values also apply to typed and differently formatted numbers.
+
+    sparse_ratio: float, default 0.9
+        Minimum ratio of missing values for a numeric curve to become sparse.
+
+    rtol: float, default 1e-6
+        Maximum relative error of float32 values.
+
+    category_ratio: float, default 0.5
+        Maximum ratio of distinct values for a string curve to become categorical.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Compacted DataFrame with mnemonic as column name.
+    """
+    import numpy
+    import pandas
+
+    before = int(dataframe.memory_usage(deep=True).sum())
+    if index_mnemonic is None and len(dataframe.columns) > 0:
+        index_mnemonic = dataframe.columns[0]
+    missing_list = [""] + list(null_value_list or [])
+    null_number_list = pandas.to_numeric(pandas.Series(missing_list), errors="coerce").dropna().tolist()
+
+    column_dict = {}
+    for mnemonic in dataframe.columns:
+        series = dataframe[mnemonic]
+        is_text = pandas.api.types.is_object_dtype(series) or pandas.api.types.is_string_dtype(series)
+        if is_text:
+            series = series.mask(series.isin(missing_list))
+        if not is_text and not pandas.api.types.is_float_dtype(series):
+            # datetime, integer and boolean are already compact
+            column_dict[mnemonic] = series
+            continue
+
+        number = pandas.to_numeric(series, errors="coerce").astype("float64")
+        is_null = number.isin(null_number_list)
+        if is_null.any():
+            series = series.mask(is_null)
+            number = number.mask(is_null)
+        if is_text and number.notna().sum() != series.notna().sum():
+            # string curve
+            is_category = series.nunique() <= category_ratio * max(1, series.notna().sum())
+            column_dict[mnemonic] = series.astype("category") if is_category else series
+            continue
+        if mnemonic == index_mnemonic:
+            column_dict[mnemonic] = number
+            continue
+
+        value_array = number.to_numpy()
+        with numpy.errstate(over="ignore", invalid="ignore"):
+            single_array = value_array.astype("float32")
+        is_close = numpy.isclose(single_array, value_array, rtol=rtol, atol=0.0, equal_nan=True)
+        dtype = "float32" if is_close.all() else "float64"
+        if number.isna().mean() >= sparse_ratio:
+            dtype = pandas.SparseDtype(dtype, numpy.nan)
+        column_dict[mnemonic] = number.astype(dtype)
+
+    compact = pandas.DataFrame(column_dict, index=dataframe.index)
+    compact.attrs = dict(dataframe.attrs)
+    after = int(compact.memory_usage(deep=True).sum())
+    compact.attrs["memory_dict"] = {"before": before, "after": after, "saved": before - after}
+    return compact
+
+
+def __parse_growing_object_stream(chunk_iterable: typing.Iterable, tag: str) -> "pandas.DataFrame":
+    # stream growing object XMLout through expat, leaf elements of every station become a row
+    from xml.parsers import expat
+
+    import pandas
+
+    path_list = []
+    text_list = []
+    row_list = []
+    row = None
+    nested_set = set()
+    station_depth = 0
+    unit_dict = {}
+    time_column_list = []
+
+    def start_element(name, attributes):
+        nonlocal row, station_depth
+        local_name = name.rsplit(":", 1)[-1]
+        if row is None and local_name == tag:
+            row = {"uid": attributes.get("uid")}
+            station_depth = len(path_list) + 1
+        elif row is not None and len(path_list) == station_depth + 1:
+            # element inside a station element is nested, skip it
+            nested_set.add(path_list[-1])
+        elif row is not None and len(path_list) == station_depth:
+            if "uom" in attributes and local_name not in unit_dict:
+                unit_dict[local_name] = attributes["uom"]
+        path_list.append(local_name)
+        text_list.clear()
+
+    def end_element(name):
+        nonlocal row
+        local_name = path_list.pop()
+        if row is None:
+            return
+        if len(path_list) == station_depth - 1:
+            row_list.append(row)
+            row = None
+            nested_set.clear()
+        elif len(path_list) == station_depth and local_name not in nested_set:
+            row[local_name] = "".join(text_list)
+            if local_name.startswith("dTim") and local_name not in time_column_list:
+                time_column_list.append(local_name)
+
+    def character_data(data):
+        if row is not None and len(path_list) == station_depth + 1:
+            text_list.append(data)
+
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = character_data
+    for chunk in chunk_iterable:
+        parser.Parse(chunk, False)
+    parser.Parse(b"", True)
+
+    # measures (with uom) become float, dTim* become UTC datetime, others are kept as string
+    dataframe = pandas.DataFrame(row_list)
+    for column in dataframe.columns:
+        if column in unit_dict:
+            dataframe[column] = pandas.to_numeric(dataframe[column], errors="coerce").astype("float64")
+        elif column in time_column_list:
+            dataframe[column] = pandas.to_datetime(dataframe[column], utc=True, format="ISO8601", errors="coerce")
+    dataframe.attrs["unit_dict"] = {column: unit_dict[column] for column in dataframe.columns if column in unit_dict}
+    return dataframe
+
+
+def __parse_growing_object(operation: str, xml_out, tag: str) -> "pandas.DataFrame":
+    operation_metric = metric.begin(operation)
+    if isinstance(xml_out, soap.SpooledPart):
+        dataframe = __parse_growing_object_stream(xml_out.iter_chunk(), tag)
+    else:
+        xml_out = __as_parsable(xml_out)
+        dataframe = __parse_growing_object_stream([xml_out.encode() if isinstance(xml_out, str) else xml_out], tag)
+    if operation_metric is not None:
+        metric.end(
+            operation_metric,
+            byte_in=len(xml_out),
+            row_count=dataframe.shape[0],
+            curve_count=dataframe.shape[1],
+        )
+    return dataframe
+
+
+def parse_trajectory_into_dataframe(xml_out: str) -> "pandas.DataFrame":
+    """
+    Parse 'trajectory' XMLout reply into pandas.DataFrame, one row per trajectoryStation
+    with a streaming parser. Elements with unit of measure (md, tvd, incl, azi, ...) become
+    float, 'dTim' elements become UTC datetime and others are kept as string. Column 'uid'
+    is the station uid and units are set into `dataframe.attrs["unit_dict"]`. Nested
+    elements of a station (e.g. rawData, corUsed) are not parsed, and stations of every
+    trajectory in the reply are combined.
+
+    Parameters
+    ----------
+    xml_out : str | bytes | memoryview | jeng.soap.SpooledPart
+        WITSML XMLout reply string.
+
+    Returns
+    -------
+    pandas.DataFrame
+        DataFrame with element name as column name, empty if there is no station.
+    """
+    return __parse_growing_object("parse_trajectory_into_dataframe", xml_out, "trajectoryStation")
+
+
+def parse_mud_log_into_dataframe(xml_out: str) -> "pandas.DataFrame":
+    """
+    Parse 'mudLog' XMLout reply into pandas.DataFrame, one row per geologyInterval, typed
+    the same way as `parse_trajectory_into_dataframe()`. Nested elements of an interval
+    (e.g. lithology, show) are not parsed.
+
+    Parameters
+    ----------
+    xml_out : str | bytes | memoryview | jeng.soap.SpooledPart
+        WITSML XMLout reply string.
+
+    Returns
+    -------
+    pandas.DataFrame
+        DataFrame with element name as column name, empty if there is no interval.
+    """
+    return __parse_growing_object("parse_mud_log_into_dataframe", xml_out, "geologyInterval")
+
+
+def __as_list(value) -> typing.List:
+    # xmltodict parse single element as an object and not list.
+    if value is None:
+        return []
+    if not isinstance(value, typing.List):
+        return [value]
+    return value
+
+
+def __text(value) -> str:
+    if isinstance(value, typing.Dict):
+        return value.get("#text")
+    return value
+
+
+def __int_or_none(value) -> int:
+    value = __text(value)
+    return int(value) if value not in [None, ""] else None
+
+
+def parse_capabilities(capabilities_out: str) -> model.ServerCapabilitiesModel:
+    """
+    Parse WMLS_GetCap CapabilitiesOut reply into model.ServerCapabilitiesModel.
+
+    Parameters
+    ----------
+    capabilities_out : str
+        WITSML CapabilitiesOut reply string.
+
+    Returns
+    -------
+    model.ServerCapabilitiesModel
+        Server capabilities.
+    """
+    import xmltodict
+
+    parsed_xml_dict = xmltodict.parse(capabilities_out)
+    cap_server_dict = (__as_list((parsed_xml_dict["capServers"] or {}).get("capServer")) or [{}])[0] or {}
+
+    # parse supported function and data-object
+    function_dict = {}
+    for function in __as_list(cap_server_dict.get("function")):
+        data_object_list = []
+        for data_object in __as_list(function.get("dataObject")):
+            if isinstance(data_object, typing.Dict):
+                data_object_list.append(
+                    model.DataObjectCapabilityModel(
+                        name=data_object.get("#text"),
+                        max_data_nodes=__int_or_none(data_object.get("@maxDataNodes")),
+                        max_data_points=__int_or_none(data_object.get("@maxDataPoints")),
+                    )
+                )
+            else:
+                data_object_list.append(model.DataObjectCapabilityModel(name=data_object))
+        function_dict[function["@name"]] = data_object_list
+
+    # parse growing timeout period per data-object
+    growing_timeout_period_dict = {}
+    for growing_timeout_period in __as_list(cap_server_dict.get("growingTimeoutPeriod")):
+        if isinstance(growing_timeout_period, typing.Dict):
+            growing_timeout_period_dict[growing_timeout_period["@dataObject"]] = __int_or_none(growing_timeout_period)
+
+    schema_version = __text(cap_server_dict.get("schemaVersion"))
+    return model.ServerCapabilitiesModel(
+        name=__text(cap_server_dict.get("name")),
+        vendor=__text(cap_server_dict.get("vendor")),
+        version=__text(cap_server_dict.get("version")),
+        schema_version_list=schema_version.split(",") if schema_version else [],
+        function_dict=function_dict,
+        max_request_latest_values=__int_or_none(cap_server_dict.get("maxRequestLatestValues")),
+        max_request_size=__int_or_none(cap_server_dict.get("maxRequestSize")),
+        growing_timeout_period_dict=growing_timeout_period_dict,
+        is_support_uom_conversion=__text(cap_server_dict.get("supportUomConversion")) == "true",
+        compression_method=__text(cap_server_dict.get("compressionMethod")),
+        is_cascaded_delete=__text(cap_server_dict.get("cascadedDelete")) == "true",
+    )
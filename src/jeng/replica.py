@@ -0,0 +1,349 @@
+import sqlite3
+import typing
+
+from jeng import fetch, model
+
+# pandas is imported on first use to keep import fast
+if typing.TYPE_CHECKING:
+    import pandas
+
+    from jeng import jeng
+
+# replica database schema, log index is stored as float key (see jeng.fetch.index_key())
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS log_range (
+    log_key TEXT NOT NULL,
+    mnemonic TEXT NOT NULL,
+    start_key REAL NOT NULL,
+    start_index TEXT NOT NULL,
+    end_key REAL NOT NULL,
+    end_index TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS log_range_key ON log_range (log_key, mnemonic, start_key);
+CREATE TABLE IF NOT EXISTS log_data (
+    log_key TEXT NOT NULL,
+    mnemonic TEXT NOT NULL,
+    index_key REAL NOT NULL,
+    index_value TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (log_key, mnemonic, index_key)
+) WITHOUT ROWID;
+"""
+
+
+class LogReplica:
+    """
+    A local SQLite replica of log data. It records which index ranges of which curves are
+    held locally, serves them from disk and fetches only the missing sub-ranges from the
+    WITSML server.
+
+    Ranges are held as replied by the server at fetch time. Call `sync_log()` to pick up
+    data appended to a growing log since the last fetch.
+
+    Parameters
+    ----------
+    client: jeng.jeng.WitsmlClient
+        Connected client used to fetch missing data.
+
+    path: str, default ':memory:'
+        SQLite database file path. The replica persists across sessions in the same file.
+    """
+
+    def __init__(self, client: "jeng.WitsmlClient", path: str = ":memory:") -> None:
+        self.client = client
+        self.path = path
+        self.__connection = sqlite3.connect(path)
+        self.__connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        "Close the replica database."
+        self.__connection.close()
+
+    def __log_key(self, log_basic_info: model.LogBasicInfoModel) -> str:
+        return f"{log_basic_info.well_uid}/{log_basic_info.wellbore_uid}/{log_basic_info.log_uid}"
+
+    def __merge_range_list(self, range_list: typing.List[typing.Tuple]) -> typing.List[typing.Tuple]:
+        # range is (start_key, start_index, end_key, end_index), overlapping ranges are merged
+        merged_list = []
+        for index_range in sorted(range_list):
+            if merged_list and index_range[0] <= merged_list[-1][2]:
+                if index_range[2] > merged_list[-1][2]:
+                    merged_list[-1] = merged_list[-1][:2] + index_range[2:]
+            else:
+                merged_list.append(index_range)
+        return merged_list
+
+    def __subtract_range_list(self, index_range: typing.Tuple, held_range_list: typing.List[typing.Tuple]):
+        # parts of index_range not covered by held ranges (sorted, merged)
+        missing_list = []
+        cursor = index_range[:2]
+        for held_range in held_range_list:
+            if held_range[2] < cursor[0] or held_range[0] > index_range[2]:
+                continue
+            if held_range[0] > cursor[0]:
+                missing_list.append(cursor + held_range[:2])
+            cursor = held_range[2:]
+            if cursor[0] >= index_range[2]:
+                return missing_list
+        missing_list.append(cursor + index_range[2:])
+        return missing_list
+
+    def __group_range_list(
+        self, range_list_dict: typing.Dict[str, typing.List[typing.Tuple]]
+    ) -> typing.List[typing.Tuple[typing.Tuple, typing.FrozenSet[str]]]:
+        # split ranges of every mnemonic at all boundaries, adjacent pieces of the same mnemonics are joined
+        boundary_dict = {}
+        for range_list in range_list_dict.values():
+            for index_range in range_list:
+                boundary_dict.setdefault(index_range[0], index_range[1])
+                boundary_dict.setdefault(index_range[2], index_range[3])
+        boundary_list = sorted(boundary_dict.items())
+        group_list = []
+        for start, end in zip(boundary_list[:-1], boundary_list[1:]):
+            mnemonic_set = frozenset(
+                mnemonic
+                for mnemonic, range_list in range_list_dict.items()
+                if any(index_range[0] <= start[0] and end[0] <= index_range[2] for index_range in range_list)
+            )
+            if not mnemonic_set:
+                continue
+            if group_list and group_list[-1][1] == mnemonic_set and group_list[-1][0][2] == start[0]:
+                group_list[-1] = (group_list[-1][0][:2] + end, mnemonic_set)
+            else:
+                group_list.append((start + end, mnemonic_set))
+        return group_list
+
+    def __held_range_list(self, log_key: str, mnemonic: str) -> typing.List[typing.Tuple]:
+        return self.__connection.execute(
+            "SELECT start_key, start_index, end_key, end_index FROM log_range "
+            "WHERE log_key = ? AND mnemonic = ? ORDER BY start_key",
+            (log_key, mnemonic),
+        ).fetchall()
+
+    def __record_range(self, log_key: str, mnemonic: str, index_range: typing.Tuple):
+        range_list = [
+            held_range
+            for held_range in self.__held_range_list(log_key, mnemonic)
+            if held_range[0] <= index_range[2] and held_range[2] >= index_range[0]
+        ]
+        merged_range = self.__merge_range_list(range_list + [index_range])[0]
+        self.__connection.executemany(
+            "DELETE FROM log_range WHERE log_key = ? AND mnemonic = ? AND start_key = ? AND end_key = ?",
+            [(log_key, mnemonic, held_range[0], held_range[2]) for held_range in range_list],
+        )
+        self.__connection.execute("INSERT INTO log_range VALUES (?, ?, ?, ?, ?, ?)", (log_key, mnemonic) + merged_range)
+
+    def __store(
+        self,
+        log_key: str,
+        index_mnemonic: str,
+        mnemonic_list: typing.List[str],
+        index_type: model.LogIndexTypeEnum,
+        dataframe: "pandas.DataFrame",
+    ) -> typing.Tuple:
+        key_list = fetch.index_key(dataframe[index_mnemonic], index_type).tolist()
+        index_value_list = dataframe[index_mnemonic].tolist()
+        for mnemonic in mnemonic_list:
+            if mnemonic not in dataframe.columns:
+                continue
+            self.__connection.executemany(
+                "INSERT OR REPLACE INTO log_data VALUES (?, ?, ?, ?, ?)",
+                [
+                    (log_key, mnemonic, key, index_value, value if value != "" else None)
+                    for key, index_value, value in zip(key_list, index_value_list, dataframe[mnemonic].tolist())
+                ],
+            )
+        return (key_list[0], index_value_list[0], key_list[-1], index_value_list[-1])
+
+    def __fetch(
+        self,
+        log_basic_info: model.LogBasicInfoModel,
+        log_curve_info_list: typing.List[model.LogCurveInfoModel],
+        log_index: model.LogIndexModel,
+    ) -> typing.Tuple:
+        # store fetched chunks and return (start_key, start_index, end_key, end_index) of received rows
+        log_key = self.__log_key(log_basic_info)
+        index_mnemonic = fetch.get_index_curve(log_curve_info_list).mnemonic
+        mnemonic_list = [curve_info.mnemonic for curve_info in log_curve_info_list if not curve_info.is_index_curve]
+
+        received_range = None
+        for dataframe in fetch.iter_log_data(self.client, log_basic_info, log_curve_info_list, log_index):
+            chunk_range = self.__store(log_key, index_mnemonic, mnemonic_list, log_index.type, dataframe)
+            received_range = chunk_range if received_range is None else received_range[:2] + chunk_range[2:]
+        return received_range
+
+    def held_range_list(
+        self,
+        log_basic_info: model.LogBasicInfoModel,
+        mnemonic: str,
+    ) -> typing.List[model.LogIndexModel]:
+        """
+        Get index ranges of a curve held locally.
+
+        Parameters
+        ----------
+        log_basic_info: jeng.model.LogBasicInfoModel
+            Well, wellbore and log information of the log.
+
+        mnemonic: str
+            Curve mnemonic.
+
+        Returns
+        -------
+        List[jeng.model.LogIndexModel]
+            Held ranges in index order. Range type is not recorded and left as default.
+        """
+        return [
+            model.LogIndexModel(start=held_range[1], end=held_range[3])
+            for held_range in self.__held_range_list(self.__log_key(log_basic_info), mnemonic)
+        ]
+
+    def get_log(
+        self,
+        log_basic_info: model.LogBasicInfoModel,
+        log_curve_info_list: typing.List[model.LogCurveInfoModel],
+        log_index: model.LogIndexModel,
+    ) -> "pandas.DataFrame":
+        """
+        Get log data of an index range. Sub-ranges not held locally are fetched from the
+        WITSML server and recorded before the whole range is served from the replica.
+
+        Parameters
+        ----------
+        log_basic_info: jeng.model.LogBasicInfoModel
+            Well, wellbore and log information of the log.
+
+        log_curve_info_list: List[jeng.model.LogCurveInfoModel]
+            A list of curve info to be returned. The index curve is required.
+
+        log_index: jeng.model.LogIndexModel
+            Index range (inclusive). Both start and end are required.
+
+        Returns
+        -------
+        pandas.DataFrame
+            DataFrame with mnemonic as column name, index curve first.
+        """
+        if log_index.start is None or log_index.end is None:
+            raise ValueError("Both start and end of log_index are required, use sync_log() for open-ended range.")
+        log_key = self.__log_key(log_basic_info)
+        index_range = (
+            fetch.index_key_value(log_index.start, log_index.type),
+            log_index.start,
+            fetch.index_key_value(log_index.end, log_index.type),
+            log_index.end,
+        )
+
+        # missing sub-ranges of every curve, fetched together for the curves missing them
+        index_curve_info = fetch.get_index_curve(log_curve_info_list)
+        missing_dict = {
+            curve_info.mnemonic: self.__subtract_range_list(
+                index_range, self.__held_range_list(log_key, curve_info.mnemonic)
+            )
+            for curve_info in log_curve_info_list
+            if not curve_info.is_index_curve
+        }
+        for missing_range, mnemonic_set in self.__group_range_list(missing_dict):
+            self.__fetch(
+                log_basic_info,
+                [index_curve_info]
+                + [curve_info for curve_info in log_curve_info_list if curve_info.mnemonic in mnemonic_set],
+                model.LogIndexModel(start=missing_range[1], end=missing_range[3], type=log_index.type),
+            )
+            for mnemonic in mnemonic_set:
+                self.__record_range(log_key, mnemonic, missing_range)
+        self.__connection.commit()
+        return self.__read(log_key, log_curve_info_list, index_range[0], index_range[2])
+
+    def sync_log(
+        self,
+        log_basic_info: model.LogBasicInfoModel,
+        log_curve_info_list: typing.List[model.LogCurveInfoModel],
+        index_type: model.LogIndexTypeEnum = model.LogIndexTypeEnum.TIME,
+    ) -> int:
+        """
+        Incrementally sync a growing log: fetch data after the last row held locally for
+        the requested curves (the whole log if none is held).
+
+        Parameters
+        ----------
+        log_basic_info: jeng.model.LogBasicInfoModel
+            Well, wellbore and log information of the log.
+
+        log_curve_info_list: List[jeng.model.LogCurveInfoModel]
+            A list of curve info to be synced. The index curve is required.
+
+        index_type: jeng.model.LogIndexTypeEnum, default jeng.model.LogIndexTypeEnum.TIME
+            Type of log index: time or non-time index.
+
+        Returns
+        -------
+        int
+            Number of rows received.
+        """
+        log_key = self.__log_key(log_basic_info)
+        mnemonic_list = [curve_info.mnemonic for curve_info in log_curve_info_list if not curve_info.is_index_curve]
+
+        # the curve lagging the most decides where the sync starts
+        last_row_list = [
+            self.__connection.execute(
+                "SELECT index_key, index_value FROM log_data WHERE log_key = ? AND mnemonic = ? "
+                "ORDER BY index_key DESC LIMIT 1",
+                (log_key, mnemonic),
+            ).fetchone()
+            for mnemonic in mnemonic_list
+        ]
+        start = None
+        if last_row_list and None not in last_row_list:
+            start = min(last_row_list)[1]
+
+        row_count_before = self.__row_count(log_key, mnemonic_list)
+        received_range = self.__fetch(
+            log_basic_info,
+            log_curve_info_list,
+            model.LogIndexModel(start=start, end=None, type=index_type),
+        )
+        if received_range is not None:
+            for mnemonic in mnemonic_list:
+                self.__record_range(log_key, mnemonic, received_range)
+        self.__connection.commit()
+        return self.__row_count(log_key, mnemonic_list) - row_count_before
+
+    def __row_count(self, log_key: str, mnemonic_list: typing.List[str]) -> int:
+        placeholder = ", ".join("?" * len(mnemonic_list))
+        return self.__connection.execute(
+            f"SELECT COUNT(DISTINCT index_key) FROM log_data WHERE log_key = ? AND mnemonic IN ({placeholder})",
+            [log_key] + mnemonic_list,
+        ).fetchone()[0]
+
+    def __read(
+        self,
+        log_key: str,
+        log_curve_info_list: typing.List[model.LogCurveInfoModel],
+        start_key: float,
+        end_key: float,
+    ) -> "pandas.DataFrame":
+        import pandas
+
+        index_mnemonic = fetch.get_index_curve(log_curve_info_list).mnemonic
+        mnemonic_list = [curve_info.mnemonic for curve_info in log_curve_info_list if not curve_info.is_index_curve]
+        column_dict = {mnemonic: position + 1 for position, mnemonic in enumerate(mnemonic_list)}
+        placeholder = ", ".join("?" * len(mnemonic_list))
+        row_dict = {}
+        for index_key, index_value, mnemonic, value in self.__connection.execute(
+            "SELECT index_key, index_value, mnemonic, value FROM log_data "
+            f"WHERE log_key = ? AND mnemonic IN ({placeholder}) AND index_key BETWEEN ? AND ? ORDER BY index_key",
+            [log_key] + mnemonic_list + [start_key, end_key],
+        ):
+            row = row_dict.get(index_key)
+            if row is None:
+                row = [index_value] + [None] * len(mnemonic_list)
+                row_dict[index_key] = row
+            row[column_dict[mnemonic]] = value
+        return pandas.DataFrame(list(row_dict.values()), columns=[index_mnemonic] + mnemonic_list)
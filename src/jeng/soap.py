@@ -0,0 +1,286 @@
+import re
+import typing
+from xml.sax.saxutils import escape
+
+from jeng import exception, model
+
+SOAP_ENVELOPE_NAMESPACE = "http://schemas.xmlsoap.org/soap/envelope/"
+WITSML_MESSAGE_NAMESPACE = "http://www.witsml.org/message/120"
+WITSML_ACTION_URI = "http://www.witsml.org/action/120/Store"
+XML_OUT_TYPE_STR = "str"
+XML_OUT_TYPE_BYTES = "bytes"
+XML_OUT_TYPE_MEMORYVIEW = "memoryview"
+XML_OUT_TYPE_FILE = "file"
+
+# WMLS function input parts, in order of WSDL message definition
+FUNCTION_PART_DICT = {
+    "WMLS_AddToStore": ["WMLtypeIn", "XMLin", "OptionsIn", "CapabilitiesIn"],
+    "WMLS_DeleteFromStore": ["WMLtypeIn", "QueryIn", "OptionsIn", "CapabilitiesIn"],
+    "WMLS_GetBaseMsg": ["ReturnValueIn"],
+    "WMLS_GetCap": ["OptionsIn"],
+    "WMLS_GetFromStore": ["WMLtypeIn", "QueryIn", "OptionsIn", "CapabilitiesIn"],
+    "WMLS_GetVersion": [],
+    "WMLS_UpdateInStore": ["WMLtypeIn", "XMLin", "OptionsIn", "CapabilitiesIn"],
+}
+
+
+def __compile_envelope_template(function: str, part_list: typing.List[str]) -> str:
+    body = "".join(f"<{part}>{{{index}}}</{part}>" for index, part in enumerate(part_list))
+    return (
+        f'<soap-env:Envelope xmlns:soap-env="{SOAP_ENVELOPE_NAMESPACE}"><soap-env:Body>'
+        f'<ns0:{function} xmlns:ns0="{WITSML_MESSAGE_NAMESPACE}">{body}</ns0:{function}>'
+        "</soap-env:Body></soap-env:Envelope>"
+    )
+
+
+# precompiled SOAP envelope templates, filled with str.format()
+ENVELOPE_TEMPLATE_DICT = {
+    function: __compile_envelope_template(function, part_list) for function, part_list in FUNCTION_PART_DICT.items()
+}
+
+__NAMED_ENTITY_LIST = [(b"&lt;", b"<"), (b"&gt;", b">"), (b"&quot;", b'"'), (b"&apos;", b"'")]
+__NUMERIC_ENTITY_PATTERN = re.compile(rb"&#(x[0-9a-fA-F]+|[0-9]+);")
+__FAULT_PATTERN = re.compile(rb"<(?:[\w.-]+:)?faultstring(?:\s[^>]*)?>(.*?)</(?:[\w.-]+:)?faultstring>", re.DOTALL)
+__PART_PATTERN_DICT = {}
+
+
+def __get_part_pattern(part: str) -> typing.Pattern:
+    if part not in __PART_PATTERN_DICT:
+        __PART_PATTERN_DICT[part] = re.compile(rb"<(?:[\w.-]+:)?" + part.encode() + rb"(\s[^>]*?)?(/?)>")
+    return __PART_PATTERN_DICT[part]
+
+
+def __replace_numeric_entity(match: typing.Match) -> bytes:
+    value = match.group(1)
+    code_point = int(value[1:], 16) if value[:1] == b"x" else int(value)
+    return chr(code_point).encode("utf-8")
+
+
+def unescape(value: bytes) -> bytes:
+    """
+    Unescape XML entities of a SOAP text node.
+
+    Parameters
+    ----------
+    value: bytes
+        Escaped XML text.
+
+    Returns
+    -------
+    bytes
+        Unescaped XML text.
+    """
+    if b"&" not in value:
+        return value
+    for entity, character in __NAMED_ENTITY_LIST:
+        value = value.replace(entity, character)
+    if b"&#" in value:
+        value = __NUMERIC_ENTITY_PATTERN.sub(__replace_numeric_entity, value)
+    return value.replace(b"&amp;", b"&")
+
+
+class SpooledPart:
+    """
+    A reply part text left in a spooled (memory-mapped) SOAP response. The text is only
+    unescaped chunk by chunk while it is read, so it's never held in memory as a whole
+    unless `read()` is called.
+
+    Parameters
+    ----------
+    buffer: mmap.mmap | bytes
+        SOAP response body.
+
+    start: int
+        Start offset of the (escaped) part text.
+
+    end: int
+        End offset of the (escaped) part text.
+
+    is_escaped: bool, default True
+        Whether the text contains XML entities (not a CDATA section).
+    """
+
+    def __init__(self, buffer, start: int, end: int, is_escaped: bool = True) -> None:
+        self.buffer = buffer
+        self.start = start
+        self.end = end
+        self.is_escaped = is_escaped
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        return self.iter_chunk()
+
+    def iter_chunk(self, chunk_size: int = 1 << 20) -> typing.Iterator[bytes]:
+        """
+        Iterate over unescaped part text.
+
+        Parameters
+        ----------
+        chunk_size: int, default 1 MiB
+            Size of the escaped text read per chunk.
+
+        Returns
+        -------
+        Iterator[bytes]
+            Unescaped text chunks.
+        """
+        view = memoryview(self.buffer)
+        remainder = b""
+        for position in range(self.start, self.end, chunk_size):
+            chunk = remainder + view[position : min(position + chunk_size, self.end)].tobytes()
+            remainder = b""
+
+            # an entity split across chunks is carried over to the next chunk
+            if self.is_escaped:
+                entity_start = chunk.rfind(b"&")
+                if entity_start != -1 and chunk.find(b";", entity_start) == -1:
+                    chunk, remainder = chunk[:entity_start], chunk[entity_start:]
+                chunk = unescape(chunk)
+            if chunk:
+                yield chunk
+        if remainder:
+            yield unescape(remainder)
+
+    def read(self) -> bytes:
+        """
+        Read the whole unescaped part text into memory.
+
+        Returns
+        -------
+        bytes
+            Unescaped text.
+        """
+        return b"".join(self.iter_chunk())
+
+    def close(self):
+        "Close the spooled response buffer."
+        if hasattr(self.buffer, "close"):
+            self.buffer.close()
+
+
+def build_envelope(function: str, **part_dict) -> bytes:
+    """
+    Build WMLS function SOAP request envelope from precompiled template.
+
+    Parameters
+    ----------
+    function: str
+        WMLS function name, e.g. 'WMLS_GetFromStore'.
+
+    **part_dict
+        Input parts of the function (see `jeng.soap.FUNCTION_PART_DICT`). Missing or None
+        part is sent as empty string.
+
+    Returns
+    -------
+    bytes
+        UTF-8 encoded SOAP envelope.
+    """
+    value_list = []
+    for part in FUNCTION_PART_DICT[function]:
+        value = part_dict.get(part)
+        value_list.append("" if value is None else escape(str(value)))
+    return ENVELOPE_TEMPLATE_DICT[function].format(*value_list).encode("utf-8")
+
+
+def build_headers(function: str) -> typing.Dict[str, str]:
+    """
+    Build HTTP headers for WMLS function SOAP request.
+
+    Parameters
+    ----------
+    function: str
+        WMLS function name, e.g. 'WMLS_GetFromStore'.
+
+    Returns
+    -------
+    Dict[str, str]
+        HTTP headers.
+    """
+    return {
+        "Content-Type": "text/xml; charset=utf-8",
+        "SOAPAction": f'"{WITSML_ACTION_URI}.{function}"',
+    }
+
+
+def extract_part(content: bytes, part: str, xml_out_type: str = XML_OUT_TYPE_STR):
+    """
+    Extract a reply part text from SOAP response without building an XML tree.
+
+    Parameters
+    ----------
+    content: bytes | mmap.mmap
+        SOAP response body.
+
+    part: str
+        Reply part name, e.g. 'XMLout'.
+
+    xml_out_type: str, default 'str'
+        Type of returned value: 'str', 'bytes', 'memoryview' or 'file'. 'memoryview' is a
+        zero-copy view of content when the text contains no XML entity. 'file' is a
+        `jeng.soap.SpooledPart` that unescapes the text while it is read.
+
+    Returns
+    -------
+    str | bytes | memoryview | jeng.soap.SpooledPart
+        Unescaped part text or None if the part is not present.
+    """
+    match = __get_part_pattern(part).search(content)
+    if match is None:
+        return None
+    is_cdata = False
+    if match.group(2):
+        start = end = match.end()
+    else:
+        start = match.end()
+        end = content.find(b"<", start)
+        if content[start : start + len(b"<![CDATA[")] == b"<![CDATA[":
+            is_cdata = True
+            start += len(b"<![CDATA[")
+            end = content.find(b"]]>", start)
+    if xml_out_type == XML_OUT_TYPE_FILE:
+        return SpooledPart(content, start, end, is_escaped=not is_cdata)
+
+    # unescaped text is copied once, otherwise it's a view of the content
+    if content.find(b"&", start, end) == -1:
+        value = memoryview(content)[start:end]
+    else:
+        value = unescape(content[start:end])
+
+    if xml_out_type == XML_OUT_TYPE_MEMORYVIEW:
+        return value if isinstance(value, memoryview) else memoryview(value)
+    if xml_out_type == XML_OUT_TYPE_BYTES:
+        return bytes(value)
+    return str(value, "utf-8")
+
+
+def parse_reply(content: bytes, xml_out_type: str = XML_OUT_TYPE_STR) -> model.RawReplyModel:
+    """
+    Parse WMLS function SOAP response into `jeng.model.RawReplyModel`.
+
+    Parameters
+    ----------
+    content: bytes | mmap.mmap
+        SOAP response body.
+
+    xml_out_type: str, default 'str'
+        Type of XMLout: 'str', 'bytes', 'memoryview' or 'file' (see `extract_part()`).
+
+    Returns
+    -------
+    jeng.model.RawReplyModel
+        Parsed reply.
+    """
+    fault = __FAULT_PATTERN.search(content)
+    if fault is not None:
+        raise exception.JengSoapFaultException(str(unescape(fault.group(1)), "utf-8"))
+
+    result = extract_part(content, "Result")
+    return model.RawReplyModel(
+        Result=int(result) if result and result.strip().lstrip("-").isdigit() else result,
+        XMLout=extract_part(content, "XMLout", xml_out_type),
+        SuppMsgOut=extract_part(content, "SuppMsgOut"),
+        CapabilitiesOut=extract_part(content, "CapabilitiesOut"),
+    )
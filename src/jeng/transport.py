@@ -0,0 +1,153 @@
+import mmap
+import tempfile
+import zlib
+
+from jeng import metric
+
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_DEFLATE = "deflate"
+
+# zlib window bits for each HTTP content coding
+__WBITS_DICT = {
+    COMPRESSION_GZIP: 16 + zlib.MAX_WBITS,
+    COMPRESSION_DEFLATE: zlib.MAX_WBITS,
+}
+
+
+def compress(body: bytes, method: str, level: int = 6) -> bytes:
+    """
+    Compress HTTP request body.
+
+    Parameters
+    ----------
+    body: bytes
+        HTTP request body.
+
+    method: str
+        HTTP content coding: 'gzip' or 'deflate'.
+
+    level: int, default 6
+        zlib compression level (1 is fastest, 9 is smallest).
+
+    Returns
+    -------
+    bytes
+        Compressed body.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, __WBITS_DICT[method])
+    return compressor.compress(body) + compressor.flush()
+
+
+def compress_headers(body: bytes, headers: dict, method: str = None):
+    """
+    Compress HTTP request body and set 'Content-Encoding' header, if method is set.
+
+    Parameters
+    ----------
+    body: bytes
+        HTTP request body.
+
+    headers: dict
+        HTTP request headers. Updated in place.
+
+    method: str, default None
+        HTTP content coding: 'gzip', 'deflate' or None for no compression.
+
+    Returns
+    -------
+    bytes
+        HTTP request body to be sent.
+    """
+    if method is None:
+        return body
+    headers["Content-Encoding"] = method
+    return compress(body, method)
+
+
+def wire_size(response, default: int = None) -> int:
+    """
+    Get HTTP response body size as received on the wire (compressed size, if compressed).
+
+    Parameters
+    ----------
+    response: requests.Response
+        HTTP response.
+
+    default: int, default None
+        Size used when the response has no 'Content-Length' header. If set None, size of
+        the (already read) response content is used.
+
+    Returns
+    -------
+    int
+        Response body size in bytes.
+    """
+    content_length = response.headers.get("Content-Length")
+    if content_length is not None and content_length.isdigit():
+        return int(content_length)
+    if default is not None:
+        return default
+    return len(response.content)
+
+
+def spool(response, chunk_size: int = 1 << 20) -> mmap.mmap:
+    """
+    Stream HTTP response body (decompressed) into an anonymous temporary file and map it
+    into memory. Pages of the map are backed by the file, not by process memory.
+
+    Parameters
+    ----------
+    response: requests.Response
+        HTTP response requested with stream=True.
+
+    chunk_size: int, default 1 MiB
+        Size of a chunk read from the response.
+
+    Returns
+    -------
+    mmap.mmap
+        Read-only memory map of the response body (empty bytes if there is no body).
+    """
+    with tempfile.TemporaryFile() as spool_file:
+        for chunk in response.iter_content(chunk_size):
+            spool_file.write(chunk)
+        spool_file.flush()
+
+        # empty file can't be mapped, the map stays valid after the file is closed (and removed)
+        if spool_file.tell() == 0:
+            return b""
+        return mmap.mmap(spool_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def __create_witsml_transport_class():
+    from zeep.transports import Transport
+
+    class WitsmlTransport(Transport):
+        "A zeep transport that optionally compresses SOAP request body."
+
+        def __init__(self, request_compression: str = None, **kwargs):
+            super().__init__(**kwargs)
+            self.request_compression = request_compression
+
+        def post(self, address, message, headers):
+            if isinstance(message, str):
+                message = message.encode("utf-8")
+            message = compress_headers(message, headers, self.request_compression)
+            operation_metric = metric.current()
+            if operation_metric is None:
+                return super().post(address, message, headers)
+
+            metric.begin_network(operation_metric, len(message))
+            response = super().post(address, message, headers)
+            metric.end_network(operation_metric, wire_size(response))
+            return response
+
+    return WitsmlTransport
+
+
+def __getattr__(name: str):
+    # zeep is imported on first use of WitsmlTransport to keep import fast
+    if name == "WitsmlTransport":
+        globals()[name] = __create_witsml_transport_class()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
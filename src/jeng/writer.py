@@ -0,0 +1,270 @@
+import threading
+import time
+import typing
+
+from jeng import adaptive, exception, ingest, model
+
+# pandas is imported on first use to keep import fast
+if typing.TYPE_CHECKING:
+    import pandas
+
+    from jeng import jeng
+
+
+class LogWriter:
+    """
+    A buffered realtime log writer. Rows are accepted from any thread and buffered per log;
+    a background thread writes a log once its buffer reaches max_rows or max_bytes, or its
+    oldest row is max_latency old. Everything buffered for a log is merged into as few
+    requests as server capabilities allow, and logs that don't exist yet are created with
+    the first request.
+
+    `add()` blocks while max_buffered_rows rows (including rows being written) are
+    waiting, so producers slow down to the pace of the WITSML server. A failed request
+    drops its rows, and the error is raised by the next `add()`, `flush()` or `close()`.
+
+    Parameters
+    ----------
+    client: jeng.jeng.WitsmlClient
+        Connected client.
+
+    max_rows: int, default 1000
+        Buffered rows of a log to trigger a write, also maximum rows per request.
+
+    max_bytes: int, default None
+        Buffered characters of a log to trigger a write. None if not limited.
+
+    max_latency: float, default 1.0
+        Maximum seconds a row is buffered before it's written.
+
+    max_buffered_rows: int, default 100000
+        Maximum rows buffered across all logs before `add()` blocks.
+
+    sizer: jeng.adaptive.RequestSizer, default None
+        Adapts rows per request (up to max_rows) to its target latency.
+    """
+
+    def __init__(
+        self,
+        client: "jeng.WitsmlClient",
+        max_rows: int = 1000,
+        max_bytes: int = None,
+        max_latency: float = 1.0,
+        max_buffered_rows: int = 100000,
+        sizer: adaptive.RequestSizer = None,
+    ) -> None:
+        self.client = client
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.max_latency = max_latency
+        self.max_buffered_rows = max_buffered_rows
+        self.sizer = sizer
+        self.__condition = threading.Condition()
+        self.__buffer_dict = {}
+        self.__is_exist_dict = {}
+        self.__buffered_rows = 0
+        # every add is numbered, flush() waits for buffers started up to its number
+        self.__sequence = 0
+        self.__pending_sequence_set = set()
+        self.__flush_count = 0
+        self.__flush_sequence = 0
+        self.__error = None
+        self.__is_closed = False
+        self.__thread = threading.Thread(target=self.__run, name="jeng-log-writer", daemon=True)
+        self.__thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __raise_error(self):
+        # caller holds the condition
+        if self.__error is not None:
+            error, self.__error = self.__error, None
+            raise error
+
+    def __is_due(self, buffer: typing.Dict, now: float) -> bool:
+        return (
+            buffer["sequence"] <= self.__flush_sequence
+            or self.__is_closed
+            or buffer["rows"] >= self.max_rows
+            or (self.max_bytes is not None and buffer["bytes"] >= self.max_bytes)
+            or now - buffer["since"] >= self.max_latency
+        )
+
+    def __take(self) -> typing.Tuple[typing.List[typing.Dict], bool]:
+        # wait for due buffers, (taken buffers, whether the writer is closed and drained)
+        with self.__condition:
+            while True:
+                now = time.monotonic()
+                key_list = [key for key, buffer in self.__buffer_dict.items() if self.__is_due(buffer, now)]
+                if key_list:
+                    return [self.__buffer_dict.pop(key) for key in key_list], False
+                if self.__is_closed and not self.__buffer_dict:
+                    return [], True
+                timeout = None
+                if self.__buffer_dict:
+                    since = min(buffer["since"] for buffer in self.__buffer_dict.values())
+                    timeout = max(0.0, since + self.max_latency - now)
+                self.__condition.wait(timeout)
+
+    def __write(self, buffer: typing.Dict):
+        import pandas
+
+        log_basic_info = buffer["log_basic_info"]
+        log_curve_info_list = buffer["log_curve_info_list"]
+        key = buffer["key"]
+        if key not in self.__is_exist_dict:
+            self.__is_exist_dict[key] = ingest.is_log_exist(self.client, log_basic_info)
+        max_rows, max_size = ingest.upload_limit(self.client, len(log_curve_info_list), self.max_rows, self.sizer)
+
+        # adjacent chunks with the same curves are merged into one request
+        group_list = []
+        for chunk in buffer["chunk_list"]:
+            if group_list and list(group_list[-1][-1].columns) == list(chunk.columns):
+                group_list[-1].append(chunk)
+            else:
+                group_list.append([chunk])
+        for group in group_list:
+            for query, row_count in ingest.iter_upload_query(
+                log_basic_info,
+                log_curve_info_list,
+                [pandas.concat(group, ignore_index=True)],
+                max_rows=max_rows,
+                max_size=max_size,
+                is_include_log_curve_info=not self.__is_exist_dict[key],
+            ):
+                ingest.upload(self.client, query, row_count, not self.__is_exist_dict[key], self.sizer)
+                self.__is_exist_dict[key] = True
+
+    def __run(self):
+        while True:
+            buffer_list, is_done = self.__take()
+            if is_done:
+                return
+            for buffer in buffer_list:
+                error = None
+                try:
+                    self.__write(buffer)
+                except Exception as e:
+                    error = e
+                with self.__condition:
+                    if error is not None and self.__error is None:
+                        self.__error = error
+                    self.__buffered_rows -= buffer["rows"]
+                    self.__pending_sequence_set.discard(buffer["sequence"])
+                    self.__condition.notify_all()
+
+    def add(
+        self,
+        log_basic_info: model.LogBasicInfoModel,
+        log_curve_info_list: typing.List[model.LogCurveInfoModel],
+        dataframe: "pandas.DataFrame",
+        timeout: float = None,
+    ):
+        """
+        Buffer rows of a log to be written in the background.
+
+        Parameters
+        ----------
+        log_basic_info: jeng.model.LogBasicInfoModel
+            Well, wellbore and log information of the log.
+
+        log_curve_info_list: List[jeng.model.LogCurveInfoModel]
+            A list of curve info, used for creating the log if it doesn't exist.
+
+        dataframe: pandas.DataFrame
+            Rows with mnemonic as column name, index curve included.
+
+        timeout: float, default None
+            Maximum seconds to wait while the buffer is full. If set None, wait until
+            there is room.
+        """
+        if dataframe.empty:
+            return
+        chunk = ingest.to_text(dataframe.reset_index(drop=True))
+        byte_count = int(ingest.row_size(chunk).sum())
+        key = (log_basic_info.well_uid, log_basic_info.wellbore_uid, log_basic_info.log_uid)
+
+        with self.__condition:
+            self.__raise_error()
+            if self.__is_closed:
+                raise RuntimeError("Log writer is closed.")
+
+            # back-pressure: wait for written rows (a single oversized add is accepted into an empty buffer)
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while self.__buffered_rows > 0 and self.__buffered_rows + len(chunk.index) > self.max_buffered_rows:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise exception.JengWriterBufferFullException(self.__buffered_rows)
+                self.__condition.wait(remaining)
+                self.__raise_error()
+
+            self.__sequence += 1
+            if key not in self.__buffer_dict:
+                self.__buffer_dict[key] = {
+                    "key": key,
+                    "log_basic_info": log_basic_info,
+                    "log_curve_info_list": log_curve_info_list,
+                    "chunk_list": [],
+                    "rows": 0,
+                    "bytes": 0,
+                    "since": time.monotonic(),
+                    "sequence": self.__sequence,
+                }
+                self.__pending_sequence_set.add(self.__sequence)
+            buffer = self.__buffer_dict[key]
+            buffer["chunk_list"].append(chunk)
+            buffer["rows"] += len(chunk.index)
+            buffer["bytes"] += byte_count
+            self.__buffered_rows += len(chunk.index)
+            self.__condition.notify_all()
+
+    def buffered_rows(self) -> int:
+        """
+        Get number of rows waiting to be written, including rows being written.
+
+        Returns
+        -------
+        int
+            Number of rows.
+        """
+        with self.__condition:
+            return self.__buffered_rows
+
+    def flush(self):
+        """
+        Write everything buffered now and wait until it's written. Rows added by other
+        threads while flushing don't keep it waiting, unless they join a log's buffer
+        started before the flush.
+        """
+        with self.__condition:
+            sequence = self.__sequence
+            self.__flush_count += 1
+            self.__flush_sequence = max(self.__flush_sequence, sequence)
+            self.__condition.notify_all()
+            try:
+                while (
+                    self.__pending_sequence_set
+                    and min(self.__pending_sequence_set) <= sequence
+                    and self.__thread.is_alive()
+                ):
+                    self.__condition.wait()
+            finally:
+                self.__flush_count -= 1
+                if self.__flush_count == 0:
+                    self.__flush_sequence = 0
+            self.__raise_error()
+
+    def close(self):
+        """
+        Write everything buffered and stop the background thread.
+        """
+        with self.__condition:
+            self.__is_closed = True
+            self.__condition.notify_all()
+        self.__thread.join()
+        with self.__condition:
+            self.__raise_error()
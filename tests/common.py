@@ -5,7 +5,7 @@ from xml.etree import ElementTree
 
 import pandas
 
-from jeng import jeng, model
+from jeng import emulator, jeng, model
 
 QUERY_PATH = "tests/xml"
 SAMPLE_PATH = "tests/sample"
@@ -94,6 +94,17 @@ def __connect() -> jeng.WitsmlClient:
     return client
 
 
+def __connect_emulator(store: emulator.WitsmlStoreEmulator, is_raw: bool = True) -> jeng.WitsmlClient:
+    client = jeng.WitsmlClient()
+    assert client.connect(
+        url=store.url(),
+        username=store.username or "",
+        password=store.password or "",
+        is_raw=is_raw,
+    )
+    return client
+
+
 def __connect_and_prepare() -> jeng.WitsmlClient:
     client = __connect()
 
@@ -153,6 +164,13 @@ def __prepare_sample_dataset(
     )[registered_mnemonic]
 
 
+def __prepare_depth_dataframe(rows: int, mnemonic_list: typing.List[str] = None) -> pandas.DataFrame:
+    return pandas.read_csv(
+        filepath_or_buffer=f"{SAMPLE_PATH}/{DEPTH_BASED_SAMPLE_FILENAME}.csv",
+        nrows=rows,
+    )[mnemonic_list or ["DEPT", "HKLA"]]
+
+
 def __compare_curve_info(
     curve_info1: model.LogCurveInfoModel,
     curve_info2: model.LogCurveInfoModel,
@@ -0,0 +1,149 @@
+import json
+
+import common
+import pandas
+import pytest
+
+from jeng import adaptive, emulator, fetch, generate, ingest, jeng, model
+
+ENDPOINT = "http://localhost/witsml"
+
+
+@pytest.mark.unit
+def test_request_sizer(tmp_path):
+    path = tmp_path / "sizing.json"
+    sizer = adaptive.RequestSizer(target_latency=1.0, initial_rows=100, max_rows=1000, path=str(path))
+    assert sizer.rows(ENDPOINT, adaptive.OPERATION_GET) == 100
+
+    # grows at most 2x per request, shrinks towards the target latency
+    sizer.observe(ENDPOINT, adaptive.OPERATION_GET, rows=100, latency=0.01)
+    assert sizer.rows(ENDPOINT, adaptive.OPERATION_GET) == 200
+    sizer.observe(ENDPOINT, adaptive.OPERATION_GET, rows=200, latency=1.6)
+    assert sizer.rows(ENDPOINT, adaptive.OPERATION_GET) == 125
+
+    # server truncation caps, errors halve
+    sizer.observe(ENDPOINT, adaptive.OPERATION_GET, rows=80, latency=0.01, is_truncated=True)
+    assert sizer.rows(ENDPOINT, adaptive.OPERATION_GET) == 80
+    sizer.observe(ENDPOINT, adaptive.OPERATION_GET, rows=0, latency=5.0, is_error=True)
+    assert sizer.rows(ENDPOINT, adaptive.OPERATION_GET) == 40
+
+    # kept per endpoint and operation, persisted
+    assert sizer.rows(ENDPOINT, adaptive.OPERATION_UPLOAD) == 100
+    assert sizer.rows("http://other/witsml", adaptive.OPERATION_GET) == 100
+    sizer.save()
+    assert json.loads(path.read_text())[ENDPOINT][adaptive.OPERATION_GET]["cap"] == 80
+    assert adaptive.RequestSizer(path=str(path)).rows(ENDPOINT, adaptive.OPERATION_GET) == 40
+
+
+@pytest.mark.unit
+def test_request_sizer_by_bytes():
+    sizer = adaptive.RequestSizer(target_latency=1.0, target_bytes=100_000, initial_rows=1000)
+
+    # same rows and latency, a wide log gets fewer rows than a narrow one
+    for _ in range(3):
+        sizer.observe("http://narrow/witsml", adaptive.OPERATION_GET, rows=1000, latency=1.0, byte_count=20_000)
+        sizer.observe("http://wide/witsml", adaptive.OPERATION_GET, rows=1000, latency=1.0, byte_count=1_000_000)
+    assert sizer.rows("http://narrow/witsml", adaptive.OPERATION_GET) == 1000
+    assert sizer.rows("http://wide/witsml", adaptive.OPERATION_GET) == 100
+
+    # without byte limit only latency counts
+    sizer = adaptive.RequestSizer(target_latency=1.0, target_bytes=None, initial_rows=1000)
+    sizer.observe(ENDPOINT, adaptive.OPERATION_GET, rows=1000, latency=1.0, byte_count=1_000_000)
+    assert sizer.rows(ENDPOINT, adaptive.OPERATION_GET) == 1000
+
+
+@pytest.mark.unit
+def test_request_sizer_cap(monkeypatch):
+    sizer = adaptive.RequestSizer(target_latency=1.0, initial_rows=1000, cap_ttl=60.0)
+
+    # a truncated reply of 100 rows of 4 curves caps 400 data points
+    sizer.observe(ENDPOINT, adaptive.OPERATION_GET, rows=100, latency=0.1, is_truncated=True, curve_count=4)
+    assert sizer.rows(ENDPOINT, adaptive.OPERATION_GET, curve_count=4) == 100
+    assert sizer.rows(ENDPOINT, adaptive.OPERATION_GET, curve_count=2) == 200
+
+    # the cap expires, the size grows again
+    now = adaptive.time.time()
+    monkeypatch.setattr(adaptive.time, "time", lambda: now + 61.0)
+    sizer.observe(ENDPOINT, adaptive.OPERATION_GET, rows=100, latency=0.1, curve_count=4)
+    assert sizer.rows(ENDPOINT, adaptive.OPERATION_GET, curve_count=4) == 400
+
+
+@pytest.mark.unit
+def test_iter_log_data_windowed_by_sizer():
+    dataframe = pandas.read_csv(
+        filepath_or_buffer=f"{common.SAMPLE_PATH}/{common.DEPTH_BASED_SAMPLE_FILENAME}.csv",
+        nrows=20,
+    )[["DEPT", "HKLA"]].astype(str)
+    with emulator.WitsmlStoreEmulator(max_data_nodes=20) as store:
+        client = jeng.WitsmlClient()
+        assert client.connect(url=store.url(), username="", password="", is_raw=True)
+        log_query = generate.generate_log_query(
+            log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+            log_curve_info_list=common.LOG_CURVE_INFO_DEPTH_LIST,
+            dataframe=dataframe,
+        )
+        assert client.add_to_store(wml_type_in="log", xml_in=log_query).Result == 1
+
+        # a small first window probes row density, following windows are sized by the sizer
+        sizer = adaptive.RequestSizer(target_latency=60.0, initial_rows=4, max_rows=4)
+        log_index = model.LogIndexModel(
+            start=dataframe["DEPT"][2], end=dataframe["DEPT"][19], type=model.LogIndexTypeEnum.NON_TIME
+        )
+        store.max_data_nodes = 6
+        chunk_list = list(
+            fetch.iter_log_data(
+                client, common.LOG_INFO_WELL_WELLBORE, common.LOG_CURVE_INFO_DEPTH_LIST, log_index, sizer
+            )
+        )
+        # no request asks for the whole range, so the server never truncates at 6 rows
+        assert len(chunk_list[0].index) == 1 and all(len(chunk.index) <= 5 for chunk in chunk_list)
+        assert len(chunk_list) > 3
+        reply_dataframe = pandas.concat(chunk_list, ignore_index=True)
+        assert reply_dataframe["DEPT"].tolist() == dataframe["DEPT"][2:].tolist()
+        assert sizer.rows(client.url(), adaptive.OPERATION_GET) == 4
+
+
+@pytest.mark.unit
+def test_iter_log_data_windowed_by_capabilities():
+    with emulator.WitsmlStoreEmulator() as store:
+        client = common.__connect_emulator(store)
+        dataframe = common.__prepare_depth_dataframe(rows=20).astype(str)
+        log_query = generate.generate_log_query(
+            log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+            log_curve_info_list=common.LOG_CURVE_INFO_DEPTH_LIST,
+            dataframe=dataframe,
+        )
+        assert client.add_to_store(wml_type_in="log", xml_in=log_query).Result == 1
+
+        # maxDataNodes advertised on connect bounds the windows, the server never truncates
+        store.max_data_nodes = 3
+        client = common.__connect_emulator(store)
+        sizer = adaptive.RequestSizer(target_latency=60.0, initial_rows=1000)
+        log_index = model.LogIndexModel(
+            start=dataframe["DEPT"][0], end=dataframe["DEPT"][19], type=model.LogIndexTypeEnum.NON_TIME
+        )
+        chunk_list = list(
+            fetch.iter_log_data(
+                client, common.LOG_INFO_WELL_WELLBORE, common.LOG_CURVE_INFO_DEPTH_LIST, log_index, sizer
+            )
+        )
+        assert all(len(chunk.index) <= 3 for chunk in chunk_list)
+        assert pandas.concat(chunk_list, ignore_index=True)["DEPT"].tolist() == dataframe["DEPT"].tolist()
+        assert sizer.rows(client.url(), adaptive.OPERATION_GET, curve_count=2) > 3
+
+
+@pytest.mark.unit
+def test_ingest_file_with_sizer(tmp_path):
+    path = tmp_path / "log.csv"
+    pandas.read_csv(f"{common.SAMPLE_PATH}/{common.DEPTH_BASED_SAMPLE_FILENAME}.csv", nrows=30).to_csv(
+        path, index=False
+    )
+    with emulator.WitsmlStoreEmulator() as store:
+        client = jeng.WitsmlClient()
+        assert client.connect(url=store.url(), username="", password="", is_raw=True)
+        sizer = adaptive.RequestSizer(target_latency=60.0, initial_rows=2, max_rows=8)
+        assert ingest.ingest_file(client, str(path), common.LOG_INFO_WELL_WELLBORE, sizer=sizer) == 30
+
+        # 2 + 4 + 8 + 8 + 8 rows
+        assert store.request_count < 10
+        assert sizer.rows(client.url(), adaptive.OPERATION_UPLOAD) == 8
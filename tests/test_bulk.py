@@ -0,0 +1,95 @@
+import json
+import os
+
+import common
+import pandas
+import pytest
+
+from jeng import bulk, emulator, generate
+
+
+@pytest.mark.unit
+def test_parse_log_key():
+    log_basic_info = bulk.parse_log_key("WELL_001/WELLBORE_001/LOG_001")
+    assert (log_basic_info.well_uid, log_basic_info.wellbore_uid, log_basic_info.log_uid) == (
+        "WELL_001",
+        "WELLBORE_001",
+        "LOG_001",
+    )
+    with pytest.raises(ValueError):
+        bulk.parse_log_key("WELL_001/LOG_001")
+
+
+@pytest.mark.unit
+def test_bulk_export_import_csv(tmp_path):
+    dataframe = common.__prepare_depth_dataframe(rows=10).astype(str)
+    log_key = "WELL_001/WELLBORE_001/LOG_001"
+    with emulator.WitsmlStoreEmulator(max_data_nodes=4) as source, emulator.WitsmlStoreEmulator() as target:
+        # emulator rejects more rows than maxDataNodes per request
+        client = common.__connect_emulator(source)
+        for start in range(0, len(dataframe), 4):
+            log_query = generate.generate_log_query(
+                log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+                log_curve_info_list=common.LOG_CURVE_INFO_DEPTH_LIST,
+                dataframe=dataframe[start : start + 4],
+                is_include_log_curve_info=start == 0,
+            )
+            if start == 0:
+                assert client.add_to_store(wml_type_in="log", xml_in=log_query).Result == 1
+            else:
+                assert client.update_in_store(wml_type_in="log", xml_in=log_query).Result == 1
+
+        # one part file per truncated reply
+        output = tmp_path / "dataset"
+        report_path = tmp_path / "export.json"
+        args = ["--url", source.url(), "--raw", "--output-report", str(report_path), "export"]
+        assert bulk.main(args + ["--log", log_key, "--output", str(output), "--format", "csv"]) == 0
+        report = json.loads(report_path.read_text())
+        assert report["rows"] == 10 and report["error_count"] == 0
+        log_path = bulk.log_path(str(output), common.LOG_INFO_WELL_WELLBORE)
+        assert sorted(os.listdir(log_path)) == ["_header.json"] + [f"part-0000{part}.csv" for part in range(3)]
+
+        # rows per request bounded by --rows
+        report_path = tmp_path / "import.json"
+        args = ["--url", target.url(), "--raw", "--output-report", str(report_path), "import", str(output)]
+        assert bulk.main(args + ["--rows", "3"]) == 0
+        assert json.loads(report_path.read_text())["logs"][log_key]["rows"] == 10
+        assert target.request_count > 4
+
+        client = common.__connect_emulator(target)
+        reply_dataframe = client.get_log_data(common.LOG_INFO_WELL_WELLBORE)
+        assert reply_dataframe["HKLA"].tolist() == dataframe["HKLA"].astype(float).tolist()
+        assert reply_dataframe.attrs["unit_dict"]["HKLA"] == "klbf"
+
+
+@pytest.mark.unit
+def test_bulk_export_resume(tmp_path):
+    dataframe = common.__prepare_depth_dataframe(rows=10).astype(str)
+    with emulator.WitsmlStoreEmulator() as store:
+        client = common.__connect_emulator(store)
+        log_query = generate.generate_log_query(
+            log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+            log_curve_info_list=common.LOG_CURVE_INFO_DEPTH_LIST,
+            dataframe=dataframe,
+        )
+        assert client.add_to_store(wml_type_in="log", xml_in=log_query).Result == 1
+
+        # interrupted after the 4th row, resumed after it
+        checkpoint = bulk.Checkpoint(str(tmp_path / "checkpoint.json"))
+        checkpoint.update("WELL_001/WELLBORE_001/LOG_001", part=1, end_index=dataframe["DEPT"][3], rows=4)
+        report = bulk.export_log(
+            client, common.LOG_INFO_WELL_WELLBORE, str(tmp_path), bulk.FORMAT_CSV, bulk.Checkpoint(checkpoint.path)
+        )
+        assert report["rows"] == 6
+        part_dataframe = pandas.read_csv(
+            os.path.join(bulk.log_path(str(tmp_path), common.LOG_INFO_WELL_WELLBORE), "part-00001.csv"), dtype=str
+        )
+        assert part_dataframe["DEPT"].tolist() == dataframe["DEPT"][4:].tolist()
+
+        # completed log is skipped
+        checkpoint = bulk.Checkpoint(checkpoint.path)
+        assert checkpoint.get("WELL_001/WELLBORE_001/LOG_001")["is_done"]
+        assert (
+            bulk.export_log(client, common.LOG_INFO_WELL_WELLBORE, str(tmp_path), bulk.FORMAT_CSV, checkpoint)["rows"]
+            == 0
+        )
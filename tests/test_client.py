@@ -1,7 +1,9 @@
+import types
+
 import common
 import pytest
 
-from jeng import jeng
+from jeng import exception, jeng, model
 
 
 @pytest.mark.integration
@@ -128,3 +130,60 @@ def test_api_call_before_connect():
                 wml_type_in="well",
                 xml_in=query.read(),
             )
+
+
+class StubReplyClient(jeng.WitsmlClient):
+    "A WITSML client that replies get_from_store from a list of XMLout string."
+
+    def __init__(self, xml_out_list):
+        super().__init__()
+        self.xml_out_list = xml_out_list
+        self.query_list = []
+
+    def get_from_store(self, wml_type_in, xml_in, return_element, **kwargs):
+        self.query_list.append(xml_in)
+        xml_out = self.xml_out_list.pop(0) if self.xml_out_list else ""
+        if xml_out is None:
+            return types.SimpleNamespace(Result=-401, XMLout="", SuppMsgOut="Invalid uid")
+        return types.SimpleNamespace(Result=1, XMLout=xml_out, SuppMsgOut="")
+
+
+@pytest.mark.unit
+def test_tail_log():
+    with open(f"{common.QUERY_PATH}/log_reply_data.xml", "r") as reply:
+        xml_out = reply.read()
+    client = StubReplyClient([xml_out, xml_out, xml_out.replace("2020-06-30T17:44:33", "2020-06-30T17:46:13")])
+    tail = client.tail_log(
+        log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+        log_curve_info_list=common.LOG_CURVE_INFO_TIME_LIST,
+        min_interval=0,
+        max_interval=0,
+    )
+
+    # first poll returns the whole log, typed, selected by mnemonicList
+    increment: model.LogTailIncrementModel = next(tail)
+    assert increment.dataframe.shape[0] == 10
+    assert increment.end == "2020-06-30T17:46:03.0000000+08:00"
+    assert str(increment.dataframe["TIME"].dtype) == "datetime64[ns, UTC]"
+    assert increment.dataframe["HKLA"].dtype == "float64"
+    assert "<mnemonicList>TIME,DEPTH,HKLA</mnemonicList>" in client.query_list[0]
+
+    # second poll only contains already seen rows, third poll contains one new row
+    increment = next(tail)
+    tail.close()
+    assert increment.dataframe.shape[0] == 1
+    assert increment.start == increment.end == "2020-06-30T17:46:13.0000000+08:00"
+    assert "2020-06-30T17:46:03.0000000+08:00" in client.query_list[-1]
+
+
+@pytest.mark.unit
+def test_tail_log_error():
+    client = StubReplyClient([None])
+    tail = client.tail_log(
+        log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+        log_curve_info_list=common.LOG_CURVE_INFO_TIME_LIST,
+        min_interval=0,
+        max_interval=0,
+    )
+    with pytest.raises(exception.JengReplyErrorException):
+        next(tail)
@@ -0,0 +1,104 @@
+import copy
+
+import common
+import pandas
+import pytest
+
+from jeng import composite, emulator, generate, jeng, model
+
+LOG_INFO_RUN_2 = copy.copy(common.LOG_INFO_WELL_WELLBORE)
+LOG_INFO_RUN_2.log_uid = "LOG_002"
+LOG_INFO_RUN_2.log_name = "LOG 002"
+LOG_CURVE_INFO_RUN_2_LIST = common.LOG_CURVE_INFO_DEPTH_LIST + [
+    model.LogCurveInfoModel(
+        uid="GR",
+        mnemonic="GR",
+        unit="gAPI",
+        curve_description="Gamma Ray",
+        type_log_data="double",
+    )
+]
+
+
+def __prepare_store(client: jeng.WitsmlClient) -> pandas.DataFrame:
+    dataframe = pandas.read_csv(
+        filepath_or_buffer=f"{common.SAMPLE_PATH}/{common.DEPTH_BASED_SAMPLE_FILENAME}.csv",
+        nrows=50,
+    )[["DEPT", "HKLA", "GR"]].astype(str)
+
+    # run 1 has a gap in HKLA, run 2 overlaps the end of run 1 with different values
+    run_1_dataframe = dataframe[:30][["DEPT", "HKLA"]].copy()
+    run_1_dataframe.loc[25, "HKLA"] = ""
+    run_2_dataframe = dataframe[20:].copy()
+    run_2_dataframe["HKLA"] = "1.5"
+    for log_basic_info, log_curve_info_list, run_dataframe in [
+        (common.LOG_INFO_WELL_WELLBORE, common.LOG_CURVE_INFO_DEPTH_LIST, run_1_dataframe),
+        (LOG_INFO_RUN_2, LOG_CURVE_INFO_RUN_2_LIST, run_2_dataframe),
+    ]:
+        log_query = generate.generate_log_query(
+            log_basic_info=log_basic_info,
+            log_curve_info_list=log_curve_info_list,
+            dataframe=run_dataframe,
+        )
+        assert client.add_to_store(wml_type_in="log", xml_in=log_query).Result == 1
+    return dataframe
+
+
+@pytest.mark.unit
+def test_iter_composite_log():
+    with emulator.WitsmlStoreEmulator() as store:
+        client = jeng.WitsmlClient()
+        assert client.connect(url=store.url(), username="", password="", is_raw=True)
+        dataframe = __prepare_store(client)
+
+        # replies of 7 rows, composite is streamed in several chunks
+        store.max_data_nodes = 7
+        chunk_list = list(composite.iter_composite_log(client, [common.LOG_INFO_WELL_WELLBORE, LOG_INFO_RUN_2]))
+        assert len(chunk_list) > 2
+        composite_dataframe = pandas.concat(chunk_list, ignore_index=True)
+        assert list(composite_dataframe.columns) == ["DEPT", "HKLA", "GR"]
+        assert composite_dataframe["DEPT"].tolist() == dataframe["DEPT"].astype(float).tolist()
+
+        # run 1 has priority, run 2 fills its gap and continues
+        expected_hkla = dataframe["HKLA"].astype(float).tolist()[:30] + [1.5] * 20
+        expected_hkla[25] = 1.5
+        assert composite_dataframe["HKLA"].tolist() == expected_hkla
+        assert composite_dataframe["GR"][:20].isna().all()
+        assert composite_dataframe["GR"][20:].tolist() == dataframe["GR"][20:].astype(float).tolist()
+        assert chunk_list[0].attrs["unit_dict"] == {"DEPT": "m", "HKLA": "klbf", "GR": "gAPI"}
+
+        # later runs first
+        composite_dataframe = composite.get_composite_log(
+            client, [LOG_INFO_RUN_2, common.LOG_INFO_WELL_WELLBORE], mnemonic_list=["HKLA"]
+        )
+        assert list(composite_dataframe.columns) == ["DEPT", "HKLA"]
+        assert composite_dataframe["HKLA"].tolist()[18:22] == [
+            float(dataframe["HKLA"][18]),
+            float(dataframe["HKLA"][19]),
+            1.5,
+            1.5,
+        ]
+
+
+@pytest.mark.unit
+def test_get_composite_log_resampled():
+    with emulator.WitsmlStoreEmulator() as store:
+        client = jeng.WitsmlClient()
+        assert client.connect(url=store.url(), username="", password="", is_raw=True)
+        dataframe = __prepare_store(client)
+        store.max_data_nodes = 7
+
+        log_index = model.LogIndexModel(start="2575.0", end="2580.0", type=model.LogIndexTypeEnum.NON_TIME)
+        composite_dataframe = composite.get_composite_log(
+            client, [common.LOG_INFO_WELL_WELLBORE, LOG_INFO_RUN_2], log_index=log_index, step=0.5
+        )
+        assert composite_dataframe["DEPT"].tolist() == [2575.0 + 0.5 * number for number in range(11)]
+
+        # every grid index takes the nearest row within the index range
+        depth = dataframe["DEPT"][:20].astype(float)
+        depth = depth[depth >= 2575.0]
+        for grid, hkla in zip(composite_dataframe["DEPT"][:6], composite_dataframe["HKLA"][:6]):
+            assert hkla == float(dataframe["HKLA"][(depth - grid).abs().idxmin()])
+
+        # priority before distance: run 1 within half a step wins over a nearer row of run 2
+        assert composite_dataframe["HKLA"].tolist()[-2:] == [float(dataframe["HKLA"][29]), 1.5]
@@ -0,0 +1,146 @@
+import common
+import numpy
+import pandas
+import pytest
+
+from jeng import decimate, emulator, fetch, generate, jeng, metric, model
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("select", [decimate.lttb, decimate.min_max])
+def test_decimate_select(select):
+    x = numpy.arange(10_000, dtype=float)
+    y = numpy.sin(x / 500)
+    y[1234] = 50.0
+    y[4321] = numpy.nan
+    position_array = select(x, y, 200)
+    assert len(position_array) <= 200
+    assert position_array[0] == 0 and position_array[-1] == 9_999
+    assert (numpy.diff(position_array) > 0).all()
+    assert 1234 in position_array and 4321 not in position_array
+
+    # nothing to decimate
+    assert (select(x[:100], y[:100], 200) == numpy.arange(100)).all()
+
+
+@pytest.mark.unit
+def test_decimate_dataframe():
+    dataframe = pandas.DataFrame(
+        {
+            "DEPT": [str(1000 + index * 0.5) for index in range(1000)],
+            "HKLA": [str(numpy.cos(index / 50)) for index in range(1000)],
+            "NAME": ["A"] * 1000,
+        }
+    )
+    decimated = decimate.decimate(dataframe, "DEPT", model.LogIndexTypeEnum.NON_TIME, point_count=100)
+    assert len(decimated.index) <= 100 and list(decimated.columns) == ["DEPT", "HKLA", "NAME"]
+    assert decimated["DEPT"].iloc[0] == "1000.0" and decimated["DEPT"].iloc[-1] == "1499.5"
+    with pytest.raises(ValueError):
+        decimate.decimate(dataframe, "DEPT", model.LogIndexTypeEnum.NON_TIME, point_count=100, method="mean")
+
+
+@pytest.mark.unit
+def test_get_log_decimated():
+    dataframe = pandas.DataFrame(
+        {
+            "DEPT": [str(1000 + index * 0.5) for index in range(400)],
+            "HKLA": [str(round(numpy.sin(index / 20), 5)) for index in range(400)],
+        }
+    )
+    request_list = []
+    with emulator.WitsmlStoreEmulator() as store:
+        client = jeng.WitsmlClient()
+        assert client.connect(url=store.url(), username="", password="", is_raw=True)
+        log_query = generate.generate_log_query(
+            log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+            log_curve_info_list=common.LOG_CURVE_INFO_DEPTH_LIST,
+            dataframe=dataframe,
+        )
+        assert client.add_to_store(wml_type_in="log", xml_in=log_query).Result == 1
+
+        metric.add_hook(request_list.append)
+        try:
+            decimated = fetch.get_log_decimated(
+                client,
+                common.LOG_INFO_WELL_WELLBORE,
+                common.LOG_CURVE_INFO_DEPTH_LIST,
+                model.LogIndexModel(start="1000", end="1199.5", type=model.LogIndexTypeEnum.NON_TIME),
+                point_count=20,
+                window_count=5,
+            )
+            dense_request_count = len([item for item in request_list if item.operation == "WMLS_GetFromStore"])
+            request_list.clear()
+            sparse_decimated = fetch.get_log_decimated(
+                client,
+                common.LOG_INFO_WELL_WELLBORE,
+                common.LOG_CURVE_INFO_DEPTH_LIST,
+                model.LogIndexModel(start="1000", end="1009.5", type=model.LogIndexTypeEnum.NON_TIME),
+                point_count=20,
+                window_count=5,
+            )
+            sparse_request_count = len([item for item in request_list if item.operation == "WMLS_GetFromStore"])
+        finally:
+            metric.remove_hook(request_list.append)
+
+    # 80 rows per window exceed the 8 latest values, every window is fetched again as a whole
+    assert dense_request_count == 10
+    assert (
+        len(decimated.index) == 20 and decimated["DEPT"].iloc[0] == "1000.0" and decimated["DEPT"].iloc[-1] == "1199.5"
+    )
+    assert set(decimated["DEPT"]) <= set(dataframe["DEPT"])
+
+    # 4 rows per window are complete with the latest values
+    assert sparse_request_count == 5
+    assert sparse_decimated["DEPT"].tolist() == dataframe["DEPT"][:20].tolist()
+
+
+@pytest.mark.unit
+def test_get_log_decimated_curve_selection():
+    dataframe = pandas.DataFrame(
+        {
+            "DEPT": [str(1000 + index * 0.5) for index in range(400)],
+            "HKLA": [str(round(numpy.sin(index / 20), 5)) for index in range(400)],
+            "GR": [str(round(numpy.cos(index / 7), 5)) for index in range(400)],
+        }
+    )
+    log_curve_info_list = common.LOG_CURVE_INFO_DEPTH_LIST + [
+        model.LogCurveInfoModel(
+            uid="GR",
+            mnemonic="GR",
+            unit="gAPI",
+            curve_description="Gamma Ray",
+            type_log_data="double",
+        )
+    ]
+    with emulator.WitsmlStoreEmulator() as store:
+        client = jeng.WitsmlClient()
+        assert client.connect(url=store.url(), username="", password="", is_raw=True)
+        log_query = generate.generate_log_query(
+            log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+            log_curve_info_list=log_curve_info_list,
+            dataframe=dataframe,
+        )
+        assert client.add_to_store(wml_type_in="log", xml_in=log_query).Result == 1
+        log_index = model.LogIndexModel(start="1000", end="1199.5", type=model.LogIndexTypeEnum.NON_TIME)
+
+        # only the requested curves are fetched
+        decimated = fetch.get_log_decimated(
+            client, common.LOG_INFO_WELL_WELLBORE, common.LOG_CURVE_INFO_DEPTH_LIST, log_index, point_count=20
+        )
+        assert list(decimated.columns) == ["DEPT", "HKLA"]
+
+        # rows selected for every curve are bounded by point_count, not point_count per curve
+        for method in [decimate.METHOD_LTTB, decimate.METHOD_MIN_MAX]:
+            decimated = fetch.get_log_decimated(
+                client,
+                common.LOG_INFO_WELL_WELLBORE,
+                log_curve_info_list,
+                log_index,
+                point_count=20,
+                window_count=4,
+                method=method,
+            )
+            assert list(decimated.columns) == ["DEPT", "HKLA", "GR"]
+            assert 10 < len(decimated.index) <= 20
+        with pytest.raises(ValueError):
+            decimate.decimate(dataframe, "DEPT", model.LogIndexTypeEnum.NON_TIME, point_count=5)
@@ -0,0 +1,74 @@
+import common
+import pytest
+
+from jeng import diff, emulator, generate, metric, model
+
+LOG_CURVE_INFO_LIST = common.LOG_CURVE_INFO_DEPTH_LIST + [
+    model.LogCurveInfoModel(
+        uid="GR",
+        mnemonic="GR",
+        unit="gAPI",
+        curve_description="Gamma Ray",
+        type_log_data="double",
+    )
+]
+
+
+@pytest.mark.unit
+def test_diff_log_data():
+    remote_dataframe = common.__prepare_depth_dataframe(rows=5, mnemonic_list=["DEPT", "HKLA", "GR"]).astype(str)
+    dataframe = remote_dataframe.copy()
+    dataframe.loc[1, "HKLA"] = "1.5"
+    dataframe.loc[3, "GR"] = ""
+    dataframe.loc[4, "GR"] = dataframe["GR"][4] + "0"  # same number, different text
+    dataframe.loc[5] = ["2575.7124", "300.0", ""]  # not on the server
+
+    mask = diff.diff_log_data(dataframe, remote_dataframe, "DEPT", model.LogIndexTypeEnum.NON_TIME)
+    assert list(mask.columns) == ["HKLA", "GR"]
+    assert mask["HKLA"].tolist() == [False, True, False, False, False, True]
+    assert mask["GR"].tolist() == [False, False, False, True, False, False]
+
+    # typed local data and relative tolerance
+    typed_dataframe = dataframe[:5].astype({"DEPT": float, "HKLA": float})
+    typed_dataframe.loc[2, "HKLA"] = float(remote_dataframe["HKLA"][2]) * (1 + 1e-9)
+    mask = diff.diff_log_data(typed_dataframe, remote_dataframe, "DEPT", model.LogIndexTypeEnum.NON_TIME, rtol=1e-6)
+    assert mask["HKLA"].tolist() == [False, True, False, False, False]
+
+
+@pytest.mark.unit
+def test_update_log_diff_with_emulator():
+    remote_dataframe = common.__prepare_depth_dataframe(rows=10, mnemonic_list=["DEPT", "HKLA", "GR"]).astype(str)
+    with emulator.WitsmlStoreEmulator() as store:
+        client = common.__connect_emulator(store)
+        log_query = generate.generate_log_query(
+            log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+            log_curve_info_list=LOG_CURVE_INFO_LIST,
+            dataframe=remote_dataframe,
+        )
+        assert client.add_to_store(wml_type_in="log", xml_in=log_query).Result == 1
+
+        dataframe = remote_dataframe.copy()
+        dataframe.loc[2, "HKLA"] = "1.5"
+        dataframe.loc[7, "HKLA"] = "2.5"
+        dataframe.loc[7, "GR"] = "3.5"
+        query_list = diff.generate_diff_query_list(
+            common.LOG_INFO_WELL_WELLBORE, LOG_CURVE_INFO_LIST, dataframe, remote_dataframe
+        )
+        assert len(query_list) == 2 and sum(rows for _, rows in query_list) == 2
+        assert "<mnemonicList>DEPT,HKLA</mnemonicList>" in query_list[0][0]
+        assert "<data>2575.2552,1.5</data>" in query_list[0][0]
+
+        request_list = []
+        metric.add_hook(request_list.append)
+        try:
+            assert diff.update_log_diff(client, common.LOG_INFO_WELL_WELLBORE, LOG_CURVE_INFO_LIST, dataframe) == 2
+            assert diff.update_log_diff(client, common.LOG_INFO_WELL_WELLBORE, LOG_CURVE_INFO_LIST, dataframe) == 0
+        finally:
+            metric.remove_hook(request_list.append)
+        assert [item.operation for item in request_list if item.operation.startswith("WMLS_")].count(
+            "WMLS_UpdateInStore"
+        ) == 2
+
+        reply_dataframe = client.get_log_data(common.LOG_INFO_WELL_WELLBORE)
+        assert reply_dataframe["HKLA"].tolist() == dataframe["HKLA"].astype(float).tolist()
+        assert reply_dataframe["GR"].tolist() == dataframe["GR"].astype(float).tolist()
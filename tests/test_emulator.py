@@ -0,0 +1,269 @@
+from xml.etree import ElementTree
+
+import common
+import pytest
+
+from jeng import emulator, exception, generate, jeng, metric, model, parse, soap
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("is_raw", [False, True])
+def test_emulator_well_crud(is_raw):
+    with emulator.WitsmlStoreEmulator(username="user", password="pass") as store:
+        client = common.__connect_emulator(store, is_raw)
+        assert client.capabilities().is_supported("WMLS_GetFromStore", "log")
+        for wml_type_in, filename, supp_msg_out in [
+            ("well", "well_create", "WELL_001"),
+            ("wellbore", "wellbore_create", "WELLBORE_001"),
+        ]:
+            with open(f"{common.QUERY_PATH}/{filename}.xml", "r") as query:
+                reply = client.add_to_store(wml_type_in=wml_type_in, xml_in=query.read())
+                assert reply.Result == 1 and reply.SuppMsgOut == supp_msg_out
+
+        # duplicated uid
+        with open(f"{common.QUERY_PATH}/well_create.xml", "r") as query:
+            assert (
+                client.add_to_store(wml_type_in="well", xml_in=query.read()).Result
+                == emulator.ERROR_DATA_OBJECT_UID_EXISTS
+            )
+
+        with open(f"{common.QUERY_PATH}/well_update.xml", "r") as query:
+            assert client.update_in_store(wml_type_in="well", xml_in=query.read()).Result == 1
+        with open(f"{common.QUERY_PATH}/well_read.xml", "r") as query:
+            reply = client.get_from_store(wml_type_in="well", xml_in=query.read(), return_element="all")
+            root = common.__parse_and_remove_ns(reply.XMLout)
+            assert reply.Result == 1 and root.find("well/name").text == "WELL 002"
+
+        for wml_type_in, filename in [("wellbore", "wellbore_delete"), ("well", "well_delete")]:
+            with open(f"{common.QUERY_PATH}/{filename}.xml", "r") as query:
+                assert client.delete_from_store(wml_type_in=wml_type_in, xml_in=query.read()).Result == 1
+        with open(f"{common.QUERY_PATH}/well_read.xml", "r") as query:
+            reply = client.get_from_store(wml_type_in="well", xml_in=query.read(), return_element="all")
+            assert common.__parse_and_remove_ns(reply.XMLout).find("well") is None
+
+
+@pytest.mark.unit
+def test_emulator_incorrect_credentials():
+    with emulator.WitsmlStoreEmulator(username="user", password="pass") as store:
+        client = jeng.WitsmlClient()
+        assert not client.connect(url=store.url(), username="user", password="wrong")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("is_raw", [False, True])
+def test_emulator_capabilities_error(monkeypatch, is_raw):
+    with emulator.WitsmlStoreEmulator() as store:
+        handle = store.handle
+        get_cap_reply_list = [{"Result": -424, "SuppMsgOut": "WMLS_GetCap is disabled"}, RuntimeError("disabled")]
+
+        def handle_without_capabilities(function, part_dict):
+            if function != "WMLS_GetCap":
+                return handle(function, part_dict)
+            reply = get_cap_reply_list.pop(0)
+            if isinstance(reply, Exception):
+                raise reply
+            return reply
+
+        monkeypatch.setattr(store, "handle", handle_without_capabilities)
+        client = common.__connect_emulator(store, is_raw)
+        assert client.capabilities() is None
+        assert isinstance(client.capabilities_error(), exception.JengReplyErrorException)
+        assert client.capabilities_error().result == -424
+
+        # SOAP fault is kept as well, connection still usable
+        assert client.connect(url=store.url(), username="", password="", is_raw=is_raw)
+        assert client.capabilities() is None and "disabled" in str(client.capabilities_error())
+        with open(f"{common.QUERY_PATH}/well_read.xml", "r") as query:
+            assert client.get_from_store(wml_type_in="well", xml_in=query.read(), return_element="all").Result == 1
+
+
+@pytest.mark.unit
+def test_emulator_log_data_range_and_truncation():
+    with emulator.WitsmlStoreEmulator(max_data_nodes=4) as store:
+        client = common.__connect_emulator(store)
+        dataframe = common.__prepare_depth_dataframe(rows=10)
+        log_query = generate.generate_log_query(
+            log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+            log_curve_info_list=common.LOG_CURVE_INFO_DEPTH_LIST,
+            dataframe=dataframe[:4],
+        )
+        assert client.add_to_store(wml_type_in="log", xml_in=log_query).Result == 1
+
+        # more rows than maxDataNodes is rejected
+        log_query = generate.generate_log_query(
+            log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+            log_curve_info_list=common.LOG_CURVE_INFO_DEPTH_LIST,
+            dataframe=dataframe[4:],
+            is_include_log_curve_info=False,
+        )
+        assert client.update_in_store(wml_type_in="log", xml_in=log_query).Result == emulator.ERROR_MAX_DATA_EXCEEDED
+        for start in [4, 8]:
+            log_query = generate.generate_log_query(
+                log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+                log_curve_info_list=common.LOG_CURVE_INFO_DEPTH_LIST,
+                dataframe=dataframe[start : start + 4],
+                is_include_log_curve_info=False,
+            )
+            assert client.update_in_store(wml_type_in="log", xml_in=log_query).Result == 1
+
+        # index range
+        log_query = generate.generate_log_query(
+            log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+            log_curve_info_list=common.LOG_CURVE_INFO_DEPTH_LIST,
+            is_include_log_curve_info=False,
+            log_index=model.LogIndexModel(start="2575.2552", end="2575.56", type=model.LogIndexTypeEnum.NON_TIME),
+        )
+        reply = client.get_from_store(wml_type_in="log", xml_in=log_query, return_element="data-only")
+        assert reply.Result == 1 and parse.parse_log_into_dataframe(xml_out=reply.XMLout).shape == (3, 2)
+
+        # truncated to maxDataNodes
+        log_query = generate.generate_log_query(
+            log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+            log_curve_info_list=common.LOG_CURVE_INFO_DEPTH_LIST,
+        )
+        reply = client.get_from_store(wml_type_in="log", xml_in=log_query, return_element="all")
+        assert reply.Result == 2 and parse.parse_log_into_dataframe(xml_out=reply.XMLout).shape == (4, 2)
+        log_curve_info_list = parse.parse_log_into_curve_info(xml_out=reply.XMLout)
+        assert [curve_info.mnemonic for curve_info in log_curve_info_list] == ["DEPT", "HKLA"]
+        root = common.__parse_and_remove_ns(reply.XMLout)
+        assert root.find("log/startIndex").text == "2574.9504" and root.find("log/endIndex").text == "2576.322"
+
+
+@pytest.mark.unit
+def test_emulator_request_too_large():
+    with emulator.WitsmlStoreEmulator(max_request_size=10) as store:
+        client = common.__connect_emulator(store, is_raw=False)
+        with open(f"{common.QUERY_PATH}/well_create.xml", "r") as query:
+            assert (
+                client.add_to_store(wml_type_in="well", xml_in=query.read()).Result == emulator.ERROR_REQUEST_TOO_LARGE
+            )
+
+
+@pytest.mark.unit
+def test_emulator_function_not_supported():
+    with emulator.WitsmlStoreEmulator() as store:
+        reply_dict = store.handle("WMLS_GetFromStoreEx", {"WMLtypeIn": "well", "QueryIn": "<wells/>"})
+        assert reply_dict["Result"] == emulator.ERROR_FUNCTION_NOT_SUPPORTED and reply_dict["SuppMsgOut"]
+
+        # replied as an error result, not a SOAP fault
+        body = (
+            f'<soap:Envelope xmlns:soap="{soap.SOAP_ENVELOPE_NAMESPACE}"><soap:Body>'
+            f'<WMLS_GetFromStoreEx xmlns="{soap.WITSML_MESSAGE_NAMESPACE}"/></soap:Body></soap:Envelope>'
+        )
+        root = emulator.strip_namespace(ElementTree.fromstring(store.handle_envelope(body.encode("utf-8"))))
+        assert root.find("Body/WMLS_GetFromStoreExResponse/Result").text == str(emulator.ERROR_FUNCTION_NOT_SUPPORTED)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("is_raw", [False, True])
+def test_emulator_batch(is_raw):
+    well_template = '<wells xmlns="http://www.witsml.org/schemas/1series" version="1.4.1.1">{}</wells>'
+    with emulator.WitsmlStoreEmulator(username="user", password="pass", latency=0.01) as store:
+        client = common.__connect_emulator(store, is_raw)
+        operation_list = [
+            model.BatchOperationModel(
+                function="add_to_store",
+                wml_type_in="well",
+                xml_in=well_template.format(f'<well uid="WELL_{index:03}"><name>WELL {index:03}</name></well>'),
+            )
+            for index in range(20)
+        ]
+        result_list = client.batch(operation_list, max_workers=8)
+        assert [result.operation for result in result_list] == operation_list
+        assert all(result.error is None and result.reply.Result == 1 for result in result_list)
+        assert [result.reply.SuppMsgOut for result in result_list] == [f"WELL_{index:03}" for index in range(20)]
+
+        # per-item failure doesn't affect the other operations
+        future_list = client.batch(
+            [
+                model.BatchOperationModel(
+                    function="get_from_store",
+                    wml_type_in="well",
+                    xml_in=well_template.format('<well uid="WELL_005"><name/></well>'),
+                ),
+                operation_list[0],
+                model.BatchOperationModel(
+                    function="delete_from_store",
+                    wml_type_in="well",
+                    xml_in=well_template.format('<well uid="WELL_019"/>'),
+                ),
+            ],
+            max_workers=2,
+            is_future=True,
+        )
+        get_result, add_result, delete_result = [future.result() for future in future_list]
+        assert common.__parse_and_remove_ns(get_result.reply.XMLout).find("well/name").text == "WELL 005"
+        assert add_result.reply.Result == emulator.ERROR_DATA_OBJECT_UID_EXISTS
+        assert delete_result.reply.Result == 1
+
+
+@pytest.mark.unit
+def test_batch_before_connect():
+    with open(f"{common.QUERY_PATH}/well_read.xml", "r") as query:
+        operation = model.BatchOperationModel(function="get_from_store", wml_type_in="well", xml_in=query.read())
+    result_list = jeng.WitsmlClient().batch([operation, operation])
+    assert all(isinstance(result.error, exception.JengClientNoneException) for result in result_list)
+    assert all(result.reply is None for result in result_list)
+
+    with pytest.raises(exception.JengBatchFunctionNotSupportedException):
+        jeng.WitsmlClient().batch([model.BatchOperationModel(function="tail_log", wml_type_in="log", xml_in="")])
+
+
+@pytest.mark.unit
+def test_emulator_spooled_reply():
+    with emulator.WitsmlStoreEmulator() as store:
+        client = jeng.WitsmlClient()
+        assert client.connect(url=store.url(), username="", password="", is_raw=True, xml_out_type="file")
+        dataframe = common.__prepare_depth_dataframe(rows=10)
+        log_query = generate.generate_log_query(
+            log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+            log_curve_info_list=common.LOG_CURVE_INFO_DEPTH_LIST,
+            dataframe=dataframe,
+        )
+        assert client.add_to_store(wml_type_in="log", xml_in=log_query).Result == 1
+
+        reply = client.get_from_store(wml_type_in="log", xml_in=log_query, return_element="data-only")
+        assert reply.Result == 1 and isinstance(reply.XMLout, soap.SpooledPart)
+        assert parse.parse_log_into_dataframe(xml_out=reply.XMLout).equals(dataframe.astype(str))
+
+
+@pytest.mark.unit
+def test_emulator_get_log_data_with_cached_header():
+    request_list = []
+    with emulator.WitsmlStoreEmulator(max_data_nodes=4) as store:
+        client = common.__connect_emulator(store)
+        dataframe = common.__prepare_depth_dataframe(rows=4)
+        log_query = generate.generate_log_query(
+            log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+            log_curve_info_list=common.LOG_CURVE_INFO_DEPTH_LIST,
+            dataframe=dataframe,
+        )
+        assert client.add_to_store(wml_type_in="log", xml_in=log_query).Result == 1
+
+        metric.add_hook(request_list.append)
+        try:
+            typed_dataframe = client.get_log_data(common.LOG_INFO_WELL_WELLBORE)
+            assert len([item for item in request_list if item.operation == "WMLS_GetFromStore"]) == 2
+
+            # header is cached, data-only requests follow truncation
+            request_list.clear()
+            typed_dataframe = client.get_log_data(
+                common.LOG_INFO_WELL_WELLBORE,
+                mnemonic_list=["HKLA"],
+                log_index=model.LogIndexModel(start="2575.1", end=None, type=model.LogIndexTypeEnum.NON_TIME),
+            )
+            assert len([item for item in request_list if item.operation == "WMLS_GetFromStore"]) == 1
+        finally:
+            metric.remove_hook(request_list.append)
+
+        assert list(typed_dataframe.columns) == ["DEPT", "HKLA"]
+        assert typed_dataframe.dtypes.tolist() == ["float64", "float64"]
+        assert typed_dataframe["DEPT"].tolist() == dataframe["DEPT"][1:].tolist()
+        assert typed_dataframe.attrs["unit_dict"] == {"DEPT": "m", "HKLA": "klbf"}
+        assert len(client.get_log_header(common.LOG_INFO_WELL_WELLBORE)) == 2
+
+        # log nullValue becomes missing value of the typed curve in low-memory mode
+        null_value = str(dataframe["HKLA"][2])
+        compact = client.get_log_data(common.LOG_INFO_WELL_WELLBORE, is_low_memory=True, null_value_list=[null_value])
+        assert compact["HKLA"].isna().tolist() == [False, False, True, False]
+        assert compact["DEPT"].tolist() == dataframe["DEPT"].tolist()
@@ -0,0 +1,108 @@
+import time
+
+import common
+import pytest
+
+from jeng import emulator, exception, fanout, generate, model
+
+WELL_QUERY = '<wells xmlns="http://www.witsml.org/schemas/1series"/>'
+GROWING_LOG_QUERY = (
+    f'<logs xmlns="{generate.WITSML_NAMESPACE}" version="{generate.WITSML_VERSION}">'
+    '<log uidWell="WELL_001" uidWellbore="WELLBORE_001" uid="LOG_002"><nameWell>WELL 001</nameWell>'
+    "<nameWellbore>WELLBORE 001</nameWellbore><name>LOG 002</name><objectGrowing>true</objectGrowing>"
+    "<indexType>measured depth</indexType></log></logs>"
+)
+
+
+@pytest.mark.unit
+def test_fan_out_client():
+    with emulator.WitsmlStoreEmulator() as north, emulator.WitsmlStoreEmulator() as south:
+        endpoint_list = [
+            model.EndpointModel(name="north", url=north.url(), username="", password="", is_raw=True),
+            model.EndpointModel(name="south", url=south.url(), username="", password="", is_raw=True, max_rate=20),
+        ]
+        with fanout.FanOutClient(endpoint_list, timeout=10.0) as client:
+            assert client.connect() == {"north": True, "south": True}
+            log_query = generate.generate_log_query(
+                log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+                log_curve_info_list=common.LOG_CURVE_INFO_DEPTH_LIST,
+            )
+            assert client.client("north").add_to_store(wml_type_in="log", xml_in=log_query).Result == 1
+            assert client.client("south").add_to_store(wml_type_in="log", xml_in=GROWING_LOG_QUERY).Result == 1
+
+            # merged results tagged by endpoint
+            dataframe = client.get_log_list()
+            assert dataframe[["endpoint", "uid"]].values.tolist() == [["north", "LOG_001"], ["south", "LOG_002"]]
+            assert dataframe.attrs["error_dict"] == {}
+            dataframe = client.get_log_list(is_growing=True)
+            assert dataframe[["endpoint", "uid", "indexType"]].values.tolist() == [
+                ["south", "LOG_002", "measured depth"]
+            ]
+
+            # rate limited endpoint, every request counts (2 per call)
+            def get_twice(witsml_client):
+                for _ in range(2):
+                    witsml_client.get_from_store(wml_type_in="well", xml_in=WELL_QUERY, return_element="id-only")
+                return witsml_client.url()
+
+            begin = time.perf_counter()
+            for _ in range(3):
+                result_list = client.map(get_twice, name_list=["south"])
+            assert time.perf_counter() - begin >= 0.2
+            assert [(result.endpoint, result.reply) for result in result_list] == [("south", south.url())]
+
+
+@pytest.mark.unit
+def test_fan_out_client_timeout():
+    with emulator.WitsmlStoreEmulator() as fast, emulator.WitsmlStoreEmulator() as slow:
+        endpoint_list = [
+            model.EndpointModel(name="fast", url=fast.url(), username="", password="", is_raw=True),
+            model.EndpointModel(name="slow", url=slow.url(), username="", password="", is_raw=True, timeout=0.3),
+        ]
+        with fanout.FanOutClient(endpoint_list) as client:
+            assert client.connect() == {"fast": True, "slow": True}
+            fast.latency = 0.2
+            slow.latency = 1.0
+
+            # takes the time of the slowest endpoint within its timeout, not the sum
+            begin = time.perf_counter()
+            result_list = client.get_from_store(
+                wml_type_in="well",
+                xml_in='<wells xmlns="http://www.witsml.org/schemas/1series"/>',
+                return_element="id-only",
+            )
+            assert time.perf_counter() - begin < 0.6
+            assert result_list[0].error is None and result_list[0].reply.Result == 1
+            assert isinstance(result_list[1].error, exception.JengEndpointTimeoutException)
+            assert set(client.get_log_list().attrs["error_dict"]) == {"slow"}
+
+
+@pytest.mark.unit
+def test_fan_out_client_late_work():
+    with emulator.WitsmlStoreEmulator() as fast, emulator.WitsmlStoreEmulator() as slow:
+        endpoint_list = [
+            model.EndpointModel(name="fast", url=fast.url(), username="", password="", is_raw=True),
+            model.EndpointModel(name="slow", url=slow.url(), username="", password="", is_raw=True, timeout=0.3),
+        ]
+        with fanout.FanOutClient(endpoint_list, max_workers=1) as client:
+            assert client.connect() == {"fast": True, "slow": True}
+            call_list = []
+
+            def work(witsml_client):
+                # slow work after the deadline, without HTTP timeout
+                if witsml_client.url() == slow.url():
+                    call_list.append(time.monotonic())
+                    time.sleep(1.0)
+                return witsml_client.url()
+
+            # the abandoned call keeps only the worker of the slow endpoint busy
+            for _ in range(3):
+                begin = time.perf_counter()
+                result_list = client.map(work)
+                assert time.perf_counter() - begin < 0.6
+                assert result_list[0].reply == fast.url()
+                assert isinstance(result_list[1].error, exception.JengEndpointTimeoutException)
+
+            # calls queued behind it past their deadline never start
+            time.sleep(1.0)
+            assert len(call_list) == 1
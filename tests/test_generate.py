@@ -326,3 +326,85 @@ def test_generate_log_without_log_curve_info_with_dataframe():
         for item in ["indexCurve", "indexType", "logCurveInfo", "logData"]
         if item in query_parsed["logs"]["log"].keys()
     ]
+
+
+@pytest.mark.unit
+def test_generate_log_mnemonic_list():
+    query = generate.generate_log_query(
+        log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+        log_curve_info_list=common.LOG_CURVE_INFO_TIME_LIST[::-1],
+        is_include_log_curve_info=False,
+        is_include_mnemonic_list=True,
+    )
+    query_parsed = xmltodict.parse(query)
+    assert "logCurveInfo" not in query_parsed["logs"]["log"]
+    assert query_parsed["logs"]["log"]["logData"] == {"mnemonicList": "TIME,HKLA,DEPTH"}
+
+
+@pytest.mark.unit
+def test_generate_trajectory_query():
+    trajectory_basic_info = model.TrajectoryBasicInfoModel(
+        well_uid="WELL_001",
+        well_name="WELL 001",
+        wellbore_uid="WELLBORE_001",
+        wellbore_name="WELLBORE 001",
+        trajectory_uid="TRAJECTORY_001",
+        trajectory_name="TRAJECTORY 001",
+    )
+    dataframe = pandas.DataFrame(
+        {
+            "uid": ["ST1", "ST2"],
+            "typeTrajStation": ["tie in point", "magnetic MWD"],
+            "md": [0.0, 150.5],
+            "incl": [0.0, float("nan")],
+            "azi": [0.0, 12.25],
+            "other": ["ignored", "ignored"],
+        }
+    )
+    query = generate.generate_trajectory_query(trajectory_basic_info, dataframe, unit_dict={"md": "ft"})
+    station_list = xmltodict.parse(query)["trajectorys"]["trajectory"]["trajectoryStation"]
+    assert [station["@uid"] for station in station_list] == ["ST1", "ST2"]
+    assert list(station_list[1].keys()) == ["@uid", "typeTrajStation", "md", "azi"]
+    assert station_list[1]["md"] == {"@uom": "ft", "#text": "150.5"}
+    assert station_list[1]["azi"] == {"@uom": "dega", "#text": "12.25"}
+
+    # md interval for getting data
+    query = generate.generate_trajectory_query(
+        trajectory_basic_info, md_index=model.LogIndexModel(start="100", end=None, type=model.LogIndexTypeEnum.NON_TIME)
+    )
+    trajectory = xmltodict.parse(query)["trajectorys"]["trajectory"]
+    assert trajectory["mdMn"] == {"@uom": "m", "#text": "100"} and "mdMx" not in trajectory
+
+
+@pytest.mark.unit
+def test_generate_log_compact():
+    log_curve_info_list = common.LOG_CURVE_INFO_DEPTH_LIST + [
+        model.LogCurveInfoModel(
+            uid="GR", mnemonic="GR", unit="gAPI", curve_description="Gamma Ray", type_log_data="double"
+        )
+    ]
+    dataframe = pandas.DataFrame(
+        {
+            "DEPT": [1.0, 2.0, 3.0, 4.0],
+            "HKLA": [float("nan"), 3.0, -999.25, float("nan")],
+            "GR": [None, None, None, None],
+        }
+    )
+
+    # nan is written as is by default
+    query = generate.generate_log_query(common.LOG_INFO_WELL_WELLBORE, log_curve_info_list, dataframe)
+    assert xmltodict.parse(query)["logs"]["log"]["logData"]["data"][0] == "1.0,nan,nan"
+
+    # null curves and rows are left out, null values are empty
+    query = generate.generate_log_query(
+        common.LOG_INFO_WELL_WELLBORE, log_curve_info_list, dataframe, is_compact=True, null_value_list=["-999.25"]
+    )
+    log_data = xmltodict.parse(query)["logs"]["log"]["logData"]
+    assert log_data == {"mnemonicList": "DEPT,HKLA", "unitList": "m,klbf", "data": "2.0,3.0"}
+    assert len(xmltodict.parse(query)["logs"]["log"]["logCurveInfo"]) == 3
+
+    # nothing left
+    query = generate.generate_log_query(
+        common.LOG_INFO_WELL_WELLBORE, log_curve_info_list, dataframe[["DEPT", "GR"]], is_compact=True
+    )
+    assert "logData" not in xmltodict.parse(query)["logs"]["log"]
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULE_LIST = ["lxml", "numpy", "pandas", "requests", "xmltodict", "zeep"]
+
+# generous for a loaded CI runner, eager heavy imports take several times longer
+IMPORT_TIME_BUDGET = 0.5
+
+
+@pytest.mark.unit
+def test_import_is_lazy():
+    module_list = [os.path.splitext(filename)[0] for filename in os.listdir("src/jeng") if filename.endswith(".py")]
+    script = (
+        "import importlib, sys\n"
+        f"for module in {sorted(module_list)!r}:\n"
+        "    importlib.import_module(f'jeng.{module}')\n"
+        f"print(','.join(module for module in {HEAVY_MODULE_LIST!r} if module in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
+
+
+@pytest.mark.unit
+def test_import_time_budget():
+    # cumulative import time (microseconds) of jeng.jeng as reported by -X importtime
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import jeng.jeng"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    line_list = [line for line in result.stderr.splitlines() if line.split("|")[-1].strip() == "jeng.jeng"]
+    assert len(line_list) == 1
+    assert int(line_list[0].split("|")[1]) / 1_000_000 < IMPORT_TIME_BUDGET
+
+
+@pytest.mark.unit
+def test_import_transport_on_first_use():
+    from jeng import transport
+
+    assert transport.WitsmlTransport is transport.WitsmlTransport
+    assert transport.WitsmlTransport(request_compression="gzip").request_compression == "gzip"
+    with pytest.raises(AttributeError):
+        transport.NotExistTransport
@@ -0,0 +1,127 @@
+import common
+import pandas
+import pytest
+
+from jeng import emulator, ingest, jeng
+
+DEPTH_SAMPLE_PATH = f"{common.SAMPLE_PATH}/{common.DEPTH_BASED_SAMPLE_FILENAME}.csv"
+LAS_CONTENT = """~VERSION INFORMATION
+ VERS.                  2.0 : CWLS LOG ASCII STANDARD - VERSION 2.0
+ WRAP.                   NO : ONE LINE PER DEPTH STEP
+~WELL INFORMATION
+ STRT.M            1670.0000 : START DEPTH
+ NULL.              -999.2500 : NULL VALUE
+ WELL.             WELL 001 : WELL
+~CURVE INFORMATION
+ DEPT.M                      : 1  DEPTH
+ GR  .GAPI                   : 2  GAMMA RAY
+ ROP .m/h                    : 3  RATE OF PENETRATION
+~A  DEPTH     GR       ROP
+1670.0000   45.1200   -999.2500
+1670.5000   46.8000   20.1000
+# comment line
+1671.0000   -999.2500   21.4000
+"""
+
+
+@pytest.mark.unit
+def test_read_curve_info_csv():
+    log_curve_info_list = ingest.read_curve_info(DEPTH_SAMPLE_PATH)
+    assert log_curve_info_list[0].mnemonic == "DEPT" and log_curve_info_list[0].is_index_curve
+    assert log_curve_info_list[0].index_type == "measured depth"
+    assert len(log_curve_info_list) == 30 and not any(
+        item.mnemonic.startswith("Unnamed") for item in log_curve_info_list
+    )
+
+
+@pytest.mark.unit
+def test_iter_file_csv():
+    chunk_list = list(ingest.iter_file(DEPTH_SAMPLE_PATH, rows=4))
+    assert all(len(chunk.index) <= 4 for chunk in chunk_list)
+    assert len(chunk_list[0].columns) == 30
+    assert chunk_list[0]["CRPM"][0] == "" and chunk_list[0]["CRPM"][1] == "45"
+
+
+@pytest.mark.unit
+def test_iter_file_las(tmp_path):
+    path = tmp_path / "log.las"
+    path.write_text(LAS_CONTENT)
+    log_curve_info_list = ingest.read_curve_info(str(path))
+    assert [(item.mnemonic, item.unit, item.curve_description) for item in log_curve_info_list] == [
+        ("DEPT", "M", "1  DEPTH"),
+        ("GR", "GAPI", "2  GAMMA RAY"),
+        ("ROP", "m/h", "3  RATE OF PENETRATION"),
+    ]
+    dataframe = pandas.concat(ingest.iter_file(str(path), rows=2), ignore_index=True)
+    assert dataframe.values.tolist() == [
+        ["1670.0000", "45.1200", ""],
+        ["1670.5000", "46.8000", "20.1000"],
+        ["1671.0000", "", "21.4000"],
+    ]
+
+    path.write_text(LAS_CONTENT.replace("WRAP.                   NO", "WRAP.                  YES"))
+    with pytest.raises(ValueError):
+        ingest.read_curve_info(str(path))
+
+
+@pytest.mark.unit
+def test_iter_upload_query_size_limit():
+    log_curve_info_list = ingest.read_curve_info(DEPTH_SAMPLE_PATH)
+    query_list = list(
+        ingest.iter_upload_query(
+            common.LOG_INFO_WELL_WELLBORE,
+            log_curve_info_list,
+            ingest.iter_file(DEPTH_SAMPLE_PATH, rows=100),
+            max_rows=40,
+            max_size=8000,
+        )
+    )
+    assert sum(row_count for _, row_count in query_list) == len(pandas.read_csv(DEPTH_SAMPLE_PATH).index)
+    assert all(len(query) <= 8000 and row_count <= 40 for query, row_count in query_list)
+    assert "<logCurveInfo" in query_list[0][0] and all("<logCurveInfo" not in query for query, _ in query_list[1:])
+
+    # packed close to the limit, not one row per query
+    assert sum(len(query) for query, _ in query_list[1:-1]) / (len(query_list) - 2) > 6000
+
+
+@pytest.mark.unit
+def test_ingest_file_with_emulator(tmp_path):
+    path = tmp_path / "log.csv"
+    pandas.read_csv(DEPTH_SAMPLE_PATH, dtype=str, nrows=25).to_csv(path, index=False)
+    with emulator.WitsmlStoreEmulator(max_data_nodes=10, max_request_size=6000) as store:
+        client = jeng.WitsmlClient()
+        assert client.connect(url=store.url(), username="", password="", is_raw=True)
+        assert ingest.ingest_file(client, str(path), common.LOG_INFO_WELL_WELLBORE) == 25
+        assert store.request_count > 4
+
+        dataframe = client.get_log_data(common.LOG_INFO_WELL_WELLBORE, mnemonic_list=["HKLA", "CRPM"])
+        assert len(dataframe.index) == 25
+        assert pandas.isna(dataframe["CRPM"][0]) and dataframe["CRPM"][1] == 45
+
+
+@pytest.mark.unit
+def test_ingest_file_compact(tmp_path):
+    path = tmp_path / "log.las"
+    path.write_text(LAS_CONTENT)
+    log_curve_info_list = ingest.read_curve_info(str(path))
+    query_list = list(
+        ingest.iter_upload_query(
+            common.LOG_INFO_WELL_WELLBORE,
+            log_curve_info_list,
+            ingest.iter_file(str(path), rows=2),
+            is_compact=True,
+        )
+    )
+    assert [row_count for _, row_count in query_list] == [2, 1]
+    assert (
+        "<mnemonicList>DEPT,ROP</mnemonicList><unitList>M,m/h</unitList><data>1671.0000,21.4000</data>"
+        in query_list[1][0]
+    )
+
+    with emulator.WitsmlStoreEmulator() as store:
+        client = jeng.WitsmlClient()
+        assert client.connect(url=store.url(), username="", password="", is_raw=True)
+        assert ingest.ingest_file(client, str(path), common.LOG_INFO_WELL_WELLBORE, rows=2, is_compact=True) == 3
+        dataframe = client.get_log_data(common.LOG_INFO_WELL_WELLBORE)
+        assert dataframe["GR"].tolist()[:2] == [45.12, 46.8] and pandas.isna(dataframe["GR"][2])
+        assert pandas.isna(dataframe["ROP"][0]) and dataframe["ROP"].tolist()[1:] == [20.1, 21.4]
@@ -0,0 +1,88 @@
+import common
+import pandas
+import pytest
+
+from jeng import emulator, generate, inventory, jeng, metric, model
+
+WELL_TEMPLATE = '<wells xmlns="http://www.witsml.org/schemas/1series" version="1.4.1.1">{}</wells>'
+WELLBORE_TEMPLATE = '<wellbores xmlns="http://www.witsml.org/schemas/1series" version="1.4.1.1">{}</wellbores>'
+
+
+def __add_log(client: jeng.WitsmlClient, well_uid: str, wellbore_uid: str, log_uid: str, rows: int):
+    dataframe = pandas.DataFrame(
+        {"DEPT": [str(1000 + index) for index in range(rows)], "HKLA": [str(index) for index in range(rows)]}
+    )
+    log_basic_info = model.LogBasicInfoModel(
+        well_uid=well_uid,
+        well_name=well_uid,
+        wellbore_uid=wellbore_uid,
+        wellbore_name=wellbore_uid,
+        log_uid=log_uid,
+        log_name=log_uid,
+    )
+    log_query = generate.generate_log_query(
+        log_basic_info=log_basic_info,
+        log_curve_info_list=common.LOG_CURVE_INFO_DEPTH_LIST,
+        dataframe=dataframe,
+    )
+    assert client.add_to_store(wml_type_in="log", xml_in=log_query).Result == 1
+
+
+def __add_well(client: jeng.WitsmlClient, well_uid: str, wellbore_uid_list: list):
+    well = WELL_TEMPLATE.format(f'<well uid="{well_uid}"><name>{well_uid}</name></well>')
+    assert client.add_to_store(wml_type_in="well", xml_in=well).Result == 1
+    for wellbore_uid in wellbore_uid_list:
+        wellbore = WELLBORE_TEMPLATE.format(
+            f'<wellbore uidWell="{well_uid}" uid="{wellbore_uid}"><nameWell>{well_uid}</nameWell>'
+            f"<name>{wellbore_uid}</name></wellbore>"
+        )
+        assert client.add_to_store(wml_type_in="wellbore", xml_in=wellbore).Result == 1
+
+
+def __summarize(well_list):
+    return {
+        well.uid: {
+            wellbore.uid: {log.uid: (log.start_index, log.end_index) for log in wellbore.child_list}
+            for wellbore in well.child_list
+        }
+        for well in well_list
+    }
+
+
+@pytest.mark.unit
+def test_inventory_crawl_and_refresh(tmp_path):
+    request_list = []
+    with emulator.WitsmlStoreEmulator() as store:
+        client = jeng.WitsmlClient()
+        assert client.connect(url=store.url(), username="", password="", is_raw=True)
+        __add_well(client, "W1", ["B1", "B2"])
+        __add_well(client, "W2", ["B3"])
+        __add_log(client, "W1", "B1", "L1", rows=5)
+        __add_log(client, "W2", "B3", "L2", rows=3)
+
+        crawler = inventory.InventoryCrawler(client, max_workers=4, path=str(tmp_path / "inventory.json"))
+        assert __summarize(crawler.crawl()) == {
+            "W1": {"B1": {"L1": ("1000", "1004")}, "B2": {}},
+            "W2": {"B3": {"L2": ("1000", "1002")}},
+        }
+        assert crawler.well_list()[0].name == "W1" and crawler.well_list()[0].child_list[0].object_type == "wellbore"
+
+        # only changes are fetched on refresh
+        __add_log(client, "W1", "B2", "L3", rows=2)
+        __add_well(client, "W3", ["B4"])
+        metric.add_hook(request_list.append)
+        try:
+            assert __summarize(crawler.crawl()) == {
+                "W1": {"B1": {"L1": ("1000", "1004")}, "B2": {"L3": ("1000", "1001")}},
+                "W2": {"B3": {"L2": ("1000", "1002")}},
+                "W3": {"B4": {}},
+            }
+        finally:
+            metric.remove_hook(request_list.append)
+
+        # wells, wellbores and logs of the new well, changed wellbores and changed logs
+        assert len([item for item in request_list if item.operation == "WMLS_GetFromStore"]) == 5
+
+        # cache is persisted
+        cached_crawler = inventory.InventoryCrawler(client, path=str(tmp_path / "inventory.json"))
+        assert __summarize(cached_crawler.well_list()) == __summarize(crawler.well_list())
@@ -0,0 +1,32 @@
+import json
+
+import pytest
+
+from jeng import load
+
+
+@pytest.mark.unit
+def test_parse_mix():
+    assert load.parse_mix("add=1,update=8,get=4") == {"add": 1.0, "update": 8.0, "get": 4.0}
+    with pytest.raises(ValueError):
+        load.parse_mix("delete=1")
+
+
+@pytest.mark.unit
+def test_summarize():
+    sample_list = [("update", 0.01, 10, None), ("update", 0.03, 10, None), ("get", 0.02, 0, "Result -433")]
+    summary_dict = load.summarize(sample_list, elapsed=1.0)
+    assert summary_dict["update"]["count"] == 2 and summary_dict["update"]["rows_per_second"] == 20
+    assert summary_dict["update"]["latency_max_ms"] == 30
+    assert summary_dict["get"]["error_rate"] == 1 and summary_dict["get"]["errors"] == {"Result -433": 1}
+    assert summary_dict["total"]["count"] == 3 and "add" not in summary_dict
+
+
+@pytest.mark.unit
+def test_load_with_emulator(tmp_path):
+    output = tmp_path / "load.json"
+    args = ["--emulator", "--duration", "0.5", "--workers", "2", "--curves", "5", "--output", str(output)]
+    assert load.main(args) == 0
+    summary_dict = json.loads(output.read_text())["summary"]
+    assert summary_dict["total"]["count"] > 0 and summary_dict["total"]["error_count"] == 0
+    assert summary_dict["add"]["count"] >= 2
@@ -0,0 +1,96 @@
+import common
+import pytest
+
+from jeng import emulator, generate, jeng, metric, model, parse
+
+
+@pytest.mark.unit
+def test_metric_disabled():
+    assert not metric.is_enabled()
+    assert metric.begin("parse_log_into_dataframe") is None
+
+
+@pytest.mark.unit
+def test_metric_hook():
+    metric_list = []
+    metric.add_hook(metric_list.append)
+    try:
+        with open(f"{common.QUERY_PATH}/log_reply_data.xml", "r") as reply:
+            parse.parse_log_into_dataframe(xml_out=reply.read())
+        generate.generate_log_query(
+            log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+            log_curve_info_list=common.LOG_CURVE_INFO_TIME_LIST,
+        )
+    finally:
+        metric.remove_hook(metric_list.append)
+    assert not metric.is_enabled()
+
+    operation_metric: model.OperationMetricModel = metric_list[0]
+    assert operation_metric.operation == "parse_log_into_dataframe"
+    assert operation_metric.row_count == 10 and operation_metric.curve_count == 3
+    assert operation_metric.total_time >= 0 and operation_metric.error is None
+    assert metric_list[1].operation == "generate_log_query" and metric_list[1].row_count == 0
+
+
+@pytest.mark.unit
+def test_metric_network_split():
+    def hook(operation_metric):
+        raise RuntimeError("broken hook")
+
+    metric.add_hook(hook)
+    try:
+        operation_metric = metric.begin("WMLS_GetFromStore", is_network=True)
+        assert metric.current() is operation_metric
+        metric.begin_network(operation_metric, 100)
+        metric.end_network(operation_metric, 1000)
+        with pytest.warns(UserWarning, match="broken hook"):
+            metric.end(operation_metric)
+    finally:
+        metric.remove_hook(hook)
+    assert metric.current() is None
+    assert operation_metric.byte_out == 100 and operation_metric.byte_in == 1000
+    assert operation_metric.serialize_time + operation_metric.network_time + operation_metric.deserialize_time == (
+        pytest.approx(operation_metric.total_time)
+    )
+
+
+@pytest.mark.unit
+def test_metric_retry_count(monkeypatch):
+    import requests
+
+    metric_list = []
+    with emulator.WitsmlStoreEmulator() as store:
+        # certificate verification fails, connect retries without it
+        post = requests.Session.post
+
+        def post_with_ssl_error(session, *args, **kwargs):
+            if session.verify is not False:
+                raise requests.exceptions.SSLError("certificate verify failed")
+            return post(session, *args, **kwargs)
+
+        monkeypatch.setattr(requests.Session, "post", post_with_ssl_error)
+        client = jeng.WitsmlClient()
+        metric.add_hook(metric_list.append)
+        try:
+            assert client.connect(url=store.url(), username="", password="", is_raw=True)
+            connect_metric_list = list(metric_list)
+            dataframe = common.__prepare_depth_dataframe(rows=10)
+            log_query = generate.generate_log_query(
+                log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+                log_curve_info_list=common.LOG_CURVE_INFO_DEPTH_LIST,
+                dataframe=dataframe,
+            )
+            assert client.add_to_store(wml_type_in="log", xml_in=log_query).Result == 1
+
+            # truncated replies are followed up 2 times
+            store.max_data_nodes = 4
+            metric_list.clear()
+            assert len(client.get_log_data(common.LOG_INFO_WELL_WELLBORE).index) == 10
+        finally:
+            metric.remove_hook(metric_list.append)
+
+    assert [(item.operation, item.error, item.retry_count) for item in connect_metric_list[:2]] == [
+        ("WMLS_GetBaseMsg", "SSLError", 0),
+        ("WMLS_GetBaseMsg", None, 1),
+    ]
+    assert [item.retry_count for item in metric_list if item.operation == "WMLS_GetFromStore"] == [0, 0, 1, 2]
@@ -2,7 +2,7 @@ import common
 import pandas
 import pytest
 
-from jeng import exception, generate, parse
+from jeng import exception, generate, model, parse
 
 EXPECTED_ROW_COUNT = 10
 EXPECTED_COLUMN_COUNT = 3
@@ -173,3 +173,136 @@ def test_parse_log_curve_info_no_index_type():
                 index_curve = log_curve_info.mnemonic
                 break
         assert index_curve is None and index_type is None
+
+
+@pytest.mark.unit
+def test_parse_capabilities():
+    with open(f"{common.QUERY_PATH}/cap_reply.xml", "r") as reply:
+        capabilities = parse.parse_capabilities(capabilities_out=reply.read())
+        assert capabilities.vendor == "Jeng" and capabilities.schema_version_list == ["1.3.1.1", "1.4.1.1"]
+        assert capabilities.max_request_latest_values == 1000 and capabilities.max_request_size is None
+        assert capabilities.growing_timeout_period_dict == {"log": 86400}
+        assert capabilities.compression_method == "gzip" and capabilities.is_cascaded_delete
+        assert not capabilities.is_support_uom_conversion
+
+        # supported function and data-object
+        assert capabilities.is_supported("WMLS_GetVersion")
+        assert capabilities.is_supported("WMLS_GetFromStore", "well")
+        assert not capabilities.is_supported("WMLS_DeleteFromStore")
+        assert not capabilities.is_supported("WMLS_AddToStore", "well")
+
+        # maximum rows limited by maxDataNodes or maxDataPoints
+        assert capabilities.get_max_rows("WMLS_GetFromStore", "log", 5) == 5000
+        assert capabilities.get_max_rows("WMLS_GetFromStore", "log", 20) == 2500
+        assert capabilities.get_max_rows("WMLS_AddToStore", "log", 20) == 2000
+        assert capabilities.get_max_rows("WMLS_GetFromStore", "well", 20) is None
+
+
+@pytest.mark.unit
+def test_parse_capabilities_empty():
+    for capabilities_out in ['<capServers version="1.4.1"/>', '<capServers version="1.4.1"><capServer/></capServers>']:
+        capabilities = parse.parse_capabilities(capabilities_out=capabilities_out)
+        assert capabilities.vendor is None and not capabilities.is_supported("WMLS_GetFromStore", "log")
+        assert capabilities.get_max_rows("WMLS_GetFromStore", "log", 5) is None
+
+
+@pytest.mark.unit
+def test_parse_reply_low_memory():
+    with open(f"{common.QUERY_PATH}/log_reply_data.xml", "r") as reply:
+        xml_out = reply.read()
+    dataframe = parse.parse_log_into_dataframe(xml_out=xml_out)
+    compact = parse.parse_log_into_dataframe(xml_out=xml_out, is_low_memory=True)
+    assert compact["TIME"].tolist() == dataframe["TIME"].tolist()
+    assert str(compact["HKLA"].dtype) == "float32"
+    assert compact["HKLA"].tolist() == pytest.approx(dataframe["HKLA"].astype(float).tolist(), rel=1e-6)
+    memory_dict = compact.attrs["memory_dict"]
+    assert memory_dict["saved"] == memory_dict["before"] - memory_dict["after"] > 0
+
+    # log nullValue becomes missing value
+    xml_out = xml_out.replace(",198.86137<", ",-999.25<").replace(",196.16626<", ",-999.2500<")
+    compact = parse.parse_log_into_dataframe(xml_out=xml_out, is_low_memory=True, null_value_list=["-999.25"])
+    assert compact["HKLA"].isna().tolist() == [True, True] + [False] * 8
+    assert str(compact["HKLA"].dtype) == "float32"
+
+
+@pytest.mark.unit
+def test_compact_log_dataframe():
+    dataframe = pandas.read_csv(
+        f"{common.SAMPLE_PATH}/{common.DEPTH_BASED_SAMPLE_FILENAME}.csv", dtype=str, keep_default_na=False
+    )
+    dataframe = dataframe.drop(columns="Unnamed: 30")
+    dataframe["LITHOLOGY"] = ["SAND", "SHALE"] * (len(dataframe.index) // 2) + ["SAND"] * (len(dataframe.index) % 2)
+    dataframe["GAS"] = dataframe["SHKL"].where(dataframe.index % 20 == 0, "-999.25")
+    compact = parse.compact_log_dataframe(dataframe, null_value_list=["-999.25"])
+
+    # index kept exact, mostly null curves sparse, strings categorical
+    assert str(compact["DEPT"].dtype) == "float64"
+    assert compact["DEPT"].tolist() == dataframe["DEPT"].astype(float).tolist()
+    assert isinstance(compact["GAS"].dtype, pandas.SparseDtype) and str(compact["SHKL"].dtype) == "float32"
+    assert str(compact["LITHOLOGY"].dtype) == "category"
+    assert compact["CRPM"].isna()[0] and compact["CRPM"][1] == 45
+    assert compact.attrs["memory_dict"]["after"] * 5 < compact.attrs["memory_dict"]["before"]
+
+    # values that don't fit float32 within rtol stay float64
+    dataframe = pandas.DataFrame({"DEPT": ["1", "2"], "ETIM": ["1700000000.123", "1700000001.456"]})
+    assert str(parse.compact_log_dataframe(dataframe)["ETIM"].dtype) == "float32"
+    assert str(parse.compact_log_dataframe(dataframe, rtol=1e-12)["ETIM"].dtype) == "float64"
+
+
+@pytest.mark.unit
+def test_parse_trajectory_and_mud_log_into_dataframe():
+    trajectory_basic_info = model.TrajectoryBasicInfoModel(
+        well_uid="WELL_001",
+        well_name="WELL 001",
+        wellbore_uid="WELLBORE_001",
+        wellbore_name="WELLBORE 001",
+        trajectory_uid="TRAJECTORY_001",
+        trajectory_name="TRAJECTORY 001",
+    )
+    dataframe = pandas.DataFrame(
+        {
+            "dTimStn": pandas.date_range("2024-01-01", periods=1000, freq="min", tz="UTC"),
+            "typeTrajStation": "magnetic MWD",
+            "md": [index * 10.0 for index in range(1000)],
+            "incl": [index / 100 for index in range(1000)],
+        }
+    )
+    query = generate.generate_trajectory_query(trajectory_basic_info, dataframe)
+    # nested elements are not parsed
+    query = query.replace(
+        "</trajectoryStation>",
+        "<corUsed><gravAxialAccelCor uom='m/s2'>1</gravAxialAccelCor></corUsed></trajectoryStation>",
+        1,
+    )
+    reply_dataframe = parse.parse_trajectory_into_dataframe(query)
+    assert list(reply_dataframe.columns) == ["uid", "dTimStn", "typeTrajStation", "md", "incl"]
+    assert reply_dataframe["uid"].tolist() == [str(index) for index in range(1000)]
+    assert reply_dataframe["md"].tolist() == dataframe["md"].tolist()
+    assert reply_dataframe["dTimStn"].tolist() == dataframe["dTimStn"].tolist()
+    assert reply_dataframe.attrs["unit_dict"] == {"md": "m", "incl": "dega"}
+
+    mud_log_basic_info = model.MudLogBasicInfoModel(
+        well_uid="WELL_001",
+        well_name="WELL 001",
+        wellbore_uid="WELLBORE_001",
+        wellbore_name="WELLBORE 001",
+        mud_log_uid="MUDLOG_001",
+        mud_log_name="MUDLOG 001",
+    )
+    dataframe = pandas.DataFrame(
+        {
+            "uid": ["GI1", "GI2"],
+            "typeLithology": ["interpreted", "cuttings"],
+            "mdTop": [1000.0, 1010.0],
+            "mdBottom": [1010.0, 1020.0],
+            "description": ["sand & shale", None],
+        }
+    )
+    query = generate.generate_mud_log_query(mud_log_basic_info, dataframe, unit_dict={"mdTop": "ft", "mdBottom": "ft"})
+    reply_dataframe = parse.parse_mud_log_into_dataframe(query.encode())
+    assert reply_dataframe["mdBottom"].tolist() == [1010.0, 1020.0]
+    assert reply_dataframe["description"][0] == "sand & shale" and pandas.isna(reply_dataframe["description"][1])
+    assert reply_dataframe.attrs["unit_dict"] == {"mdTop": "ft", "mdBottom": "ft"}
+
+    # units and values round trip
+    assert generate.generate_mud_log_query(mud_log_basic_info, reply_dataframe) == query
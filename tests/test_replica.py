@@ -0,0 +1,149 @@
+import common
+import pandas
+import pytest
+
+from jeng import emulator, generate, jeng, metric, model, replica
+
+
+def __add_log_data(client: jeng.WitsmlClient, dataframe: pandas.DataFrame, is_create: bool = False):
+    # emulator rejects more rows than maxDataNodes per request
+    for start in range(0, len(dataframe), 3):
+        log_query = generate.generate_log_query(
+            log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+            log_curve_info_list=common.LOG_CURVE_INFO_DEPTH_LIST,
+            dataframe=dataframe[start : start + 3],
+            is_include_log_curve_info=is_create and start == 0,
+        )
+        if is_create and start == 0:
+            assert client.add_to_store(wml_type_in="log", xml_in=log_query).Result == 1
+        else:
+            assert client.update_in_store(wml_type_in="log", xml_in=log_query).Result == 1
+
+
+def __depth_index(dataframe: pandas.DataFrame, start: int, end: int) -> model.LogIndexModel:
+    return model.LogIndexModel(
+        start=dataframe["DEPT"][start],
+        end=dataframe["DEPT"][end],
+        type=model.LogIndexTypeEnum.NON_TIME,
+    )
+
+
+@pytest.mark.unit
+def test_replica_get_log_fetch_missing_range(tmp_path):
+    request_list = []
+    metric.add_hook(request_list.append)
+    try:
+        with emulator.WitsmlStoreEmulator(max_data_nodes=3) as store:
+            client = common.__connect_emulator(store)
+            dataframe = common.__prepare_depth_dataframe(rows=12).astype(str)
+            __add_log_data(client, dataframe[:10], is_create=True)
+
+            with replica.LogReplica(client, path=str(tmp_path / "replica.db")) as log_replica:
+                request_list.clear()
+                reply_dataframe = log_replica.get_log(
+                    common.LOG_INFO_WELL_WELLBORE, common.LOG_CURVE_INFO_DEPTH_LIST, __depth_index(dataframe, 2, 5)
+                )
+                assert reply_dataframe.equals(dataframe[2:6].reset_index(drop=True))
+                assert len([item for item in request_list if item.operation == "WMLS_GetFromStore"]) == 2
+
+                # held range is served from the replica
+                request_list.clear()
+                reply_dataframe = log_replica.get_log(
+                    common.LOG_INFO_WELL_WELLBORE, common.LOG_CURVE_INFO_DEPTH_LIST, __depth_index(dataframe, 3, 4)
+                )
+                assert reply_dataframe.equals(dataframe[3:5].reset_index(drop=True))
+                assert not [item for item in request_list if item.operation == "WMLS_GetFromStore"]
+
+                # only missing sub-ranges on both sides are fetched
+                request_list.clear()
+                reply_dataframe = log_replica.get_log(
+                    common.LOG_INFO_WELL_WELLBORE, common.LOG_CURVE_INFO_DEPTH_LIST, __depth_index(dataframe, 0, 7)
+                )
+                assert reply_dataframe.equals(dataframe[0:8].reset_index(drop=True))
+                assert len([item for item in request_list if item.operation == "WMLS_GetFromStore"]) == 2
+                held_range_list = log_replica.held_range_list(common.LOG_INFO_WELL_WELLBORE, "HKLA")
+                assert [(item.start, item.end) for item in held_range_list] == [
+                    (dataframe["DEPT"][0], dataframe["DEPT"][7])
+                ]
+
+                # incremental sync of a growing log
+                assert (
+                    log_replica.sync_log(
+                        common.LOG_INFO_WELL_WELLBORE,
+                        common.LOG_CURVE_INFO_DEPTH_LIST,
+                        index_type=model.LogIndexTypeEnum.NON_TIME,
+                    )
+                    == 2
+                )
+                __add_log_data(client, dataframe[10:])
+                assert (
+                    log_replica.sync_log(
+                        common.LOG_INFO_WELL_WELLBORE,
+                        common.LOG_CURVE_INFO_DEPTH_LIST,
+                        index_type=model.LogIndexTypeEnum.NON_TIME,
+                    )
+                    == 2
+                )
+
+            # replica persists in the database file
+            with replica.LogReplica(client, path=str(tmp_path / "replica.db")) as log_replica:
+                request_list.clear()
+                reply_dataframe = log_replica.get_log(
+                    common.LOG_INFO_WELL_WELLBORE, common.LOG_CURVE_INFO_DEPTH_LIST, __depth_index(dataframe, 0, 11)
+                )
+                assert reply_dataframe.equals(dataframe.reset_index(drop=True))
+                assert not [item for item in request_list if item.operation == "WMLS_GetFromStore"]
+    finally:
+        metric.remove_hook(request_list.append)
+
+
+@pytest.mark.unit
+def test_replica_get_log_fetch_missing_curve(monkeypatch):
+    log_curve_info_list = common.LOG_CURVE_INFO_DEPTH_LIST + [
+        model.LogCurveInfoModel(
+            uid="GR", mnemonic="GR", unit="gAPI", curve_description="Gamma Ray", type_log_data="double"
+        )
+    ]
+    with emulator.WitsmlStoreEmulator() as store:
+        client = common.__connect_emulator(store)
+        dataframe = common.__prepare_depth_dataframe(rows=8, mnemonic_list=["DEPT", "HKLA", "GR"]).astype(str)
+        log_query = generate.generate_log_query(
+            log_basic_info=common.LOG_INFO_WELL_WELLBORE,
+            log_curve_info_list=log_curve_info_list,
+            dataframe=dataframe,
+        )
+        assert client.add_to_store(wml_type_in="log", xml_in=log_query).Result == 1
+
+        query_list = []
+        get_from_store = client.get_from_store
+
+        def spy(**kwargs):
+            query_list.append(kwargs["xml_in"])
+            return get_from_store(**kwargs)
+
+        monkeypatch.setattr(client, "get_from_store", spy)
+        with replica.LogReplica(client) as log_replica:
+            log_replica.get_log(
+                common.LOG_INFO_WELL_WELLBORE, common.LOG_CURVE_INFO_DEPTH_LIST, __depth_index(dataframe, 0, 5)
+            )
+
+            # HKLA held on 0-5 isn't fetched again with GR
+            query_list.clear()
+            reply_dataframe = log_replica.get_log(
+                common.LOG_INFO_WELL_WELLBORE, log_curve_info_list, __depth_index(dataframe, 0, 7)
+            )
+            assert reply_dataframe.equals(dataframe)
+            assert len(query_list) == 2
+            assert "HKLA" not in query_list[0] and "GR" in query_list[0]
+            assert "HKLA" in query_list[1] and "GR" in query_list[1]
+
+
+@pytest.mark.unit
+def test_replica_open_ended_range():
+    with replica.LogReplica(client=None) as log_replica:
+        with pytest.raises(ValueError):
+            log_replica.get_log(
+                common.LOG_INFO_WELL_WELLBORE,
+                common.LOG_CURVE_INFO_DEPTH_LIST,
+                model.LogIndexModel(start="2575", end=None, type=model.LogIndexTypeEnum.NON_TIME),
+            )
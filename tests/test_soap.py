@@ -0,0 +1,121 @@
+import mmap
+
+import common
+import pytest
+from lxml import etree
+from zeep import Client, xsd
+
+from jeng import exception, parse, soap
+
+
+@pytest.mark.unit
+def test_build_envelope_same_as_zeep():
+    client = Client(wsdl="src/jeng/xml/WMLS.WSDL")
+    service = client.create_service("{http://www.witsml.org/wsdl/120}StoreSoapBinding", "http://localhost")
+    zeep_envelope = client.create_message(
+        service,
+        "WMLS_GetFromStore",
+        WMLtypeIn="log",
+        QueryIn="<logs><log uid='LOG & 001'/></logs>",
+        OptionsIn="returnElements=all",
+        CapabilitiesIn=xsd.SkipValue,
+    )
+    raw_envelope = soap.build_envelope(
+        "WMLS_GetFromStore",
+        WMLtypeIn="log",
+        QueryIn="<logs><log uid='LOG & 001'/></logs>",
+        OptionsIn="returnElements=all",
+        CapabilitiesIn="",
+    )
+    zeep_root = etree.fromstring(etree.tostring(zeep_envelope))
+    raw_root = etree.fromstring(raw_envelope)
+    assert zeep_root.findtext(".//QueryIn") == raw_root.findtext(".//QueryIn")
+    assert zeep_root.findtext(".//OptionsIn") == raw_root.findtext(".//OptionsIn")
+    assert zeep_root[0][0].tag == raw_root[0][0].tag
+
+
+@pytest.mark.unit
+def test_parse_reply():
+    with open(f"{common.QUERY_PATH}/soap_reply_get_from_store.xml", "rb") as reply:
+        content = reply.read()
+    with open(f"{common.QUERY_PATH}/log_reply_data.xml", "r") as reply:
+        xml_out = reply.read()
+
+    reply = soap.parse_reply(content)
+    assert reply.Result == 1 and reply["Result"] == 1
+    assert reply.XMLout == xml_out
+    assert reply.SuppMsgOut == "Function completed successfully & reply\r"
+    assert parse.parse_log_into_dataframe(xml_out=reply["XMLout"]).shape == (10, 3)
+
+    # bytes and memoryview
+    assert soap.parse_reply(content, soap.XML_OUT_TYPE_BYTES).XMLout == xml_out.encode()
+    reply = soap.parse_reply(content, soap.XML_OUT_TYPE_MEMORYVIEW)
+    assert isinstance(reply.XMLout, memoryview) and reply.XMLout.tobytes() == xml_out.encode()
+    assert parse.parse_log_into_dataframe(xml_out=reply.XMLout).shape == (10, 3)
+
+
+@pytest.mark.unit
+def test_parse_reply_zero_copy_and_empty():
+    content = b"<Envelope><Body><Result>1</Result><XMLout><![CDATA[<logs/>]]></XMLout><SuppMsgOut/></Body></Envelope>"
+    reply = soap.parse_reply(content, soap.XML_OUT_TYPE_MEMORYVIEW)
+    assert reply.XMLout.obj is content and reply.XMLout.tobytes() == b"<logs/>"
+    assert reply.SuppMsgOut == "" and reply.CapabilitiesOut is None
+
+
+@pytest.mark.unit
+def test_parse_reply_fault():
+    with open(f"{common.QUERY_PATH}/soap_reply_fault.xml", "rb") as reply:
+        with pytest.raises(exception.JengSoapFaultException, match="Access denied & logged"):
+            soap.parse_reply(reply.read())
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("chunk_size", [7, 1 << 20])
+def test_parse_reply_spooled(chunk_size):
+    with open(f"{common.QUERY_PATH}/soap_reply_get_from_store.xml", "rb") as reply:
+        content = mmap.mmap(reply.fileno(), 0, access=mmap.ACCESS_READ)
+    with open(f"{common.QUERY_PATH}/log_reply_data.xml", "r") as reply:
+        xml_out = reply.read().encode()
+
+    reply = soap.parse_reply(content, soap.XML_OUT_TYPE_FILE)
+    assert reply.Result == 1 and reply.SuppMsgOut == "Function completed successfully & reply\r"
+    assert isinstance(reply.XMLout, soap.SpooledPart)
+    assert b"".join(reply.XMLout.iter_chunk(chunk_size=chunk_size)) == xml_out
+    assert parse.parse_log_into_dataframe(xml_out=reply.XMLout).equals(parse.parse_log_into_dataframe(xml_out=xml_out))
+    reply.XMLout.close()
+
+
+@pytest.mark.unit
+def test_parse_reply_spooled_no_data():
+    content = (
+        b"<Envelope><Body><Result>1</Result><XMLout>&lt;logs&gt;&lt;log/&gt;&lt;/logs&gt;</XMLout></Body></Envelope>"
+    )
+    reply = soap.parse_reply(content, soap.XML_OUT_TYPE_FILE)
+    assert reply.XMLout.read() == b"<logs><log/></logs>"
+    with pytest.raises(exception.JengReplyContainsNoDataAndMnemonicException):
+        parse.parse_log_into_dataframe(xml_out=reply.XMLout)
+
+
+@pytest.mark.unit
+def test_parse_reply_spooled_bounded_buffer(monkeypatch):
+    import pandas
+
+    with open(f"{common.QUERY_PATH}/soap_reply_get_from_store.xml", "rb") as reply:
+        content = mmap.mmap(reply.fileno(), 0, access=mmap.ACCESS_READ)
+    reply = soap.parse_reply(content, soap.XML_OUT_TYPE_FILE)
+    expected = parse.parse_log_into_dataframe(xml_out=reply.XMLout)
+
+    # data rows are parsed every 3 rows, the text buffer never holds the whole reply
+    buffer_row_list = []
+    read_csv = pandas.read_csv
+
+    def read_csv_spy(buffer, *args, **kwargs):
+        buffer_row_list.append(buffer.getvalue().count("\n"))
+        return read_csv(buffer, *args, **kwargs)
+
+    monkeypatch.setattr(parse, "STREAM_CHUNK_ROWS", 3)
+    monkeypatch.setattr(pandas, "read_csv", read_csv_spy)
+    dataframe = parse.parse_log_into_dataframe(xml_out=reply.XMLout)
+    reply.XMLout.close()
+    assert buffer_row_list == [3, 3, 3, 1]
+    assert dataframe.equals(expected)
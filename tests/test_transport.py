@@ -0,0 +1,22 @@
+import gzip
+import zlib
+
+import pytest
+
+from jeng import transport
+
+
+@pytest.mark.unit
+def test_compress():
+    body = b"<logs>" + b"<data>2575.1028,2060.32504,46.87732</data>" * 100 + b"</logs>"
+    assert gzip.decompress(transport.compress(body, transport.COMPRESSION_GZIP)) == body
+    assert zlib.decompress(transport.compress(body, transport.COMPRESSION_DEFLATE)) == body
+
+
+@pytest.mark.unit
+def test_compress_headers():
+    body = b"<logs/>" * 100
+    headers = {}
+    assert transport.compress_headers(body, headers) == body and headers == {}
+    compressed = transport.compress_headers(body, headers, transport.COMPRESSION_GZIP)
+    assert headers["Content-Encoding"] == "gzip" and len(compressed) < len(body)
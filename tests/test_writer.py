@@ -0,0 +1,149 @@
+import threading
+import time
+import typing
+
+import common
+import pytest
+
+from jeng import emulator, exception, jeng, metric, model, writer
+
+
+class BlockingClient(jeng.WitsmlClient):
+    "A WITSML client whose requests wait until released."
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def get_from_store(self, *args, **kwargs):
+        self.release.wait(10)
+        return super().get_from_store(*args, **kwargs)
+
+
+def __wait_until(condition: typing.Callable[[], bool], timeout: float = 10.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.mark.unit
+def test_writer_merge_rows_from_threads():
+    dataframe = common.__prepare_depth_dataframe(rows=60)
+    request_list = []
+    metric.add_hook(request_list.append)
+    try:
+        with emulator.WitsmlStoreEmulator() as store:
+            client = common.__connect_emulator(store)
+            with writer.LogWriter(client, max_rows=1000, max_latency=60) as log_writer:
+
+                def produce(start: int):
+                    for position in range(start, len(dataframe.index), 3):
+                        log_writer.add(
+                            common.LOG_INFO_WELL_WELLBORE,
+                            common.LOG_CURVE_INFO_DEPTH_LIST,
+                            dataframe[position : position + 1],
+                        )
+
+                thread_list = [threading.Thread(target=produce, args=(start,)) for start in range(3)]
+                for thread in thread_list:
+                    thread.start()
+                for thread in thread_list:
+                    thread.join()
+                request_list.clear()
+                log_writer.flush()
+                assert log_writer.buffered_rows() == 0
+
+            # 60 rows of 60 adds are written with a single request
+            assert [item.operation for item in request_list if item.operation.startswith("WMLS_")] == [
+                "WMLS_GetFromStore",
+                "WMLS_AddToStore",
+            ]
+            reply_dataframe = client.get_log_data(common.LOG_INFO_WELL_WELLBORE)
+            assert reply_dataframe["DEPT"].tolist() == dataframe["DEPT"].tolist()
+    finally:
+        metric.remove_hook(request_list.append)
+
+
+@pytest.mark.unit
+def test_writer_flush_by_rows_and_latency():
+    dataframe = common.__prepare_depth_dataframe(rows=10)
+    with emulator.WitsmlStoreEmulator(max_data_nodes=3) as store:
+        client = common.__connect_emulator(store)
+        with writer.LogWriter(client, max_rows=4, max_latency=0.2) as log_writer:
+            # create the log, then rows are written by row count
+            log_writer.add(common.LOG_INFO_WELL_WELLBORE, common.LOG_CURVE_INFO_DEPTH_LIST, dataframe[:4])
+            assert __wait_until(lambda: log_writer.buffered_rows() == 0)
+
+            # and by latency, never before max_latency
+            begin = time.monotonic()
+            log_writer.add(common.LOG_INFO_WELL_WELLBORE, common.LOG_CURVE_INFO_DEPTH_LIST, dataframe[4:5])
+            assert __wait_until(lambda: log_writer.buffered_rows() == 0)
+            assert time.monotonic() - begin >= 0.2
+        assert len(client.get_log_data(common.LOG_INFO_WELL_WELLBORE).index) == 5
+
+
+@pytest.mark.unit
+def test_writer_back_pressure_and_error():
+    dataframe = common.__prepare_depth_dataframe(rows=10)
+    with emulator.WitsmlStoreEmulator() as store:
+        # rows can't be written until the client is released
+        client = BlockingClient()
+        assert client.connect(url=store.url(), username="", password="", is_raw=True)
+        log_writer = writer.LogWriter(client, max_rows=1, max_buffered_rows=2)
+        log_writer.add(common.LOG_INFO_WELL_WELLBORE, common.LOG_CURVE_INFO_DEPTH_LIST, dataframe[:2])
+        with pytest.raises(exception.JengWriterBufferFullException):
+            log_writer.add(common.LOG_INFO_WELL_WELLBORE, common.LOG_CURVE_INFO_DEPTH_LIST, dataframe[2:3], timeout=0.1)
+        client.release.set()
+        log_writer.add(common.LOG_INFO_WELL_WELLBORE, common.LOG_CURVE_INFO_DEPTH_LIST, dataframe[2:3], timeout=10)
+        log_writer.flush()
+        assert log_writer.buffered_rows() == 0
+        log_writer.close()
+
+    with emulator.WitsmlStoreEmulator(max_request_size=200) as store:
+        log_writer = writer.LogWriter(common.__connect_emulator(store))
+        log_writer.add(common.LOG_INFO_WELL_WELLBORE, common.LOG_CURVE_INFO_DEPTH_LIST, dataframe[:2])
+        with pytest.raises(exception.JengReplyErrorException):
+            log_writer.flush()
+        log_writer.close()
+
+
+@pytest.mark.unit
+def test_writer_flush_with_concurrent_producer():
+    dataframe = common.__prepare_depth_dataframe(rows=10)
+    log_info_other = model.LogBasicInfoModel(
+        well_uid="WELL_001",
+        well_name="WELL 001",
+        wellbore_uid="WELLBORE_001",
+        wellbore_name="WELLBORE 001",
+        log_uid="LOG_002",
+        log_name="LOG 002",
+    )
+    # slow requests, rows of the other log are always buffered
+    with emulator.WitsmlStoreEmulator(latency=0.05) as store:
+        client = common.__connect_emulator(store)
+        with writer.LogWriter(client, max_rows=1000, max_latency=60) as log_writer:
+            log_writer.add(common.LOG_INFO_WELL_WELLBORE, common.LOG_CURVE_INFO_DEPTH_LIST, dataframe[:5])
+            is_stopped = threading.Event()
+
+            # another log keeps getting rows while flushing
+            def produce():
+                for _ in range(100000):
+                    if is_stopped.is_set():
+                        return
+                    log_writer.add(log_info_other, common.LOG_CURVE_INFO_DEPTH_LIST, dataframe[5:6])
+                    time.sleep(0.001)
+
+            producer = threading.Thread(target=produce)
+            producer.start()
+            assert __wait_until(lambda: log_writer.buffered_rows() > 5)
+            flusher = threading.Thread(target=log_writer.flush)
+            flusher.start()
+            flusher.join(10)
+            is_flushed = not flusher.is_alive()
+            is_stopped.set()
+            producer.join()
+            assert is_flushed
+        assert len(client.get_log_data(common.LOG_INFO_WELL_WELLBORE).index) == 5